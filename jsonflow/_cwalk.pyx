@@ -0,0 +1,111 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+键结构遍历的C扩展
+
+jsonflow.cli中_walk的Cython实现，安装前安装了Cython时由setup.py编译。isinstance判断由Cython编译为C级类型检查，
+字典遍历仍使用.items()，类型位掩码未变化时不写回sink，路径字符串与纯Python实现共用同一个缓存。
+cdef函数声明except *，遍历中抛出的异常（如键的str()失败）会向上传播。未编译时jsonflow.cli使用纯Python实现。
+"""
+
+from sys import intern
+
+# 必须与jsonflow.cli.TYPE_BITS一致
+cdef enum:
+    NULL_BIT = 1
+    BOOLEAN_BIT = 1 << 1
+    INTEGER_BIT = 1 << 2
+    NUMBER_BIT = 1 << 3
+    STRING_BIT = 1 << 4
+    ARRAY_BIT = 1 << 5
+    OBJECT_BIT = 1 << 6
+
+cdef inline long _type_bit(object value):
+    if value is None:
+        return NULL_BIT
+    if isinstance(value, bool):
+        return BOOLEAN_BIT
+    if isinstance(value, int):
+        return INTEGER_BIT
+    if isinstance(value, float):
+        return NUMBER_BIT
+    if isinstance(value, str):
+        return STRING_BIT
+    if isinstance(value, list):
+        return ARRAY_BIT
+    if isinstance(value, dict):
+        return OBJECT_BIT
+    return 0
+
+
+cdef inline void _mark(dict sink, str path, long bit) except *:
+    cdef object old = sink.get(path)
+    if old is None:
+        sink[path] = bit
+    elif (<long>old) | bit != <long>old:
+        sink[path] = (<long>old) | bit
+
+
+cdef void _walk_dict(dict json_data, str prefix, dict sink, Py_ssize_t sample_size,
+                     dict path_cache, dict item_path_cache) except *:
+    cdef dict paths = path_cache.get(prefix)
+    cdef object key
+    cdef object value
+    cdef object item
+    cdef str current_path
+    cdef str item_path
+    cdef list items
+    cdef long bit
+    cdef long item_bit
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n
+
+    if paths is None:
+        paths = {}
+        path_cache[prefix] = paths
+    for key, value in json_data.items():
+        current_path = paths.get(key)
+        if current_path is None:
+            if prefix:
+                current_path = intern(prefix + "." + (key if isinstance(key, str) else str(key)))
+            else:
+                current_path = intern(key if isinstance(key, str) else str(key))
+            paths[key] = current_path
+        bit = _type_bit(value)
+        _mark(sink, current_path, bit)
+
+        if bit == OBJECT_BIT:
+            _walk_dict(<dict>value, current_path, sink, sample_size, path_cache, item_path_cache)
+        elif bit == ARRAY_BIT:
+            items = <list>value
+            item_path = item_path_cache.get(current_path)
+            if item_path is None:
+                item_path = intern(current_path + "[*]")
+                item_path_cache[current_path] = item_path
+            n = min(len(items), sample_size)
+            for i in range(n):
+                item = items[i]
+                item_bit = _type_bit(item)
+                _mark(sink, item_path, item_bit)
+                if item_bit == OBJECT_BIT:
+                    _walk_dict(<dict>item, item_path, sink, sample_size, path_cache, item_path_cache)
+
+
+def walk(object json_data, str prefix, object sink, Py_ssize_t sample_size,
+         dict path_cache, dict item_path_cache):
+    """
+    递归遍历JSON对象，把键路径的类型位直接合并到sink中
+
+    Args:
+        json_data (dict): JSON对象
+        prefix (str): 路径前缀
+        sink (dict): 键路径到类型位掩码的映射（可以是defaultdict），原地更新
+        sample_size (int): 数组中用于推断元素结构的最大元素数
+        path_cache (dict): 路径前缀到{键: 路径}的缓存，原地更新
+        item_path_cache (dict): 数组路径到元素路径的缓存，原地更新
+
+    Raises:
+        TypeError: 如果json_data或sink不是dict
+    """
+    if not isinstance(json_data, dict) or not isinstance(sink, dict):
+        raise TypeError("json_data and sink must be dicts")
+    _walk_dict(<dict>json_data, prefix, <dict>sink, sample_size, path_cache, item_path_cache)
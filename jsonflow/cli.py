@@ -0,0 +1,465 @@
+"""
+JSONFlow命令行工具
+
+提供jsonflow命令，目前支持analyze子命令，用于统计JSONL文件中出现的全部键路径及其值类型。
+
+示例:
+    jsonflow analyze data.jsonl
+    jsonflow analyze data.jsonl --pipeline
+    jsonflow analyze data.jsonl --jobs 8
+"""
+
+import os
+import sys
+import mmap
+import argparse
+import concurrent.futures
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from jsonflow.io import JsonLoader
+
+# 安装Cython时setup.py会编译遍历函数的C扩展，未编译时使用纯Python实现
+try:
+    from jsonflow._cwalk import walk as _cwalk
+except ImportError:
+    _cwalk = None
+
+# 数组中用于推断元素结构的最大元素数
+ARRAY_SAMPLE_SIZE = 10
+
+# 并行分析时每个分片的最小字节数，文件较小时减少进程数
+_MIN_SHARD_SIZE = 1 << 20
+
+# 路径前缀到{键: 路径}的缓存，每个不同的路径字符串只创建一次
+_path_cache: Dict[str, Dict[Any, str]] = {}
+
+# 数组路径到其元素路径"数组路径[*]"的缓存
+_item_path_cache: Dict[str, str] = {}
+
+# 类型名称到位掩码的映射，前七个为JSON类型名称，其余为JsonStructureExtractor使用的Python类型名称
+TYPE_BITS = {
+    "null": 1,
+    "boolean": 1 << 1,
+    "integer": 1 << 2,
+    "number": 1 << 3,
+    "string": 1 << 4,
+    "array": 1 << 5,
+    "object": 1 << 6,
+    "NoneType": 1 << 7,
+    "bool": 1 << 8,
+    "int": 1 << 9,
+    "float": 1 << 10,
+    "str": 1 << 11,
+}
+
+# 按名称排序的(位, 类型名称)列表，用于把位掩码还原为类型名称
+BITS_TO_NAMES = sorted(((bit, name) for name, bit in TYPE_BITS.items()), key=lambda item: item[1])
+
+_OBJECT_BIT = TYPE_BITS["object"]
+_ARRAY_BIT = TYPE_BITS["array"]
+
+# JSON值类型到类型位的映射，通过type()查表代替逐个isinstance判断，子类由_type_bit处理
+_TYPE_DISPATCH = {
+    type(None): TYPE_BITS["null"],
+    bool: TYPE_BITS["boolean"],
+    int: TYPE_BITS["integer"],
+    float: TYPE_BITS["number"],
+    str: TYPE_BITS["string"],
+    list: _ARRAY_BIT,
+    dict: _OBJECT_BIT,
+}
+
+def _iter_fast(jsonl_file: str) -> Iterator[Any]:
+    """
+    逐行读取JSONL文件
+
+    JsonLoader以1MB缓冲区读取原始字节（默认使用内存映射），按换行符切分后直接解析字节，
+    安装orjson时使用orjson解析，不需要逐行解码为字符串。
+
+    Args:
+        jsonl_file (str): JSONL文件路径
+
+    Yields:
+        any: 每一行解析后的JSON数据
+    """
+    return iter(JsonLoader(jsonl_file))
+
+def type_names(mask: int) -> List[str]:
+    """
+    把类型位掩码还原为类型名称
+
+    Args:
+        mask (int): 类型位掩码
+
+    Returns:
+        list: 按名称排序的类型名称
+    """
+    return [name for bit, name in BITS_TO_NAMES if mask & bit]
+
+def _json_type(value: Any) -> str:
+    """
+    获取值的JSON类型名称
+
+    Args:
+        value (any): JSON值
+
+    Returns:
+        str: null、boolean、integer、number、string、array或object
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return type(value).__name__
+
+def _type_bit(value: Any) -> int:
+    """
+    获取值的类型位，dict、list等类型的子类按其JSON类型处理
+
+    Args:
+        value (any): JSON值
+
+    Returns:
+        int: 类型位，不是JSON类型的值返回0
+    """
+    bit = _TYPE_DISPATCH.get(type(value))
+    if bit is None:
+        bit = TYPE_BITS.get(_json_type(value), 0)
+    return bit
+
+def extract_key_structure(json_data: Dict[str, Any], prefix: str = "") -> Dict[str, int]:
+    """
+    提取JSON对象中全部键路径及其值类型
+
+    嵌套对象的键以"."连接，数组元素的路径为"数组路径[*]"，只检查数组的前ARRAY_SAMPLE_SIZE个元素。
+    值类型以TYPE_BITS中的位组成的掩码表示，可使用type_names还原为名称。
+
+    Args:
+        json_data (dict): JSON对象
+        prefix (str): 路径前缀
+
+    Returns:
+        dict: 键路径到类型位掩码的映射
+    """
+    result = defaultdict(int)
+    _walk_all(json_data, prefix, result)
+    return result
+
+def _walk(json_data: Dict[str, Any], prefix: str, sink: Dict[str, int],
+          counts: Optional[Dict[str, int]] = None, sample_limit: int = 0) -> None:
+    """
+    递归遍历JSON对象，把键路径的类型位直接合并到sink中
+
+    嵌套对象和多行数据都写入同一个sink，不创建中间结果。
+    路径字符串从_path_cache中获取，每个不同的路径只拼接并sys.intern一次，合并结果时字典查找可以直接按身份比较。
+
+    Args:
+        json_data (dict): JSON对象
+        prefix (str): 路径前缀
+        sink (defaultdict): 键路径到类型位掩码的映射，原地更新
+        counts (dict, optional): 键路径到已检查次数的映射，原地更新，为None时不限制检查次数
+        sample_limit (int): 每个键路径最多检查的次数，达到后跳过该路径及其子路径，只在counts不为None时使用
+    """
+    paths = _path_cache.get(prefix)
+    if paths is None:
+        paths = _path_cache[prefix] = {}
+    type_bit_get = _TYPE_DISPATCH.get
+    for key, value in json_data.items():
+        current_path = paths.get(key)
+        if current_path is None:
+            current_path = paths[key] = sys.intern(f"{prefix}.{key}" if prefix else str(key))
+        if counts is not None:
+            seen = counts.get(current_path, 0)
+            if seen >= sample_limit:
+                continue
+            counts[current_path] = seen + 1
+        bit = type_bit_get(type(value))
+        if bit is None:
+            bit = _type_bit(value)
+        sink[current_path] |= bit
+
+        if bit == _OBJECT_BIT:
+            _walk(value, current_path, sink, counts, sample_limit)
+        elif bit == _ARRAY_BIT:
+            item_path = _item_path_cache.get(current_path)
+            if item_path is None:
+                item_path = _item_path_cache[current_path] = sys.intern(f"{current_path}[*]")
+            for item in value[:ARRAY_SAMPLE_SIZE]:
+                if counts is not None:
+                    seen = counts.get(item_path, 0)
+                    if seen >= sample_limit:
+                        break
+                    counts[item_path] = seen + 1
+                item_bit = type_bit_get(type(item))
+                if item_bit is None:
+                    item_bit = _type_bit(item)
+                sink[item_path] |= item_bit
+                if item_bit == _OBJECT_BIT:
+                    _walk(item, item_path, sink, counts, sample_limit)
+
+def _walk_all(json_data: Dict[str, Any], prefix: str, sink: Dict[str, int]) -> None:
+    """
+    不限制检查次数地遍历JSON对象，已编译C扩展时使用jsonflow._cwalk.walk
+
+    Args:
+        json_data (dict): JSON对象
+        prefix (str): 路径前缀
+        sink (defaultdict): 键路径到类型位掩码的映射，原地更新
+    """
+    if _cwalk is not None:
+        _cwalk(json_data, prefix, sink, ARRAY_SAMPLE_SIZE, _path_cache, _item_path_cache)
+    else:
+        _walk(json_data, prefix, sink)
+
+def _collect_keys(json_lines: Iterable[Any], sample_limit: Optional[int] = None) -> Dict[str, int]:
+    """
+    统计多条JSON数据中的键路径及其值类型
+
+    Args:
+        json_lines (iterable): JSON数据，不是对象的数据被忽略
+        sample_limit (int, optional): 每个键路径最多检查的次数，默认不限制。
+            达到次数后不再检查该路径及其子路径，之后才出现的类型和子路径不会被统计
+
+    Returns:
+        dict: 键路径到类型位掩码的映射
+    """
+    all_keys = defaultdict(int)
+    counts = {} if sample_limit is not None else None
+    for json_line in json_lines:
+        if not isinstance(json_line, dict):
+            continue
+        if counts is not None:
+            _walk(json_line, "", all_keys, counts, sample_limit)
+        else:
+            _walk_all(json_line, "", all_keys)
+    return all_keys
+
+def _collect_keys_with_pipeline(json_lines: Iterable[Any]) -> Dict[str, int]:
+    """
+    使用JsonStructureExtractor操作符统计多条JSON数据中的键路径及其值类型
+
+    Args:
+        json_lines (iterable): JSON数据，不是对象的数据被忽略
+
+    Returns:
+        dict: 键路径到类型位掩码的映射
+    """
+    # 延迟导入，analyze默认模式不需要加载操作符模块
+    from jsonflow.core import Pipeline
+    from jsonflow.operators.json_ops.json_field_ops import JsonStructureExtractor
+
+    extractor = JsonStructureExtractor(flatten=True, include_arrays=False, inplace=True)
+    pipeline = Pipeline([extractor])
+    all_keys = defaultdict(int)
+    json_objects = (json_line for json_line in json_lines if isinstance(json_line, dict))
+    for result in pipeline.process_many(json_objects):
+        for flat_path in result[extractor.target_field]:
+            # 扁平化路径形如"a.b (str)"
+            path, _, type_name = flat_path.rpartition(" (")
+            all_keys[sys.intern(path)] |= TYPE_BITS.get(type_name[:-1], 0)
+    return all_keys
+
+def _shard_ranges(jsonl_file: str, jobs: int) -> List[Tuple[int, int]]:
+    """
+    按字节数把文件均分为多个分片
+
+    分片边界不需要落在行首，由_analyze_shard对齐到下一行的开头。
+
+    Args:
+        jsonl_file (str): JSONL文件路径
+        jobs (int): 期望的分片数
+
+    Returns:
+        list: (开始位置, 结束位置)列表，文件为空时返回空列表
+    """
+    size = os.path.getsize(jsonl_file)
+    if size == 0:
+        return []
+    jobs = max(1, min(jobs, size // _MIN_SHARD_SIZE))
+    step = -(-size // jobs)
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+def _analyze_shard(jsonl_file: str, start: int, stop: int, use_pipeline: bool,
+                   sample_limit: Optional[int] = None) -> Dict[str, int]:
+    """
+    统计文件中一个分片的键路径，在子进程中运行
+
+    从start所在行的下一行开始（start为0时从第一行开始），解析所有在stop之前开始的行，
+    因此相邻分片的行既不重复也不遗漏。
+
+    Args:
+        jsonl_file (str): JSONL文件路径
+        start (int): 分片开始位置
+        stop (int): 分片结束位置
+        use_pipeline (bool): 是否使用JsonStructureExtractor操作符
+        sample_limit (int, optional): 每个键路径在本分片中最多检查的次数，默认不限制
+
+    Returns:
+        dict: 键路径到类型位掩码的映射
+    """
+    with open(jsonl_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if start > 0:
+            # 对齐到下一行的开头：start-1处的换行符之后即新的一行
+            newline = mm.find(b'\n', start - 1)
+            start = len(mm) if newline < 0 else newline + 1
+        json_lines = JsonLoader._iter_mapped(mm, start, stop)
+        if use_pipeline:
+            return _collect_keys_with_pipeline(json_lines)
+        return _collect_keys(json_lines, sample_limit)
+
+def _analyze_parallel(jsonl_file: str, jobs: int, use_pipeline: bool,
+                      sample_limit: Optional[int] = None) -> Dict[str, int]:
+    """
+    把文件按行对齐分片后在进程池中并行统计键路径，再合并结果；文件较小只有一个分片时在当前进程中统计
+
+    Args:
+        jsonl_file (str): JSONL文件路径
+        jobs (int): 最大进程数
+        use_pipeline (bool): 是否使用JsonStructureExtractor操作符
+        sample_limit (int, optional): 每个键路径在每个分片中最多检查的次数，默认不限制
+
+    Returns:
+        dict: 键路径到类型位掩码的映射
+    """
+    ranges = _shard_ranges(jsonl_file, jobs)
+    all_keys = defaultdict(int)
+    if not ranges:
+        return all_keys
+    if len(ranges) == 1:
+        start, stop = ranges[0]
+        return _analyze_shard(jsonl_file, start, stop, use_pipeline, sample_limit)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [
+            executor.submit(_analyze_shard, jsonl_file, start, stop, use_pipeline, sample_limit)
+            for start, stop in ranges
+        ]
+        for future in futures:
+            for key, mask in future.result().items():
+                all_keys[key] |= mask
+    return all_keys
+
+def analyze_jsonl_keys(jsonl_file: str, jobs: int = 1, sample_limit: Optional[int] = None) -> Dict[str, int]:
+    """
+    统计JSONL文件中全部键路径及其值类型
+
+    Args:
+        jsonl_file (str): JSONL文件路径
+        jobs (int): 并行分析的进程数，默认为1（在当前进程中分析）
+        sample_limit (int, optional): 每个键路径最多检查的次数，默认不限制。
+            结果是近似的：达到次数后才出现的类型和子路径不会被统计；并行分析时每个分片分别计数
+
+    Returns:
+        dict: 键路径到类型位掩码的映射，不是对象的行被忽略
+
+    Raises:
+        OSError: 如果文件无法读取
+        json.JSONDecodeError: 如果某一行不是有效的JSON
+    """
+    if jobs > 1:
+        return _analyze_parallel(jsonl_file, jobs, use_pipeline=False, sample_limit=sample_limit)
+    return _collect_keys(_iter_fast(jsonl_file), sample_limit)
+
+def analyze_jsonl_with_pipeline(jsonl_file: str, jobs: int = 1) -> Dict[str, int]:
+    """
+    使用JsonStructureExtractor操作符统计JSONL文件中的键路径及其值类型
+
+    路径格式与JsonStructureExtractor的扁平化输出一致（数组元素为"数组路径[]"，类型为Python类型名称）。
+
+    Args:
+        jsonl_file (str): JSONL文件路径
+        jobs (int): 并行分析的进程数，默认为1（在当前进程中分析）
+
+    Returns:
+        dict: 键路径到类型位掩码的映射，不是对象的行被忽略
+
+    Raises:
+        OSError: 如果文件无法读取
+        json.JSONDecodeError: 如果某一行不是有效的JSON
+    """
+    if jobs > 1:
+        return _analyze_parallel(jsonl_file, jobs, use_pipeline=True)
+    return _collect_keys_with_pipeline(_iter_fast(jsonl_file))
+
+def format_key_table(all_keys: Dict[str, int]) -> List[str]:
+    """
+    将键路径统计结果格式化为表格行
+
+    Args:
+        all_keys (dict): 键路径到类型位掩码的映射
+
+    Returns:
+        list: 表格的各行文本，按键路径排序
+    """
+    lines = ["%-50s | %-30s" % ("Key", "Types"), "-" * 83]
+    for key in sorted(all_keys):
+        lines.append("%-50s | %-30s" % (key, ", ".join(type_names(all_keys[key]))))
+    return lines
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    创建命令行参数解析器
+
+    Returns:
+        argparse.ArgumentParser: 参数解析器
+    """
+    parser = argparse.ArgumentParser(prog="jsonflow", description="JSONFlow command line tool")
+    subparsers = parser.add_subparsers(dest="command")
+
+    analyze = subparsers.add_parser("analyze", help="list all key paths and value types in a JSONL file")
+    analyze.add_argument("jsonl_file", help="input JSONL file")
+    analyze.add_argument("--pipeline", action="store_true",
+                         help="extract keys with the JsonStructureExtractor operator")
+    analyze.add_argument("-j", "--jobs", type=int, default=1,
+                         help="number of worker processes, each analyzing a line-aligned shard of the file")
+    analyze.add_argument("--sample-limit", type=int, metavar="K",
+                         help="stop inspecting a key path after K observations (approximate, faster on large files)")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    命令行入口
+
+    Args:
+        argv (list, optional): 命令行参数，默认为sys.argv[1:]
+
+    Returns:
+        int: 退出码，成功时为0
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.command != "analyze":
+        parser.print_help()
+        return 1
+
+    if args.sample_limit is not None:
+        if args.pipeline:
+            parser.error("--sample-limit cannot be used with --pipeline")
+        if args.sample_limit < 1:
+            parser.error("--sample-limit must be at least 1")
+
+    try:
+        if args.pipeline:
+            all_keys = analyze_jsonl_with_pipeline(args.jsonl_file, jobs=args.jobs)
+        else:
+            all_keys = analyze_jsonl_keys(args.jsonl_file, jobs=args.jobs, sample_limit=args.sample_limit)
+    except (OSError, ValueError) as e:
+        print(f"Error analyzing {args.jsonl_file}: {e}", file=sys.stderr)
+        return 1
+
+    # 整个表格一次写出，避免每行一次print
+    sys.stdout.write("\n".join(format_key_table(all_keys)) + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,13 @@
 
 import concurrent.futures
 import asyncio
-from typing import List, Dict, Any
+import collections
+import os
+from typing import List, Dict, Any, Iterable, Iterator
+
+from jsonflow.utils.logger import get_logger
+
+_logger = get_logger("executor")
 
 class Executor:
     """
@@ -148,9 +154,54 @@ class MultiThreadExecutor(Executor):
                     results[index] = future.result()
                 except Exception as e:
                     # 在实际应用中可能需要更复杂的错误处理
-                    print(f"Error processing item at index {index}: {e}")
+                    _logger.error("Error processing item at index %d: %s", index, e)
                     results[index] = {"error": str(e)}
         return results
+    
+    def execute_iter(self, json_data_iter: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        使用多线程流式执行Pipeline，适合JsonLoader等无法预先全部加载的数据源
+        
+        同时提交的任务数量有上限，不会一次性读入全部输入；结果按输入顺序产出。
+        适用于包含ModelInvoker等网络IO操作的Pipeline，要求操作符是线程安全的。
+        
+        Args:
+            json_data_iter (iterable): 输入的JSON数据迭代器
+            
+        Yields:
+            dict: 处理后的JSON数据，与输入顺序一致
+        """
+        max_workers = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+        # 预取的任务数为线程数的两倍，保证线程在等待结果时不会空闲
+        max_pending = max_workers * 2
+        pending = collections.deque()
+        index = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for data in json_data_iter:
+                pending.append((index, executor.submit(self.execute, data)))
+                index += 1
+                if len(pending) >= max_pending:
+                    yield self._future_result(*pending.popleft())
+            while pending:
+                yield self._future_result(*pending.popleft())
+    
+    def _future_result(self, index: int, future: concurrent.futures.Future) -> Dict[str, Any]:
+        """
+        获取任务结果，失败时返回错误信息
+        
+        Args:
+            index (int): 数据在输入中的位置
+            future (Future): 任务对象
+            
+        Returns:
+            dict: 处理后的JSON数据或错误信息
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            # 在实际应用中可能需要更复杂的错误处理
+            _logger.error("Error processing item at index %d: %s", index, e)
+            return {"error": str(e)}
 
 
 class MultiProcessExecutor(Executor):
@@ -195,6 +246,6 @@ class MultiProcessExecutor(Executor):
                     results[index] = future.result()
                 except Exception as e:
                     # 在实际应用中可能需要更复杂的错误处理
-                    print(f"Error processing item at index {index}: {e}")
+                    _logger.error("Error processing item at index %d: %s", index, e)
                     results[index] = {"error": str(e)}
         return results 
\ No newline at end of file
@@ -13,6 +13,10 @@ class Operator:
     所有操作符都应该继承这个类，并实现process_item方法或process_batch方法。
     """
     
+    # process_batch是否为每条输入返回一条对应的结果（而不是像JsonAggregator那样合并整批数据），
+    # Pipeline只会把整批数据交给同时声明了supports_batch和batch_aligned的操作符
+    batch_aligned = False
+    
     def __init__(self, name=None, description=None, supports_batch=False):
         """
         初始化操作符
@@ -124,6 +128,9 @@ class ModelOperator(Operator):
     这个类封装了调用大语言模型的操作符。
     """
     
+    # 模型操作符的批处理为每条输入返回一条结果
+    batch_aligned = True
+    
     def __init__(self, name=None, description=None, supports_batch=False, **model_params):
         """
         初始化模型操作符
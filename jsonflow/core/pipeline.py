@@ -73,22 +73,42 @@ class Pipeline:
         self.collection_mode = mode
         return self
     
-    def _apply_passthrough(self, original_data, processed_data):
+    def _collect_passthrough(self, original_data):
+        """
+        提取需要透传的字段值
+        
+        只保存透传字段本身，避免为了透传而复制整个输入数据。
+        
+        Args:
+            original_data (dict): 原始JSON数据
+            
+        Returns:
+            dict: 透传字段名到值的映射
+        """
+        return {
+            field: original_data[field]
+            for field in self.passthrough_fields
+            if field in original_data
+        }
+    
+    def _apply_passthrough(self, original_data, processed_data, passthrough_values=None):
         """
         应用字段透传逻辑
         
         Args:
             original_data (dict): 原始JSON数据
             processed_data (dict): 处理后的JSON数据
+            passthrough_values (dict, optional): 预先提取的透传字段值，为None时从original_data提取
             
         Returns:
             dict: 添加了透传字段的JSON数据
         """
-        # 提取需要透传的字段值
-        passthrough_values = {}
-        for field in self.passthrough_fields:
-            if field in original_data:
-                passthrough_values[field] = original_data[field]
+        if passthrough_values is None:
+            passthrough_values = self._collect_passthrough(original_data)
+        
+        # 没有需要透传的字段时直接返回，不再复制处理结果
+        if not passthrough_values:
+            return processed_data
         
         # 将透传字段添加到处理后的数据中
         result = processed_data.copy()
@@ -118,6 +138,9 @@ class Pipeline:
                 for op in self.operators:
                     result = op.process(result)
                 return result
+            elif any(self._batches_with(op) for op in self.operators):
+                # 展平模式下有可以整批处理的操作符（如ModelInvoker）时，按批执行以并发调用模型
+                return self.process_batch(json_data)
             else:
                 # 展平模式：分别处理列表中的每个项目
                 results = []
@@ -134,6 +157,120 @@ class Pipeline:
             # 单个JSON对象的处理
             return self._process_single_item(json_data)
     
+    def process_batch(self, json_data_list):
+        """
+        以批为单位执行操作符链
+
+        结果与展平模式下的process(json_data_list)一致，但每个操作符一次接收整批数据：
+        同时声明了supports_batch和batch_aligned的操作符（如ModelInvoker）通过process_batch
+        一次处理整批数据，从而可以并发调用模型；其他操作符仍逐条处理。嵌套模式下等同于process。
+
+        这类操作符的process_batch需要为每条输入返回一条结果。
+
+        Args:
+            json_data_list (list): 输入的JSON数据列表
+
+        Returns:
+            list: 处理后的JSON数据列表，顺序与输入一致
+
+        Raises:
+            ValueError: 如果批处理操作符返回的结果数量与输入数量不一致
+        """
+        if self.collection_mode == self.NESTED:
+            return self.process(json_data_list)
+
+        outputs = list(json_data_list)
+        passthrough_list = [self._collect_passthrough(item) for item in json_data_list]
+        # 仍需继续经过后续操作符的数据下标
+        pending = list(range(len(outputs)))
+
+        for op in self.operators:
+            if not pending:
+                break
+
+            if self._batches_with(op):
+                op_results = op.process_batch([outputs[i] for i in pending])
+                if len(op_results) != len(pending):
+                    raise ValueError(
+                        f"Operator {op.name} returned {len(op_results)} results for {len(pending)} items"
+                    )
+            else:
+                op_results = [op.process(outputs[i]) for i in pending]
+
+            still_pending = []
+            for i, op_result in zip(pending, op_results):
+                if isinstance(op_result, list):
+                    # 展平模式：操作符返回列表时，对每项应用透传后结束该数据的处理
+                    outputs[i] = [
+                        self._apply_passthrough(json_data_list[i], item, passthrough_list[i])
+                        for item in op_result
+                    ]
+                else:
+                    outputs[i] = op_result
+                    still_pending.append(i)
+            pending = still_pending
+
+        for i in pending:
+            outputs[i] = self._apply_passthrough(json_data_list[i], outputs[i], passthrough_list[i])
+
+        results = []
+        for output in outputs:
+            if isinstance(output, list):
+                results.extend(output)
+            else:
+                results.append(output)
+        return results
+
+    def process_many(self, json_data_iter):
+        """
+        逐条处理可迭代对象中的JSON数据，生成处理结果
+
+        与process不同，不需要先把全部数据读入列表，适合流式处理JSONL文件。每条数据的结果与process(json_data)一致；
+        展平模式下操作符返回的列表会被展开，逐项生成，与process(list)的展平结果顺序一致。
+        可以整批处理的操作符也逐条调用，需要并发调用模型时使用process_batch。
+
+        Args:
+            json_data_iter (iterable): 输入的JSON数据
+
+        Yields:
+            dict or list: 处理后的JSON数据，嵌套模式下可能是列表
+        """
+        flatten = self.collection_mode != self.NESTED
+        if self.passthrough_fields:
+            for json_data in json_data_iter:
+                result = self._process_single_item(json_data)
+                if flatten and isinstance(result, list):
+                    yield from result
+                else:
+                    yield result
+            return
+
+        # 没有透传字段时不需要保存原始数据，操作符列表在循环外取出
+        operators = tuple(self.operators)
+        for json_data in json_data_iter:
+            result = json_data
+            for op in operators:
+                result = op.process(result)
+                if flatten and isinstance(result, list):
+                    break
+            if flatten and isinstance(result, list):
+                yield from result
+            else:
+                yield result
+
+    @staticmethod
+    def _batches_with(op):
+        """
+        判断操作符是否可以一次处理整批数据
+
+        Args:
+            op: 操作符
+
+        Returns:
+            bool: 操作符声明了supports_batch且批处理结果与输入一一对应时返回True
+        """
+        return getattr(op, 'supports_batch', False) and getattr(op, 'batch_aligned', False)
+
     def _process_single_item(self, json_data):
         """
         处理单个JSON数据项通过所有操作符
@@ -145,7 +282,8 @@ class Pipeline:
             dict or list: 处理后的JSON数据，可能是单个对象或列表
         """
         result = json_data
-        original_data = json_data.copy()  # 保存原始数据用于透传
+        # 只保存透传字段的值，而不是复制整个原始数据
+        passthrough_values = self._collect_passthrough(json_data)
         
         for op in self.operators:
             # 处理当前项
@@ -161,7 +299,7 @@ class Pipeline:
                     processed_results = []
                     for item in op_result:
                         # 应用透传字段到列表中的每个项
-                        processed_item = self._apply_passthrough(original_data, item)
+                        processed_item = self._apply_passthrough(json_data, item, passthrough_values)
                         processed_results.append(processed_item)
                     return processed_results
             else:
@@ -170,7 +308,7 @@ class Pipeline:
         
         # 如果结果是单个对象，处理透传字段
         if not isinstance(result, list):
-            result = self._apply_passthrough(original_data, result)
+            result = self._apply_passthrough(json_data, result, passthrough_values)
         
         return result
     
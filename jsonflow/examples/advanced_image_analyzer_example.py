@@ -9,16 +9,20 @@
 
 import os
 import json
-import base64
 from typing import Dict, Any, List, Optional, Union
 from jsonflow.operators.model import ModelInvoker
 from jsonflow.core import Pipeline
 from jsonflow.io import JsonLoader, JsonSaver
+from jsonflow.utils.fast_json import loads
+from jsonflow.utils.image import image_data_url
 
 
 class AdvancedImageAnalyzer(ModelInvoker):
     """高级图像分析操作符，可以生成多种类型的图像分析结果"""
     
+    # 自定义了process，批处理时并发调用process逐条处理
+    per_record_batch = True
+    
     def __init__(self, 
                  model: str,
                  image_field: str = "image_path",
@@ -83,10 +87,9 @@ class AdvancedImageAnalyzer(ModelInvoker):
         result = json_data.copy()
         image_path = result[self.image_field]
         
-        # 读取并编码图像
+        # 读取并编码图像，同一图像重复出现时使用缓存的编码结果；已经是URL的图像原样使用
         try:
-            with open(image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+            image_url = image_data_url(image_path)
         except Exception as e:
             error_msg = f"图像读取错误: {str(e)}"
             for analysis_type in self.analysis_types:
@@ -120,7 +123,7 @@ class AdvancedImageAnalyzer(ModelInvoker):
                     "role": "user", 
                     "content": [
                         {"type": "text", "text": prompt},
-                        {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{image_data}"}}
+                        {"type": "image_url", "image_url": {"url": image_url}}
                     ]
                 }
             ]
@@ -137,7 +140,7 @@ class AdvancedImageAnalyzer(ModelInvoker):
                         json_end = response.rfind(']') + 1
                         if json_start >= 0 and json_end > json_start:
                             json_str = response[json_start:json_end]
-                            result[output_field] = json.loads(json_str)
+                            result[output_field] = loads(json_str)
                         else:
                             result[output_field] = response
                     except json.JSONDecodeError:
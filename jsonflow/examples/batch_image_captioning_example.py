@@ -10,16 +10,19 @@
 import os
 import json
 import glob
-import base64
 from typing import Dict, Any, List, Optional
 from jsonflow.operators.model import ModelInvoker
 from jsonflow.core import Pipeline
 from jsonflow.io import JsonLoader, JsonSaver
+from jsonflow.utils.image import image_data_url
 
 
 class ImageCaptioningInvoker(ModelInvoker):
     """图像标注操作符"""
     
+    # 自定义了process，批处理时并发调用process逐条处理
+    per_record_batch = True
+    
     def __init__(self, 
                  model: str,
                  image_field: str = "image_path",
@@ -31,7 +34,7 @@ class ImageCaptioningInvoker(ModelInvoker):
         
         Args:
             model: 模型名称（需要支持图像处理，如gpt-4-vision-preview）
-            image_field: 输入图像路径的字段名，默认为"image_path"
+            image_field: 输入图像路径或URL的字段名，默认为"image_path"
             caption_field: 输出标注的字段名，默认为"caption"
             caption_prompt: 向模型发送的提示文本，默认为简单的描述请求
             **kwargs: 其他传递给ModelInvoker的参数
@@ -57,10 +60,9 @@ class ImageCaptioningInvoker(ModelInvoker):
         result = json_data.copy()
         image_path = result[self.image_field]
         
-        # 读取并编码图像
+        # 读取并编码图像，同一图像重复出现时使用缓存的编码结果；已经是URL的图像原样使用
         try:
-            with open(image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+            image_url = image_data_url(image_path)
         except Exception as e:
             result[self.caption_field] = f"图像读取错误: {str(e)}"
             return result
@@ -72,7 +74,7 @@ class ImageCaptioningInvoker(ModelInvoker):
                 "role": "user", 
                 "content": [
                     {"type": "text", "text": self.caption_prompt},
-                    {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{image_data}"}}
+                    {"type": "image_url", "image_url": {"url": image_url}}
                 ]
             }
         ]
@@ -15,6 +15,9 @@ from jsonflow.operators.model import ModelInvoker
 class ConversationInvoker(ModelInvoker):
     """支持多轮对话的模型操作符"""
     
+    # 自定义了process，批处理时并发调用process逐条处理
+    per_record_batch = True
+    
     def __init__(self, 
                  model: str,
                  history_field: str = "history",
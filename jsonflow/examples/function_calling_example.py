@@ -13,11 +13,19 @@ from typing import Dict, Any, List
 from jsonflow.operators.model import ModelInvoker
 from jsonflow.core import Pipeline
 from jsonflow.io import JsonLoader, JsonSaver
+from jsonflow.utils import get_logger
+from jsonflow.utils.fast_json import coerce_json
+
+# 获取日志记录器
+logger = get_logger("function_calling_example")
 
 
 class FunctionCallingInvoker(ModelInvoker):
     """支持函数调用的模型操作符"""
     
+    # 自定义了process，批处理时并发调用process逐条处理
+    per_record_batch = True
+    
     def __init__(self, 
                  model: str,
                  prompt_field: str = "prompt",
@@ -30,6 +38,23 @@ class FunctionCallingInvoker(ModelInvoker):
         self.response_field = response_field
         self.functions_field = functions_field
         self.function_results_field = function_results_field
+        # OpenAI客户端在首次调用时创建
+        self._client = None
+    
+    def _get_client(self):
+        """
+        获取OpenAI客户端，首次使用时创建，之后的调用复用同一个客户端及其连接池
+        
+        Returns:
+            openai.OpenAI: OpenAI客户端
+        """
+        if self._client is None:
+            import openai
+            client_kwargs = {"api_key": self.api_key}
+            if self.base_url:
+                client_kwargs["base_url"] = self.base_url
+            self._client = openai.OpenAI(**client_kwargs)
+        return self._client
     
     def process(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -66,17 +91,9 @@ class FunctionCallingInvoker(ModelInvoker):
             {"role": "user", "content": prompt}
         ]
         
-        # 添加函数调用相关参数
-        client_kwargs = {"api_key": self.api_key}
-        if self.base_url:
-            client_kwargs["base_url"] = self.base_url
-            
         try:
-            import openai
-            client = openai.OpenAI(**client_kwargs)
-            
             # 调用API请求函数调用
-            response = client.chat.completions.create(
+            response = self._get_client().chat.completions.create(
                 model=self.model,
                 messages=messages,
                 functions=functions,
@@ -97,14 +114,15 @@ class FunctionCallingInvoker(ModelInvoker):
                 function_call = message.function_call
                 function_calling_results.append({
                     "name": function_call.name,
-                    "arguments": json.loads(function_call.arguments)
+                    # 部分兼容OpenAI的服务直接返回解析后的参数，无需再次解析
+                    "arguments": coerce_json(function_call.arguments)
                 })
             
             # 存储函数调用结果
             result[self.function_results_field] = function_calling_results
             
         except Exception as e:
-            print(f"Error in function calling: {e}")
+            logger.warning("Error in function calling: %s", e)
             messages = [
                 {"role": "system", "content": self.system_prompt or "You are a helpful assistant."},
                 {"role": "user", "content": prompt}
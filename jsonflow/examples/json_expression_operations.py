@@ -62,10 +62,10 @@ def run_json_expression_operations_example():
             "user.email_domain": lambda data: data["user"]["email"].split("@")[1] if "@" in data["user"]["email"] else "",
             
             # 数学运算 - 计算总价
-            "order.total_price": lambda data: sum(item["price"] * item["quantity"] for item in data["items"]),
+            "order.total_price": JsonExpressionOperator.aggregate("items", "sum_product", ("price", "quantity")),
             
-            # 逻辑操作 - 订单是否超过1000美元
-            "order.is_large_order": lambda data: sum(item["price"] * item["quantity"] for item in data["items"]) > 1000,
+            # 逻辑操作 - 订单是否超过1000美元，直接使用上面计算出的总价
+            "order.is_large_order": lambda data: data["order"]["total_price"] > 1000,
             
             # 数组操作 - 提取所有商品名称
             "order.item_names": lambda data: [item["name"] for item in data["items"]],
@@ -79,6 +79,7 @@ def run_json_expression_operations_example():
             # 动态计算商品数量
             "order.item_count": lambda data: len(data.get("items", []))
         },
+        sequential=True,
         name="表达式操作符"
     )
     
@@ -112,12 +113,9 @@ def run_json_expression_operations_example():
             "product_names": "items[*].name",
             
             # 使用函数进行复杂计算
-            "order_summary.subtotal": lambda data: sum(item.get("price", 0) * item.get("quantity", 0) for item in data.get("items", [])),
-            "order_summary.item_count": lambda data: sum(item.get("quantity", 0) for item in data.get("items", [])),
-            "order_summary.avg_price": lambda data: (
-                sum(item.get("price", 0) for item in data.get("items", [])) / len(data.get("items", [])) 
-                if data.get("items") else 0
-            )
+            "order_summary.subtotal": JsonExpressionOperator.aggregate("items", "sum_product", ("price", "quantity")),
+            "order_summary.item_count": JsonExpressionOperator.aggregate("items", "sum", ("quantity",)),
+            "order_summary.avg_price": JsonExpressionOperator.aggregate("items", "avg", ("price",))
         },
         name="字段映射操作符"
     )
@@ -177,7 +175,7 @@ def run_json_expression_operations_example():
         JsonExpressionOperator(
             expressions={
                 "user.full_name": "$.user.first_name + ' ' + $.user.last_name",
-                "order.total": lambda data: sum(item["price"] * item["quantity"] for item in data["items"]),
+                "order.total": JsonExpressionOperator.aggregate("items", "sum_product", ("price", "quantity")),
                 "order.item_count": lambda data: len(data["items"])
             }
         ),
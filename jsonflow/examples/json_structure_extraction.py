@@ -5,6 +5,8 @@ JSON结构提取示例
 """
 
 import json
+import logging
+from types import MappingProxyType
 from jsonflow.core import Pipeline
 from jsonflow.utils import get_logger, enable_operator_io_logging
 from jsonflow.operators.json_ops import JsonStructureExtractor
@@ -15,6 +17,17 @@ enable_operator_io_logging(True)
 # 获取日志记录器
 logger = get_logger("json_structure_extraction")
 
+def log_paths(title, paths):
+    """
+    用一次日志调用输出路径列表
+    
+    Args:
+        title (str): 列表标题
+        paths (list): 路径列表
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join([title] + [f"  - {path}" for path in paths]))
+
 def run_json_structure_extraction_example():
     """
     运行JSON结构提取示例
@@ -60,6 +73,9 @@ def run_json_structure_extraction_example():
         }
     }
     
+    # 以只读视图共享给所有提取器，提取器不会修改输入，也无需深拷贝
+    read_only_data = MappingProxyType(sample_data)
+    
     logger.info("\n--- 示例1: 扁平化结构提取 ---")
     # 创建扁平化结构提取操作符
     flat_structure_extractor = JsonStructureExtractor(
@@ -69,12 +85,10 @@ def run_json_structure_extraction_example():
     )
     
     # 处理数据
-    result1 = flat_structure_extractor.process(sample_data)
+    result1 = flat_structure_extractor.process(read_only_data)
     
     # 输出扁平化路径列表
-    logger.info("扁平化路径列表:")
-    for path in result1["structure"]:
-        logger.info(f"  - {path}")
+    log_paths("扁平化路径列表:", result1["structure"])
     
     logger.info("\n--- 示例2: 嵌套结构提取 ---")
     # 创建嵌套结构提取操作符
@@ -86,7 +100,7 @@ def run_json_structure_extraction_example():
     )
     
     # 处理数据
-    result2 = nested_structure_extractor.process(sample_data)
+    result2 = nested_structure_extractor.process(read_only_data)
     
     # 输出嵌套结构
     logger.info("嵌套结构:")
@@ -103,12 +117,10 @@ def run_json_structure_extraction_example():
     )
     
     # 处理数据
-    result3 = simplified_structure_extractor.process(sample_data)
+    result3 = simplified_structure_extractor.process(read_only_data)
     
     # 输出简化结构
-    logger.info("简化路径列表:")
-    for path in result3["paths"]:
-        logger.info(f"  - {path}")
+    log_paths("简化路径列表:", result3["paths"])
     
     logger.info("\n--- 示例4: 深度限制结构提取 ---")
     # 创建深度限制结构提取操作符
@@ -121,12 +133,10 @@ def run_json_structure_extraction_example():
     )
     
     # 处理数据
-    result4 = depth_limited_extractor.process(sample_data)
+    result4 = depth_limited_extractor.process(read_only_data)
     
     # 输出深度限制结构
-    logger.info("深度限制的路径列表 (max_depth=2):")
-    for path in result4["limited_paths"]:
-        logger.info(f"  - {path}")
+    log_paths("深度限制的路径列表 (max_depth=2):", result4["limited_paths"])
     
     logger.info("\n--- 示例5: 提取特定路径下的结构 ---")
     # 对特定路径下的结构进行提取
@@ -148,9 +158,7 @@ def run_json_structure_extraction_example():
     result5 = order_structure_extractor.process(first_order)
     
     # 输出订单结构
-    logger.info("订单结构:")
-    for path in result5["order_structure"]:
-        logger.info(f"  - {path}")
+    log_paths("订单结构:", result5["order_structure"])
     
     logger.info("\n=== 示例结束 ===")
 
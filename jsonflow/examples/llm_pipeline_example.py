@@ -8,17 +8,32 @@ LLM Pipeline Example
 
 import os
 import json
+import threading
+from pathlib import Path
 from jsonflow.core import Pipeline
-from jsonflow.io import JsonLoader, JsonSaver
-from jsonflow.operators.json_ops import TextNormalizer
-from jsonflow.operators.model import ModelInvoker
+from jsonflow.io import JsonSaver
+from jsonflow.operators.model import NormalizedModelInvoker
+
+# 输出目录
+OUTPUT_DIR = Path("examples/output")
+
+def save_input_data(sample_data, path):
+    """
+    将输入数据保存为JSONL文件，便于复现
+    
+    Args:
+        sample_data (list): 输入的JSON数据列表
+        path (str): 输出文件路径
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(json.dumps(item, ensure_ascii=False) + "\n" for item in sample_data))
 
 def main():
     """
     运行LLM处理管道示例。
     
     这个函数：
-    1. 创建一个包含文本归一化和LLM处理的管道
+    1. 创建一个先做文本归一化再调用LLM的管道
     2. 处理一组示例JSON数据
     3. 保存处理结果
     """
@@ -48,41 +63,41 @@ def main():
     ]
     
     # 创建输出目录
-    os.makedirs("examples/output", exist_ok=True)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
-    # 保存输入数据
-    with open("examples/output/llm_input.jsonl", "w", encoding="utf-8") as f:
-        for item in sample_data:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    # 在后台线程中保存输入数据（仅用于复现），不阻塞管道处理
+    input_writer = threading.Thread(
+        target=save_input_data,
+        args=(sample_data, OUTPUT_DIR / "llm_input.jsonl"),
+        daemon=True
+    )
+    input_writer.start()
+    
+    # LLM处理步骤，先对prompt进行文本归一化，再调用大语言模型
+    model_invoker = NormalizedModelInvoker(
+        model="gpt-3.5-turbo",
+        api_key=api_key,
+        prompt_field="prompt",
+        response_field="response",
+        system_prompt="你是一个友好的AI助手，专长于解释技术概念。请用简洁清晰的语言回答问题。",
+        max_tokens=500,
+        temperature=0.7
+    )
     
     # 创建处理管道
     pipeline = Pipeline([
-        # 文本归一化步骤，清理和格式化文本
-        TextNormalizer(text_fields=["prompt"]),
-        
-        # LLM处理步骤，使用ModelInvoker调用大语言模型
-        ModelInvoker(
-            model="gpt-3.5-turbo",
-            api_key=api_key,
-            prompt_field="prompt",
-            response_field="response",
-            system_prompt="你是一个友好的AI助手，专长于解释技术概念。请用简洁清晰的语言回答问题。",
-            max_tokens=500,
-            temperature=0.7
-        ),
+        model_invoker,
         
         # 保存处理结果
-        JsonSaver("examples/output/llm_output.jsonl")
+        JsonSaver(str(OUTPUT_DIR / "llm_output.jsonl"))
     ])
     
     # 处理示例数据
     print("\n=== JSONFlow LLM Pipeline示例 ===")
     results = []
     
-    # 从保存的文件加载数据并处理
-    json_loader = JsonLoader("examples/output/llm_input.jsonl")
-    
-    for item in json_loader:
+    # 数据已在内存中，直接处理，无需先写文件再读回
+    for item in sample_data:
         print(f"\n处理 {item['id']}...")
         try:
             # 处理单个项目
@@ -103,8 +118,11 @@ def main():
 
     # 演示批量处理
     print("\n=== 演示批量处理 ===")
-    batch_results = pipeline.process(sample_data)
+    # 将列表直接交给模型操作符，多个请求会并发发送
+    batch_results = model_invoker.process(sample_data)
     print(f"批量处理完成，处理了 {len(batch_results)} 个项目")
+    
+    input_writer.join()
 
 
 if __name__ == "__main__":
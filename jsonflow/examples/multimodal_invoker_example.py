@@ -9,11 +9,60 @@
 
 import os
 import json
-import base64
-from typing import Dict, Any, List
+import time
+import random
+import asyncio
+import threading
+import concurrent.futures
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterator
 from jsonflow.operators.model import ModelInvoker
 from jsonflow.core import Pipeline
 from jsonflow.io import JsonLoader, JsonSaver
+from jsonflow.utils import get_logger, LLMCache
+from jsonflow.utils.image import encode_image, is_image_url
+from jsonflow.utils.http import get_http_client
+from jsonflow.utils.fast_json import loads, dumps_line
+
+# 获取日志记录器
+logger = get_logger("multimodal_invoker_example")
+
+
+# 示例数据和输出目录
+DATA_DIR = Path("examples/data")
+OUTPUT_DIR = Path("examples/output")
+
+# Batch API任务的终止状态
+_BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# 可以重试的OpenAI异常：速率限制、超时、连接错误和服务端错误
+_RETRYABLE_ERROR_NAMES = ("RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError")
+
+
+def _retryable_errors() -> Tuple[type, ...]:
+    """
+    获取当前openai SDK中可以重试的异常类型
+    
+    Returns:
+        tuple: 异常类型
+    """
+    import openai
+    return tuple(getattr(openai, name) for name in _RETRYABLE_ERROR_NAMES if hasattr(openai, name))
+
+
+def _backoff_delay(attempt: int, min_delay: float = 1.0, max_delay: float = 20.0) -> float:
+    """
+    计算带随机抖动的指数退避等待时间
+    
+    Args:
+        attempt: 已失败的次数减一（从0开始）
+        min_delay: 最短等待时间（秒）
+        max_delay: 最长等待时间（秒）
+        
+    Returns:
+        float: 等待时间（秒）
+    """
+    return max(min_delay, random.uniform(0, min(max_delay, min_delay * 2 ** attempt)))
 
 
 class MultimodalInvoker(ModelInvoker):
@@ -24,86 +73,602 @@ class MultimodalInvoker(ModelInvoker):
                  text_field: str = "text",
                  image_field: str = "image_path",
                  response_field: str = "response",
+                 image_detail: Optional[str] = None,
+                 concurrency: int = 10,
+                 stream: bool = False,
+                 max_attempts: int = 3,
+                 inplace: bool = False,
+                 use_batch_api: bool = False,
+                 batch_timeout: float = 86400,
                  **kwargs):
         super().__init__(model=model, **kwargs)
         self.text_field = text_field
         self.image_field = image_field
         self.response_field = response_field
+        # 图像细节级别（"low"/"high"/"auto"），为None时使用服务端默认值
+        self.image_detail = image_detail
+        # 批量处理时同时进行的最大请求数，避免超出服务商的速率限制
+        self.concurrency = concurrency
+        # 是否以流式方式接收模型响应
+        self.stream = stream
+        # 遇到速率限制等临时错误时的最大尝试次数
+        self.max_attempts = max_attempts
+        # 是否直接在输入数据上写入响应而不复制，仅在调用方不再需要原始输入时使用
+        self.inplace = inplace
+        # 是否通过OpenAI Batch API提交确定性的批量请求（费用更低，但需要等待任务完成）
+        self.use_batch_api = use_batch_api
+        # 等待Batch API任务完成的最长时间（秒）
+        self.batch_timeout = batch_timeout
+        # 系统消息对所有请求相同，只构建一次
+        self._system_message = {
+            "role": "system",
+            "content": self.system_prompt or "You are a helpful assistant."
+        }
+        # 除消息外的请求参数对所有请求相同，只构建一次
+        self._base_params = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            **self.model_params
+        }
+        # OpenAI客户端在首次调用时创建，创建参数只构建一次；
+        # 重试由_create_completion统一处理，关闭SDK自带的重试以免重试次数叠加
+        self._client_params = {"api_key": self.api_key, "max_retries": 0}
+        if self.base_url:
+            self._client_params["base_url"] = self.base_url
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._async_client = None
     
-    def process(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
+    def close(self) -> None:
         """
-        处理包含文本和图像输入的请求
+        关闭HTTP会话并释放OpenAI客户端
+        """
+        super().close()
+        # 同步客户端使用共享的HTTP连接池，只释放引用，不关闭连接池
+        self._client = None
+    
+    def _get_client(self):
+        """
+        获取OpenAI客户端，首次使用时创建，之后的调用复用同一个客户端
+        
+        客户端使用进程内共享的httpx.Client，多个操作符实例共享同一个连接池。
+        
+        Returns:
+            openai.OpenAI: OpenAI客户端
+        """
+        if self._client is None:
+            # process_parallel的多个线程可能同时首次调用，只创建一个客户端
+            with self._client_lock:
+                if self._client is None:
+                    import openai
+                    self._client = openai.OpenAI(http_client=get_http_client(), **self._client_params)
+        return self._client
+    
+    def _get_async_client(self):
+        """
+        获取异步OpenAI客户端，首次使用时创建，同一事件循环中的请求共享其连接池
+        
+        异步客户端的连接绑定在创建它的事件循环上，事件循环结束前需要调用_aclose_async_client关闭。
+        
+        Returns:
+            openai.AsyncOpenAI: 异步OpenAI客户端
+        """
+        if self._async_client is None:
+            import openai
+            self._async_client = openai.AsyncOpenAI(**self._client_params)
+        return self._async_client
+    
+    async def _aclose_async_client(self) -> None:
+        """
+        关闭异步OpenAI客户端，之后的调用会重新创建客户端
+        """
+        if self._async_client is not None:
+            client, self._async_client = self._async_client, None
+            await client.close()
+    
+    def _build_messages(self, text: str, image_url: str) -> List[Dict[str, Any]]:
+        """
+        构建多模态消息，复用预先构建的系统消息
+        
+        Args:
+            text: 用户文本
+            image_url: 图像URL（http(s) URL或data URL）
+            
+        Returns:
+            list: 消息列表
+        """
+        image_url_part = {"url": image_url}
+        if self.image_detail:
+            image_url_part["detail"] = self.image_detail
+        return [
+            self._system_message,
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": text},
+                    {"type": "image_url", "image_url": image_url_part}
+                ]
+            }
+        ]
+    
+    def _encode_image(self, image_path: str) -> Tuple[str, str]:
+        """
+        读取并编码图像，同一图像在多条数据中重复出现时只编码一次
+        
+        Args:
+            image_path: 图像文件路径
+            
+        Returns:
+            tuple: (MIME类型, base64编码的图像数据)
+        """
+        return encode_image(image_path)
+    
+    def _prepare_request(self, json_data: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]], bool]]:
+        """
+        为单条数据准备结果对象和请求消息
         
         Args:
             json_data: 包含文本和图像路径的JSON数据
             
         Returns:
-            dict: 添加了模型响应的JSON数据
+            tuple: (结果对象, 消息列表, 是否包含图像)，数据缺少所需字段时返回None
         """
         if not json_data:
-            return json_data
+            return None
             
         # 如果没有指定的字段，保持原样返回
         if self.text_field not in json_data or self.image_field not in json_data:
-            return json_data
+            return None
             
-        result = json_data.copy()
+        # inplace时直接修改输入，避免每条数据复制一次顶层dict
+        result = json_data if self.inplace else json_data.copy()
         
         # 获取文本和图像路径
         text = result[self.text_field]
         image_path = result[self.image_field]
         
+        # 已经是URL的图像直接传给模型，不需要读取和编码
+        if is_image_url(image_path):
+            return result, self._build_messages(text, image_path), True
+        
         # 读取并编码图像
         try:
-            with open(image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+            mime_type, image_data = self._encode_image(image_path)
         except Exception as e:
-            print(f"Error reading image: {e}")
+            logger.warning("Error reading image %s: %s", image_path, e)
             # 如果图像读取失败，使用纯文本请求
             messages = [
-                {"role": "system", "content": self.system_prompt or "You are a helpful assistant."},
+                self._system_message,
                 {"role": "user", "content": f"[图像读取失败] {text}"}
             ]
-            response = self.call_llm(messages)
-            result[self.response_field] = response
-            return result
+            return result, messages, False
         
         # 构建多模态消息
-        messages = [
-            {"role": "system", "content": self.system_prompt or "You are a helpful assistant."},
-            {
-                "role": "user", 
-                "content": [
-                    {"type": "text", "text": text},
-                    {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{image_data}"}}
-                ]
-            }
-        ]
+        return result, self._build_messages(text, f"data:{mime_type};base64,{image_data}"), True
+    
+    def _completion_params(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        构建Chat Completions请求参数
+        
+        Args:
+            messages: 消息列表
+            
+        Returns:
+            dict: 请求参数
+        """
+        return {**self._base_params, "messages": messages}
+    
+    def _create_completion(self, **params) -> Any:
+        """
+        发送Chat Completions请求，遇到临时错误时以带抖动的指数退避重试
+        
+        Args:
+            **params: 请求参数
+            
+        Returns:
+            Any: SDK返回的响应对象
+            
+        Raises:
+            Exception: 如果重试次数用尽或遇到不可重试的错误
+        """
+        retryable = _retryable_errors()
+        for attempt in range(self.max_attempts):
+            try:
+                return self._get_client().chat.completions.create(**params)
+            except retryable as e:
+                if attempt + 1 >= self.max_attempts:
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning("Transient model error (attempt %d/%d), retrying in %.1fs: %s",
+                               attempt + 1, self.max_attempts, delay, e)
+                time.sleep(delay)
+    
+    async def _acreate_completion(self, **params) -> Any:
+        """
+        异步发送Chat Completions请求，重试策略与_create_completion相同
+        
+        Args:
+            **params: 请求参数
+            
+        Returns:
+            Any: SDK返回的响应对象
+            
+        Raises:
+            Exception: 如果重试次数用尽或遇到不可重试的错误
+        """
+        retryable = _retryable_errors()
+        for attempt in range(self.max_attempts):
+            try:
+                return await self._get_async_client().chat.completions.create(**params)
+            except retryable as e:
+                if attempt + 1 >= self.max_attempts:
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning("Transient model error (attempt %d/%d), retrying in %.1fs: %s",
+                               attempt + 1, self.max_attempts, delay, e)
+                await asyncio.sleep(delay)
+    
+    def _stream_completion(self, messages: List[Dict[str, Any]]) -> Iterator[str]:
+        """
+        以流式方式调用模型，逐段产出响应文本
+        
+        Args:
+            messages: 消息列表
+            
+        Yields:
+            str: 响应文本片段
+        """
+        response = self._create_completion(stream=True, **self._completion_params(messages))
+        for chunk in response:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+    
+    def _complete(self, messages: List[Dict[str, Any]]) -> str:
+        """
+        调用模型并返回完整的响应文本
+        
+        Args:
+            messages: 消息列表
+            
+        Returns:
+            str: 模型的响应文本
+        """
+        if self.stream:
+            return "".join(self._stream_completion(messages))
+        response = self._create_completion(**self._completion_params(messages))
+        return response.choices[0].message.content
+    
+    async def _acomplete(self, messages: List[Dict[str, Any]]) -> str:
+        """
+        异步调用模型并返回完整的响应文本
+        
+        Args:
+            messages: 消息列表
+            
+        Returns:
+            str: 模型的响应文本
+        """
+        if not self.stream:
+            response = await self._acreate_completion(**self._completion_params(messages))
+            return response.choices[0].message.content
+        
+        parts = []
+        response = await self._acreate_completion(stream=True, **self._completion_params(messages))
+        async for chunk in response:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+        return "".join(parts)
+    
+    def _cache_key(self, messages: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        计算请求的缓存键
+        
+        Args:
+            messages: 消息列表
+            
+        Returns:
+            str: 缓存键，未设置缓存或请求结果不确定时返回None
+        """
+        if self.cache is None:
+            return None
+        return LLMCache.cache_key(
+            self.model, messages, self.temperature, self.max_tokens, self.prompt_version, **self.model_params
+        )
+    
+    def _store_response(self, cache_key: Optional[str], content: str) -> None:
+        """
+        缓存模型的响应
+        
+        Args:
+            cache_key: _cache_key返回的缓存键，为None时不缓存
+            content: 模型的响应文本
+        """
+        if cache_key is not None:
+            self.cache.set(cache_key, content)
+    
+    def process(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        处理包含文本和图像输入的请求
+        
+        Args:
+            json_data: 包含文本和图像路径的JSON数据
+            
+        Returns:
+            dict: 添加了模型响应的JSON数据
+        """
+        if isinstance(json_data, list):
+            return self.process_batch(json_data)
+        
+        request = self._prepare_request(json_data)
+        if request is None:
+            return json_data
+        result, messages, has_image = request
+        
+        if not has_image:
+            result[self.response_field] = self.call_llm(messages)
+            return result
+        
+        # 相同的确定性请求直接使用缓存的响应
+        cache_key = self._cache_key(messages)
+        cached = self.cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            result[self.response_field] = cached
+            return result
         
         # 调用模型
         try:
-            import openai
-            client_kwargs = {"api_key": self.api_key}
-            if self.base_url:
-                client_kwargs["base_url"] = self.base_url
-                
-            client = openai.OpenAI(**client_kwargs)
-            
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                **self.model_params
-            )
-            
-            result[self.response_field] = response.choices[0].message.content
+            result[self.response_field] = self._complete(messages)
+            self._store_response(cache_key, result[self.response_field])
         except Exception as e:
-            print(f"Error calling model: {e}")
+            logger.error("Error calling model: %s", e)
             result[self.response_field] = f"Error: {str(e)}"
         
         return result
-
+    
+    def process_stream(self, json_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        处理单条数据并以流式方式产出模型响应，调用方可以在请求完成前处理已收到的文本
+        
+        Args:
+            json_data: 包含文本和图像路径的JSON数据
+            
+        Yields:
+            str: 响应文本片段，数据缺少所需字段时不产出任何内容
+        """
+        request = self._prepare_request(json_data)
+        if request is None:
+            return
+        _, messages, has_image = request
+        
+        if not has_image:
+            yield self.call_llm(messages)
+            return
+        
+        cache_key = self._cache_key(messages)
+        cached = self.cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            yield cached
+            return
+        
+        parts = []
+        for delta in self._stream_completion(messages):
+            parts.append(delta)
+            yield delta
+        self._store_response(cache_key, "".join(parts))
+    
+    async def aprocess(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        异步处理包含文本和图像输入的请求，使用AsyncOpenAI客户端
+        
+        Args:
+            json_data: 包含文本和图像路径的JSON数据
+            
+        Returns:
+            dict: 添加了模型响应的JSON数据
+        """
+        request = self._prepare_request(json_data)
+        if request is None:
+            return json_data
+        result, messages, has_image = request
+        
+        if not has_image:
+            # 纯文本请求使用同步的call_llm，放到线程中执行以免阻塞事件循环
+            result[self.response_field] = await asyncio.to_thread(self.call_llm, messages)
+            return result
+        
+        cache_key = self._cache_key(messages)
+        cached = self.cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            result[self.response_field] = cached
+            return result
+        
+        try:
+            result[self.response_field] = await self._acomplete(messages)
+            self._store_response(cache_key, result[self.response_field])
+        except Exception as e:
+            logger.error("Error calling model: %s", e)
+            result[self.response_field] = f"Error: {str(e)}"
+        
+        return result
+    
+    async def aprocess_many(self, records: List[Dict[str, Any]], concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        并发处理多条数据，同时进行的请求数不超过concurrency
+        
+        整批数据的耗时接近最慢的一次请求，而不是所有请求耗时之和。
+        
+        Args:
+            records: JSON数据列表
+            concurrency: 最大并发请求数，默认为self.concurrency
+            
+        Returns:
+            list: 处理后的JSON数据列表，顺序与输入一致
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+        
+        async def bounded(record):
+            async with semaphore:
+                return await self.aprocess(record)
+        
+        return await asyncio.gather(*[bounded(record) for record in records])
+    
+    def process_parallel(self, records: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        在线程池中并发调用同步的process处理多条数据
+        
+        适用于无法使用异步客户端的场景。各线程共享同一个OpenAI客户端及其连接池，
+        网络请求期间会释放GIL，网络密集型任务的加速效果与异步方式接近。
+        
+        Args:
+            records: JSON数据列表
+            max_workers: 最大线程数，默认为self.concurrency
+            
+        Returns:
+            list: 处理后的JSON数据列表，顺序与输入一致
+        """
+        if len(records) <= 1:
+            return [self.process(record) for record in records]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or self.concurrency) as executor:
+            return list(executor.map(self.process, records))
+    
+    def _run_batch_job(self, requests_by_id: Dict[str, List[Dict[str, Any]]]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        通过OpenAI Batch API提交一批请求并等待任务完成
+        
+        Args:
+            requests_by_id: custom_id到消息列表的映射
+            
+        Returns:
+            tuple: (custom_id到响应文本的映射, custom_id到错误信息的映射)
+            
+        Raises:
+            TimeoutError: 如果任务在batch_timeout内没有结束
+            RuntimeError: 如果任务失败、过期或被取消
+        """
+        client = self._get_client()
+        body = b"".join(
+            dumps_line({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._completion_params(messages)
+            })
+            for custom_id, messages in requests_by_id.items()
+        )
+        input_file = client.files.create(file=("batch_input.jsonl", body), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("Submitted batch %s with %d requests", batch.id, len(requests_by_id))
+        
+        # 以指数退避轮询任务状态，最长间隔60秒
+        deadline = time.monotonic() + self.batch_timeout
+        delay = 5.0
+        while batch.status not in _BATCH_FINAL_STATUSES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                client.batches.cancel(batch.id)
+                raise TimeoutError(f"Batch {batch.id} did not finish within {self.batch_timeout}s")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 60.0)
+            batch = client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+        
+        responses, errors = {}, {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in client.files.content(file_id).content.splitlines():
+                if not line.strip():
+                    continue
+                item = loads(line)
+                response = item.get("response") or {}
+                if item.get("error") or response.get("status_code") != 200:
+                    error = item.get("error") or response.get("body", {}).get("error")
+                    errors[item["custom_id"]] = f"Error: {error}"
+                else:
+                    responses[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return responses, errors
+    
+    def process_batch_api(self, json_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        通过OpenAI Batch API批量处理数据
+        
+        所有请求写入一个JSONL文件后作为一个任务提交，费用低于实时调用，适合离线处理。
+        已缓存的请求不会重复提交；任务失败时每条数据的响应字段为错误信息。
+        
+        Args:
+            json_data_list: JSON数据列表
+            
+        Returns:
+            list: 处理后的JSON数据列表，顺序与输入一致
+        """
+        results = list(json_data_list)
+        pending = {}
+        for i, json_data in enumerate(json_data_list):
+            request = self._prepare_request(json_data)
+            if request is None:
+                continue
+            result, messages, _ = request
+            results[i] = result
+            cached = self.cache.get(self._cache_key(messages)) if self.cache is not None else None
+            if cached is not None:
+                result[self.response_field] = cached
+            else:
+                pending[str(i)] = messages
+        if not pending:
+            return results
+        
+        try:
+            responses, errors = self._run_batch_job(pending)
+            default = "Error: missing batch output"
+        except Exception as e:
+            logger.error("Error running batch job: %s", e)
+            responses, errors = {}, {}
+            default = f"Error: {str(e)}"
+        
+        for custom_id, messages in pending.items():
+            result = results[int(custom_id)]
+            if custom_id in responses:
+                result[self.response_field] = responses[custom_id]
+                self._store_response(self._cache_key(messages), responses[custom_id])
+            else:
+                result[self.response_field] = errors.get(custom_id, default)
+        return results
+    
+    def process_batch(self, json_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        批量处理数据，在事件循环中并发发送请求
+        
+        设置use_batch_api且请求是确定性的（temperature为0、非流式）时，改为通过Batch API提交。
+        
+        Args:
+            json_data_list: JSON数据列表
+            
+        Returns:
+            list: 处理后的JSON数据列表，顺序与输入一致
+        """
+        if not json_data_list:
+            return []
+        if self.use_batch_api and self.temperature == 0 and not self.stream:
+            return self.process_batch_api(json_data_list)
+        
+        async def run():
+            try:
+                return await self.aprocess_many(json_data_list)
+            finally:
+                # asyncio.run结束时事件循环随之关闭，异步客户端不能留到下一批使用
+                await self._aclose_async_client()
+        
+        return asyncio.run(run())
 
 def main():
     """
@@ -137,11 +702,11 @@ def main():
     ]
     
     # 确保数据目录存在
-    os.makedirs("examples/data", exist_ok=True)
-    os.makedirs("examples/output", exist_ok=True)
+    for directory in (DATA_DIR, OUTPUT_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
     
     # 如果示例图片不存在，提示用户
-    if not os.path.exists("examples/data/sample_image1.jpg"):
+    if not (DATA_DIR / "sample_image1.jpg").exists():
         print("警告: 示例图片不存在。请将图片放置在 examples/data/ 目录下，并命名为 sample_image1.jpg 和 sample_chart.png。")
         print("或者修改示例数据中的 image_path 字段指向实际图片。")
     
@@ -154,22 +719,20 @@ def main():
             image_field="image_path",
             response_field="analysis",
             system_prompt="你是一个专业的图像分析助手，善于描述图像内容并提供见解。"
-        ),
-        JsonSaver("examples/output/multimodal_results.jsonl")
+        )
     ])
     
-    # 处理样本数据
+    # 处理样本数据，整批数据的请求并发发送
     print("\n=== JSONFlow 多模态模型示例 ===")
-    results = []
-    
-    for item in sample_data:
-        print(f"\n处理 {item['id']}...")
-        try:
-            result = pipeline.process(item)
-            print(f"✓ 分析完成")
-            results.append(result)
-        except Exception as e:
-            print(f"✗ 处理失败: {e}")
+    print(f"\n处理 {len(sample_data)} 条数据...")
+    try:
+        results = pipeline.process_batch(sample_data)
+        print(f"✓ 分析完成")
+    except Exception as e:
+        print(f"✗ 处理失败: {e}")
+        results = []
+    else:
+        JsonSaver.to_file(str(OUTPUT_DIR / "multimodal_results.jsonl"), results)
     
     # 显示结果
     print("\n=== 处理结果 ===")
@@ -47,11 +47,11 @@ def main():
     # 示例1: 使用表达式操作符进行基本计算和字符串处理
     logger.info("\n--- 示例1: 基本计算和字符串处理 ---")
     expr_op = JsonExpressionOperator({
-        # Lambda函数简单明了
-        "total_amount": lambda d: sum(order["price"] * order["quantity"] for order in d["orders"]),
+        # 内置聚合函数，对数组中的字段求乘积和
+        "total_amount": JsonExpressionOperator.aggregate("orders", "sum_product", ("price", "quantity")),
         
-        # 格式化表达
-        "summary": lambda d: f"{d['profile']['name']}的订单总金额为¥{sum(o['price'] * o['quantity'] for o in d['orders']):.2f}",
+        # 格式化表达，直接使用上面计算好的total_amount
+        "summary": lambda d: f"{d['profile']['name']}的订单总金额为¥{d['total_amount']:.2f}",
         
         # 创建新字段
         "profile.greeting": lambda d: f"您好，{d['profile']['name']}！",
@@ -61,7 +61,7 @@ def main():
         
         # 转换类型
         "preferences.receive_emails": lambda d: "是" if d["preferences"]["notifications"] else "否"
-    })
+    }, sequential=True)  # 按顺序求值，后面的表达式可以使用前面的结果
     
     # 处理数据
     result1 = expr_op.process(data)
@@ -96,7 +96,7 @@ def main():
         ],
         
         # 计算派生值
-        "statistics.average_price": lambda d: sum(o["price"] for o in d["orders"]) / len(d["orders"]) if d["orders"] else 0
+        "statistics.average_price": JsonExpressionOperator.aggregate("orders", "avg", ("price",))
     })
     
     # 处理数据
@@ -143,7 +143,7 @@ def main():
     pipeline = Pipeline([
         # 第1步: 计算和派生字段
         JsonExpressionOperator({
-            "total_amount": lambda d: sum(order["price"] * order["quantity"] for order in d["orders"]),
+            "total_amount": JsonExpressionOperator.aggregate("orders", "sum_product", ("price", "quantity")),
             "profile.full_info": lambda d: f"{d['profile']['name']} ({d['profile']['email']})"
         }),
         
@@ -9,11 +9,14 @@ from jsonflow.io import JsonLoader, JsonSaver
 from jsonflow.operators.json_ops import TextNormalizer
 from jsonflow.operators.model import ModelInvoker
 from jsonflow.utils import get_logger
-from jsonflow.core import JsonOperator
+from jsonflow.core import JsonOperator, MultiThreadExecutor
 
 # 获取日志记录器
 logger = get_logger("simple_pipeline")
 
+# 每批处理和写入的数据条数
+BATCH_SIZE = 64
+
 # 创建一个模拟模型调用的操作符
 class MockModelOperator(JsonOperator):
     """
@@ -51,13 +54,15 @@ class MockModelOperator(JsonOperator):
         result[self.response_field] = response
         return result
 
-def run_simple_pipeline(input_file="input.jsonl", output_file="output.jsonl"):
+def run_simple_pipeline(input_file="input.jsonl", output_file="output.jsonl", max_workers=None):
     """
     运行一个简单的Pipeline
     
     Args:
         input_file (str): 输入文件路径
         output_file (str): 输出文件路径
+        max_workers (int, optional): 并发处理的线程数，默认为None（按批顺序处理）。
+            Pipeline中包含调用远程模型等IO密集的操作符时，多线程可以重叠等待时间
     """
     logger.info("创建Pipeline...")
     
@@ -79,14 +84,21 @@ def run_simple_pipeline(input_file="input.jsonl", output_file="output.jsonl"):
     # 保存处理结果
     saver = JsonSaver(output_file)
     
-    # 处理每一行JSON数据
     logger.info("开始处理数据...")
     count = 0
-    for json_line in loader:
-        logger.debug(f"处理第 {count + 1} 条数据: {json_line}")
-        result = pipeline.process(json_line)
-        saver.write(result)
-        count += 1
+    with saver:
+        if max_workers:
+            # 多线程逐条处理，结果按输入顺序写入
+            executor = MultiThreadExecutor(pipeline, max_workers=max_workers)
+            for result in executor.execute_iter(loader):
+                saver.write(result)
+                count += 1
+        else:
+            # 按批处理JSON数据，支持批处理的操作符（如ModelInvoker）会并发处理整批数据
+            for batch in loader.load_batch(batch_size=BATCH_SIZE):
+                logger.debug(f"处理第 {count + 1} 到 {count + len(batch)} 条数据")
+                saver.write_many(pipeline.process_batch(batch))
+                count += len(batch)
     
     logger.info(f"处理完成，共处理 {count} 条数据，结果保存到 {output_file}")
 
@@ -96,6 +108,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="运行一个简单的Pipeline处理JSON数据")
     parser.add_argument("--input", default="input.jsonl", help="输入文件路径")
     parser.add_argument("--output", default="output.jsonl", help="输出文件路径")
+    parser.add_argument("--workers", type=int, default=None, help="并发处理的线程数")
     args = parser.parse_args()
     
-    run_simple_pipeline(args.input, args.output) 
\ No newline at end of file
+    run_simple_pipeline(args.input, args.output, args.workers) 
\ No newline at end of file
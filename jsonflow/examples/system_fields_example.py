@@ -28,14 +28,17 @@ def run_system_fields_example():
     # 保存处理结果
     saver = JsonSaver("output.jsonl")
     
-    # 处理每一行JSON数据
-    for json_line in loader:
-        # 直接使用SystemField工具类添加自定义字段
-        json_line = SystemField.add_custom_field(json_line, 'source', 'example')
-        
-        # 通过管道处理数据
-        result = pipeline.process(json_line)
-        saver.write(result)
+    # 按批处理JSON数据，每批结果一次性写入
+    with saver:
+        for batch in loader.load_batch(batch_size=64):
+            results = []
+            for json_line in batch:
+                # 直接使用SystemField工具类添加自定义字段
+                json_line = SystemField.add_custom_field(json_line, 'source', 'example')
+                
+                # 通过管道处理数据
+                results.append(pipeline.process(json_line))
+            saver.write_many(results)
         
     print("处理完成，已添加系统字段'id'、'timestamp'和'source'")
 
@@ -5,9 +5,15 @@ JSON加载器模块
 """
 
 import json
+import mmap
 import sys
 from typing import Iterator, List, Dict, Any, Optional, Union, Generator
 
+from jsonflow.utils.fast_json import loads
+
+# 读取文件时使用的缓冲区大小
+_READ_BUFFER_SIZE = 1 << 20
+
 class JsonLoader:
     """
     从文件或标准输入加载JSON数据
@@ -15,14 +21,17 @@ class JsonLoader:
     支持从文件或标准输入逐行加载JSON数据，也支持一次性加载所有数据或批量加载。
     """
     
-    def __init__(self, source: Optional[str] = None):
+    def __init__(self, source: Optional[str] = None, use_mmap: bool = True):
         """
         初始化JsonLoader
         
         Args:
             source (str, optional): 数据源，文件路径或None表示从stdin读取
+            use_mmap (bool): 读取文件时是否使用内存映射按行切分，默认为True。
+                文件为空或无法映射（如管道）时自动回退为普通读取
         """
         self.source = source
+        self.use_mmap = use_mmap
     
     def load(self) -> List[Dict[str, Any]]:
         """
@@ -66,16 +75,56 @@ class JsonLoader:
             json.JSONDecodeError: 如果JSON解析失败
         """
         if self.source is None:
-            # 从标准输入读取
-            for line in sys.stdin:
-                if line.strip():
-                    yield json.loads(line)
+            # 从标准输入读取，优先读取字节流以省去解码
+            stream = getattr(sys.stdin, 'buffer', sys.stdin)
+            for line in stream:
+                if not line.isspace():
+                    yield loads(line)
         else:
-            # 从文件读取
-            with open(self.source, 'r', encoding='utf-8') as f:
+            # 以二进制模式和较大的缓冲区读取文件，直接解析字节
+            with open(self.source, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+                if self.use_mmap:
+                    try:
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (ValueError, OSError):
+                        # 空文件或不支持映射的文件，回退为逐行读取
+                        mm = None
+                    if mm is not None:
+                        with mm:
+                            yield from self._iter_mapped(mm)
+                        return
+                
                 for line in f:
-                    if line.strip():
-                        yield json.loads(line)
+                    if not line.isspace():
+                        yield loads(line)
+    
+    @staticmethod
+    def _iter_mapped(mm: mmap.mmap, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        在内存映射的文件内容上按换行符切分并解析JSON
+        
+        使用find查找换行符，避免逐行readline的开销。
+        
+        Args:
+            mm (mmap.mmap): 内存映射的文件内容
+            start (int): 开始位置，必须是某一行的开头，默认为0
+            stop (int, optional): 只解析从此位置之前开始的行，默认为None（直到文件末尾）。
+                跨过stop的最后一行会被完整解析
+            
+        Yields:
+            dict: 每一行解析后的JSON数据
+        """
+        size = len(mm)
+        if stop is None or stop > size:
+            stop = size
+        while start < stop:
+            end = mm.find(b'\n', start)
+            if end < 0:
+                end = size
+            line = mm[start:end]
+            if line and not line.isspace():
+                yield loads(line)
+            start = end + 1
     
     @classmethod
     def from_file(cls, file_path: str) -> 'JsonLoader':
@@ -114,7 +163,7 @@ class JsonLoader:
         Raises:
             json.JSONDecodeError: 如果JSON解析失败
         """
-        return json.loads(json_string)
+        return loads(json_string)
     
     @classmethod
     def from_json_strings(cls, json_strings: List[str]) -> List[Dict[str, Any]]:
@@ -130,4 +179,23 @@ class JsonLoader:
         Raises:
             json.JSONDecodeError: 如果任何JSON解析失败
         """
-        return [json.loads(s) for s in json_strings if s.strip()] 
\ No newline at end of file
+        # 用isspace判断空白字符串，不需要像strip那样创建新字符串
+        return [loads(s) for s in json_strings if s and not s.isspace()]
+    
+    @classmethod
+    def from_json_bytes_list(cls, json_bytes_list: List[bytes]) -> List[Dict[str, Any]]:
+        """
+        从多个UTF-8编码的JSON字节串解析多个JSON对象
+        
+        适用于已经持有字节数据的调用方（如网络读取的结果），无需先解码为字符串。
+        
+        Args:
+            json_bytes_list (list): JSON字节串列表
+            
+        Returns:
+            list: 解析后的JSON数据列表
+            
+        Raises:
+            json.JSONDecodeError: 如果任何JSON解析失败
+        """
+        return [loads(b) for b in json_bytes_list if b and not b.isspace()]
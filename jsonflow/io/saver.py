@@ -6,7 +6,12 @@ JSON保存器模块
 
 import json
 import sys
-from typing import List, Dict, Any, Optional, Union, TextIO
+from typing import List, Dict, Any, Optional, Union, TextIO, Iterable
+
+from jsonflow.utils.fast_json import dumps_line
+
+# 写文件时使用的缓冲区大小
+_WRITE_BUFFER_SIZE = 1 << 20
 
 class JsonSaver:
     """
@@ -33,7 +38,7 @@ class JsonSaver:
             JsonSaver: self
         """
         if self.destination is not None:
-            self._file = open(self.destination, 'w', encoding='utf-8')
+            self._file = open(self.destination, 'wb', buffering=_WRITE_BUFFER_SIZE)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -54,8 +59,7 @@ class JsonSaver:
             json_data (dict or list): 要写入的JSON数据，可以是单个对象或列表
         """
         if isinstance(json_data, list):
-            for item in json_data:
-                self.write_item(item)
+            self.write_many(json_data)
         else:
             self.write_item(json_data)
     
@@ -66,18 +70,49 @@ class JsonSaver:
         Args:
             json_data (dict): 要写入的单个JSON数据
         """
-        json_str = json.dumps(json_data, ensure_ascii=False)
+        self._write_bytes(dumps_line(json_data))
+    
+    def write_many(self, json_data_list: Iterable[Dict[str, Any]]) -> None:
+        """
+        批量写入多个JSON数据
+        
+        写入文件时各行直接写入文件缓冲区，不再拼接成一个完整的字节串。
+        
+        Args:
+            json_data_list (iterable): 要写入的JSON数据，每个元素写为一行
+        """
+        lines = [dumps_line(item) for item in json_data_list]
+        if not lines:
+            return
+        
+        if self.destination is None:
+            # 输出到标准输出
+            sys.stdout.write(b''.join(lines).decode('utf-8'))
+        elif self._file is None:
+            # 未打开文件时以追加方式写入，由文件缓冲区合并成少量系统调用
+            with open(self.destination, 'ab', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.writelines(lines)
+        else:
+            self._file.writelines(lines)
+    
+    def _write_bytes(self, data: bytes) -> None:
+        """
+        写入已编码的JSON行
+        
+        在上下文管理器中写入时数据先进入缓冲区，退出时统一落盘。
+        
+        Args:
+            data (bytes): UTF-8编码的JSON行
+        """
         if self.destination is None:
             # 输出到标准输出
-            print(json_str)
+            sys.stdout.write(data.decode('utf-8'))
+        elif self._file is None:
+            # 未打开文件时以追加方式写入
+            with open(self.destination, 'ab') as f:
+                f.write(data)
         else:
-            # 输出到文件
-            if self._file is None:
-                with open(self.destination, 'a', encoding='utf-8') as f:
-                    f.write(json_str + '\n')
-            else:
-                self._file.write(json_str + '\n')
-                self._file.flush()
+            self._file.write(data)
     
     def write_all(self, json_data_list: List[Union[Dict[str, Any], List[Dict[str, Any]]]]) -> None:
         """
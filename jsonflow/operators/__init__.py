@@ -4,6 +4,50 @@ JSONFlow操作符模块
 包含各种操作符，用于处理JSON数据。
 """
 
-# 导入所有内置操作符
-from jsonflow.operators.json_ops import TextNormalizer, JsonFilter, JsonTransformer
-from jsonflow.operators.model import ModelInvoker 
\ No newline at end of file
+import importlib
+import sys
+
+# 内置操作符名称到所在模块的映射，第一次访问时才导入（PEP 562）
+_EXPORTS = {
+    'TextNormalizer': 'jsonflow.operators.json_ops',
+    'JsonFilter': 'jsonflow.operators.json_ops',
+    'JsonTransformer': 'jsonflow.operators.json_ops',
+    'ModelInvoker': 'jsonflow.operators.model',
+}
+
+# 导出所有内置操作符
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """
+    按需导入内置操作符
+
+    Args:
+        name (str): 属性名称
+
+    Returns:
+        type: 操作符类
+
+    Raises:
+        AttributeError: 如果不是本模块导出的操作符
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """
+    列出模块属性，包括尚未导入的操作符
+
+    Returns:
+        list: 属性名称列表
+    """
+    return sorted(set(globals()) | set(_EXPORTS))
+
+if sys.version_info < (3, 7):
+    # Python 3.7之前不支持模块级__getattr__，直接导入全部操作符
+    for _name in _EXPORTS:
+        __getattr__(_name)
@@ -2,62 +2,74 @@
 JSON操作符模块
 
 该模块包含各种用于处理JSON数据的操作符。
+
+操作符在第一次被访问时才导入其所在的模块（PEP 562），只用到部分操作符的脚本
+不需要导入全部操作符模块。
 """
 
-# 导入所有JSON操作相关的操作符
-from jsonflow.operators.json_ops.text_normalizer import TextNormalizer
-from jsonflow.operators.json_ops.json_filter import JsonFilter
-from jsonflow.operators.json_ops.json_transformer import JsonTransformer
-from jsonflow.operators.json_ops.json_field_ops import (
-    JsonFieldSelector,
-    JsonPathOperator,
-    JsonPathExtractor,
-    JsonPathUpdater,
-    JsonPathRemover,
-    JsonStringOperator,
-    JsonStructureExtractor,
-    JsonArrayOperator,
-    JsonMerger
-)
-from jsonflow.operators.json_ops.json_expr_ops import (
-    JsonExpressionOperator,
-    JsonFieldMapper,
-    JsonTemplateOperator
-)
-from jsonflow.operators.json_ops.system_field_ops import (
-    IdAdder, 
-    TimestampAdder, 
-    DateTimeAdder, 
-    CustomFieldAdder, 
-    FieldRemover
-)
-from jsonflow.operators.json_ops.collection_ops import (
-    JsonSplitter,
-    JsonAggregator
-)
+import importlib
+import sys
+
+# 操作符名称到所在模块的映射
+_EXPORTS = {
+    'TextNormalizer': 'jsonflow.operators.json_ops.text_normalizer',
+    'JsonFilter': 'jsonflow.operators.json_ops.json_filter',
+    'JsonTransformer': 'jsonflow.operators.json_ops.json_transformer',
+    'JsonFieldSelector': 'jsonflow.operators.json_ops.json_field_ops',
+    'JsonPathOperator': 'jsonflow.operators.json_ops.json_field_ops',
+    'JsonPathExtractor': 'jsonflow.operators.json_ops.json_field_ops',
+    'JsonPathUpdater': 'jsonflow.operators.json_ops.json_field_ops',
+    'JsonPathRemover': 'jsonflow.operators.json_ops.json_field_ops',
+    'JsonStringOperator': 'jsonflow.operators.json_ops.json_field_ops',
+    'JsonStructureExtractor': 'jsonflow.operators.json_ops.json_field_ops',
+    'JsonArrayOperator': 'jsonflow.operators.json_ops.json_field_ops',
+    'JsonMerger': 'jsonflow.operators.json_ops.json_field_ops',
+    'JsonExpressionOperator': 'jsonflow.operators.json_ops.json_expr_ops',
+    'JsonFieldMapper': 'jsonflow.operators.json_ops.json_expr_ops',
+    'JsonTemplateOperator': 'jsonflow.operators.json_ops.json_expr_ops',
+    'IdAdder': 'jsonflow.operators.json_ops.system_field_ops',
+    'TimestampAdder': 'jsonflow.operators.json_ops.system_field_ops',
+    'DateTimeAdder': 'jsonflow.operators.json_ops.system_field_ops',
+    'CustomFieldAdder': 'jsonflow.operators.json_ops.system_field_ops',
+    'FieldRemover': 'jsonflow.operators.json_ops.system_field_ops',
+    'JsonSplitter': 'jsonflow.operators.json_ops.collection_ops',
+    'JsonAggregator': 'jsonflow.operators.json_ops.collection_ops',
+}
 
 # 导出所有操作符
-__all__ = [
-    'TextNormalizer',
-    'JsonFilter',
-    'JsonTransformer',
-    'JsonFieldSelector',
-    'JsonPathOperator',
-    'JsonPathExtractor',
-    'JsonPathUpdater',
-    'JsonPathRemover',
-    'JsonStringOperator',
-    'JsonStructureExtractor',
-    'JsonArrayOperator',
-    'JsonMerger',
-    'JsonExpressionOperator',
-    'JsonFieldMapper',
-    'JsonTemplateOperator',
-    'IdAdder',
-    'TimestampAdder',
-    'DateTimeAdder',
-    'CustomFieldAdder',
-    'FieldRemover',
-    'JsonSplitter',
-    'JsonAggregator'
-] 
\ No newline at end of file
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """
+    按需导入操作符
+
+    Args:
+        name (str): 属性名称
+
+    Returns:
+        type: 操作符类
+
+    Raises:
+        AttributeError: 如果不是本模块导出的操作符
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # 缓存到模块命名空间，之后的访问不再经过__getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """
+    列出模块属性，包括尚未导入的操作符
+
+    Returns:
+        list: 属性名称列表
+    """
+    return sorted(set(globals()) | set(_EXPORTS))
+
+if sys.version_info < (3, 7):
+    # Python 3.7之前不支持模块级__getattr__，直接导入全部操作符
+    for _name in _EXPORTS:
+        __getattr__(_name)
@@ -27,6 +27,8 @@ class JsonSplitter(JsonOperator):
         self.split_field = split_field
         self.output_key_map = output_key_map or {}
         self.keep_original = keep_original
+        # 没有字段映射时相当于把拆分字段映射到同名字段
+        self._key_map_items = tuple(self.output_key_map.items()) or ((split_field, split_field),)
     
     def process_item(self, json_data):
         """
@@ -43,32 +45,45 @@ class JsonSplitter(JsonOperator):
             return [json_data]
         
         split_values = json_data[self.split_field]
-        results = []
         
-        for value in split_values:
-            # 创建新对象
-            if self.keep_original:
-                # 保留原始字段
-                new_obj = json_data.copy()
-                # 移除要拆分的字段，避免再次拆分
-                new_obj.pop(self.split_field, None)
-            else:
-                # 不保留原始字段，创建空对象
-                new_obj = {}
-            
-            # 设置拆分后的值
-            if self.output_key_map:
-                # 使用字段映射
-                for orig_key, new_key in self.output_key_map.items():
-                    if orig_key == self.split_field:
-                        new_obj[new_key] = value
-                    elif orig_key in json_data:
-                        new_obj[new_key] = json_data[orig_key]
-            else:
-                # 没有字段映射，直接使用拆分字段
-                new_obj[self.split_field] = value
-            
-            results.append(new_obj)
+        # 除拆分值以外的字段对所有拆分结果都相同，先构建一次模板，每个拆分值只需复制模板
+        if self.keep_original:
+            # 保留原始字段，移除要拆分的字段，避免再次拆分
+            template = json_data.copy()
+            del template[self.split_field]
+        else:
+            template = {}
+        # 需要写入拆分值的字段，按映射顺序后写入的值覆盖先写入的值
+        split_keys = []
+        for orig_key, new_key in self._key_map_items:
+            if orig_key == self.split_field:
+                template[new_key] = None
+                if new_key not in split_keys:
+                    split_keys.append(new_key)
+            elif orig_key in json_data:
+                template[new_key] = json_data[orig_key]
+                if new_key in split_keys:
+                    split_keys.remove(new_key)
+        
+        if len(template) == 1 and len(split_keys) == 1:
+            # 拆分结果只包含拆分值时直接构建单字段的对象
+            key = split_keys[0]
+            return [{key: value} for value in split_values]
+        
+        results = []
+        append = results.append
+        if len(split_keys) == 1:
+            key = split_keys[0]
+            for value in split_values:
+                new_obj = template.copy()
+                new_obj[key] = value
+                append(new_obj)
+        else:
+            for value in split_values:
+                new_obj = template.copy()
+                for key in split_keys:
+                    new_obj[key] = value
+                append(new_obj)
         
         return results
 
@@ -4,11 +4,193 @@ JSON表达式操作符模块
 该模块提供了使用Python表达式和函数更简洁地操作JSON数据的操作符。
 """
 
-from typing import Dict, Any, List, Optional, Union, Callable, Set
+from typing import Dict, Any, List, Optional, Union, Callable, Set, Tuple
 import re
+import functools
 import operator as op
 
 from jsonflow.core import JsonOperator
+from jsonflow.utils.logger import get_logger
+
+_logger = get_logger("json_expr_ops")
+
+# 模板中字段引用的模式，如 {user.name} 或 {user.name|upper}
+_TEMPLATE_FIELD_RE = re.compile(r'\{([^{}|]+)(?:\|([^{}]+))?\}')
+
+@functools.lru_cache(maxsize=1024)
+def _parse_path(path: str) -> Tuple[Union[str, int], ...]:
+    """
+    将字段路径解析为访问令牌序列
+    
+    字段名解析为字符串令牌，数组索引解析为整数令牌，例如"items[0].name"解析为("items", 0, "name")。
+    
+    Args:
+        path (str): 点号分隔的字段路径，支持数组索引
+        
+    Returns:
+        tuple: 访问令牌序列
+    """
+    tokens = []
+    for part in path.split('.'):
+        if '[' in part and part.endswith(']'):
+            name, rest = part.split('[', 1)
+            indices = rest[:-1].split('][')
+            if all(index.isdigit() for index in indices):
+                if name:
+                    tokens.append(name)
+                tokens.extend(int(index) for index in indices)
+                continue
+        tokens.append(part)
+    return tuple(tokens)
+
+def _get_by_tokens(data: Any, tokens: Tuple[Union[str, int], ...]) -> Any:
+    """
+    按照预先解析的令牌序列获取值
+    
+    Args:
+        data (any): JSON数据
+        tokens (tuple): _parse_path返回的令牌序列
+        
+    Returns:
+        any: 字段值，路径不存在时返回None
+    """
+    value = data
+    for token in tokens:
+        if type(token) is int:
+            if isinstance(value, list) and token < len(value):
+                value = value[token]
+            else:
+                return None
+        elif isinstance(value, dict) and token in value:
+            value = value[token]
+        else:
+            return None
+    return value
+
+@functools.lru_cache(maxsize=1024)
+def _split_target(path: str) -> Tuple[str, ...]:
+    """
+    将目标字段路径按点号切分，结果会被缓存
+    
+    Args:
+        path (str): 点号分隔的目标字段路径
+        
+    Returns:
+        tuple: 字段名序列
+    """
+    return tuple(path.split('.'))
+
+def _set_by_parts(data: Dict[str, Any], parts: Tuple[str, ...], value: Any) -> None:
+    """
+    按照切分后的字段名序列设置嵌套字段的值，缺失或不是字典的中间字段替换为空字典
+    
+    Args:
+        data (dict): 要修改的数据
+        parts (tuple): _split_target返回的字段名序列
+        value (any): 要设置的值
+    """
+    current = data
+    for part in parts[:-1]:
+        child = current.get(part)
+        if not isinstance(child, dict):
+            child = current[part] = {}
+        current = child
+    current[parts[-1]] = value
+
+@functools.lru_cache(maxsize=256)
+def _parse_template(template: str) -> Tuple[Union[str, Tuple[Tuple[Union[str, int], ...], Optional[str]]], ...]:
+    """
+    将模板字符串解析为片段序列
+    
+    Args:
+        template (str): 模板字符串
+        
+    Returns:
+        tuple: 片段序列，字符串片段原样输出，字段引用片段为(路径令牌, 修饰符)
+    """
+    segments = []
+    pos = 0
+    for match in _TEMPLATE_FIELD_RE.finditer(template):
+        if match.start() > pos:
+            segments.append(template[pos:match.start()])
+        modifiers = match.group(2).strip() if match.group(2) else None
+        segments.append((_parse_path(match.group(1).strip()), modifiers))
+        pos = match.end()
+    if pos < len(template):
+        segments.append(template[pos:])
+    return tuple(segments)
+
+# 字符串表达式中的字段引用，如 $.user.name、$.items[0] 或 $["field"]
+_FIELD_REFERENCE_RE = re.compile(
+    r'\$\.\w+(?:\[\d+\])*(?:\.\w+(?:\[\d+\])*)*|\$\[[\'"]([^\'"]+)[\'"]\]'
+)
+
+# 字符串表达式中可以使用的函数
+_SAFE_FUNCTIONS = {
+    "len": len,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+    "sum": sum,
+    "min": min,
+    "max": max,
+    "sorted": sorted,
+    "abs": abs,
+    "round": round,
+    "enumerate": enumerate,
+    "zip": zip,
+    "map": map,
+    "filter": filter,
+    "all": all,
+    "any": any,
+    # 添加一些字符串操作
+    "lower": lambda s: s.lower() if isinstance(s, str) else s,
+    "upper": lambda s: s.upper() if isinstance(s, str) else s,
+    "strip": lambda s: s.strip() if isinstance(s, str) else s,
+    "split": lambda s, sep=" ": s.split(sep) if isinstance(s, str) else [],
+    "join": lambda l, sep="": sep.join(l) if isinstance(l, list) else "",
+    "replace": lambda s, old, new: s.replace(old, new) if isinstance(s, str) else s,
+    "startswith": lambda s, prefix: s.startswith(prefix) if isinstance(s, str) else False,
+    "endswith": lambda s, suffix: s.endswith(suffix) if isinstance(s, str) else False,
+}
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expression: str) -> Tuple[Any, Dict[str, Any]]:
+    """
+    将字符串表达式编译为代码对象
+    
+    表达式中的字段引用被替换为对JSON数据的路径访问，例如"len($.items) > 0"编译为
+    "len(_get(_d, _t0)) > 0"，因此每个表达式只需解析和编译一次。
+    
+    Args:
+        expression (str): 表达式字符串
+        
+    Returns:
+        tuple: (代码对象, 求值时使用的全局命名空间)
+        
+    Raises:
+        SyntaxError: 如果表达式语法错误
+    """
+    namespace = {"__builtins__": {}, "_get": _get_by_tokens}
+    namespace.update(_SAFE_FUNCTIONS)
+    
+    def replace_match(match):
+        ref = match.group(0)
+        if ref.startswith('$['):
+            # 处理 $["field"]
+            tokens = (match.group(1),)
+        else:
+            # 处理 $.field.subfield
+            tokens = _parse_path(ref[2:])
+        name = f"_t{len(namespace)}"
+        namespace[name] = tokens
+        return f"_get(_d, {name})"
+    
+    source = _FIELD_REFERENCE_RE.sub(replace_match, expression)
+    return compile(source, "<expression>", "eval"), namespace
 
 class JsonExpressionOperator(JsonOperator):
     """
@@ -20,7 +202,8 @@ class JsonExpressionOperator(JsonOperator):
     def __init__(self, 
                  expressions: Dict[str, Union[str, Callable]],
                  name: Optional[str] = None,
-                 description: Optional[str] = None):
+                 description: Optional[str] = None,
+                 sequential: bool = False):
         """
         初始化JsonExpressionOperator
         
@@ -30,6 +213,9 @@ class JsonExpressionOperator(JsonOperator):
                 也可以提供一个函数，接收json_data作为参数
             name (str, optional): 操作符名称
             description (str, optional): 操作符描述
+            sequential (bool): 是否按顺序在结果数据上求值，默认为False。
+                为True时后面的表达式可以引用前面表达式写入的字段，
+                多个表达式共用的中间结果只需计算一次
             
         示例:
             expressions = {
@@ -44,6 +230,7 @@ class JsonExpressionOperator(JsonOperator):
             description or "Applies expressions to JSON data"
         )
         self.expressions = expressions
+        self.sequential = sequential
     
     def process(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -59,21 +246,23 @@ class JsonExpressionOperator(JsonOperator):
             return {}
         
         result = json_data.copy()
+        # 顺序求值时表达式读取已写入前面结果的数据
+        source = result if self.sequential else json_data
         
         for target_field, expression in self.expressions.items():
             try:
                 # 处理函数表达式
                 if callable(expression):
-                    value = expression(json_data)
+                    value = expression(source)
                     self._set_nested_value(result, target_field, value)
                     continue
                 
                 # 处理字符串表达式
-                value = self._evaluate_expression(expression, json_data)
+                value = self._evaluate_expression(expression, source)
                 self._set_nested_value(result, target_field, value)
             except Exception as e:
                 # 表达式求值失败时忽略，可以选择记录错误
-                print(f"表达式求值错误(字段: {target_field}): {str(e)}")
+                _logger.warning("表达式求值错误(字段: %s): %s", target_field, e)
                 continue
         
         return result
@@ -89,100 +278,13 @@ class JsonExpressionOperator(JsonOperator):
         Returns:
             any: 表达式求值结果
         """
-        # 替换表达式中的字段引用
-        expr = self._replace_field_references(expression, json_data)
-        
-        # 创建安全的本地环境
-        safe_locals = {
-            "len": len,
-            "str": str,
-            "int": int,
-            "float": float,
-            "bool": bool,
-            "list": list,
-            "dict": dict,
-            "sum": sum,
-            "min": min,
-            "max": max,
-            "sorted": sorted,
-            "abs": abs,
-            "round": round,
-            "enumerate": enumerate,
-            "zip": zip,
-            "map": map,
-            "filter": filter,
-            "all": all,
-            "any": any,
-            # 添加一些字符串操作
-            "lower": lambda s: s.lower() if isinstance(s, str) else s,
-            "upper": lambda s: s.upper() if isinstance(s, str) else s,
-            "strip": lambda s: s.strip() if isinstance(s, str) else s,
-            "split": lambda s, sep=" ": s.split(sep) if isinstance(s, str) else [],
-            "join": lambda l, sep="": sep.join(l) if isinstance(l, list) else "",
-            "replace": lambda s, old, new: s.replace(old, new) if isinstance(s, str) else s,
-            "startswith": lambda s, prefix: s.startswith(prefix) if isinstance(s, str) else False,
-            "endswith": lambda s, suffix: s.endswith(suffix) if isinstance(s, str) else False,
-        }
-        
-        # 使用eval求值表达式
+        # 表达式只在第一次使用时编译，之后直接对新数据求值
         # 注意：在实际生产环境中应该小心使用eval，这里假设表达式是可信的
-        return eval(expr, {"__builtins__": {}}, safe_locals)
-    
-    def _replace_field_references(self, expression: str, json_data: Dict[str, Any]) -> str:
-        """
-        替换表达式中的字段引用
-        
-        Args:
-            expression (str): 表达式字符串
-            json_data (dict): JSON数据
-            
-        Returns:
-            str: 替换后的表达式
-        """
-        # 查找所有字段引用，支持点号路径
-        pattern = r'\$\.[a-zA-Z0-9_.[\]]+|\$\[[\'"]([^\'"]+)[\'"]\]'
-        
-        def replace_match(match):
-            ref = match.group(0)
-            if ref.startswith('$['):
-                # 处理 $["field"]
-                field = ref[3:-2]
-                value = json_data.get(field)
-            else:
-                # 处理 $.field.subfield
-                parts = ref[2:].split('.')
-                value = json_data
-                for part in parts:
-                    if part and '[' in part and ']' in part:
-                        # 处理数组索引，如items[0]
-                        arr_name, idx_str = part.split('[', 1)
-                        idx = int(idx_str.rstrip(']'))
-                        if isinstance(value, dict) and arr_name in value:
-                            arr = value[arr_name]
-                            if isinstance(arr, list) and 0 <= idx < len(arr):
-                                value = arr[idx]
-                            else:
-                                return "None"
-                        else:
-                            return "None"
-                    elif isinstance(value, dict) and part in value:
-                        value = value[part]
-                    else:
-                        return "None"  # 字段不存在
-            
-            # 替换不同类型的值
-            if isinstance(value, str):
-                return f"'{value}'"
-            elif value is None:
-                return "None"
-            elif isinstance(value, (list, dict)):
-                # 对复杂类型使用repr
-                return repr(value)
-            else:
-                # 数字和布尔值
-                return str(value)
-        
-        return re.sub(pattern, replace_match, expression)
+        code, namespace = _compile_expression(expression)
+        # 数据放在全局命名空间中，使表达式内的生成器表达式等嵌套作用域也能访问
+        env = dict(namespace)
+        env["_d"] = json_data
+        return eval(code, env)
     
     def _set_nested_value(self, data: Dict[str, Any], path: str, value: Any) -> None:
         """
@@ -197,20 +299,57 @@ class JsonExpressionOperator(JsonOperator):
             data[path] = value
             return
         
-        parts = path.split('.')
-        current = data
+        _set_by_parts(data, _split_target(path), value)
+    
+    @staticmethod
+    def aggregate(array_path: str,
+                  agg: str = "sum_product",
+                  fields: Tuple[str, ...] = ("price", "quantity")) -> Callable[[Dict[str, Any]], Any]:
+        """
+        创建对数组中对象字段进行聚合计算的表达式函数
         
-        # 创建嵌套结构
-        for part in parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            elif not isinstance(current[part], dict):
-                # 如果不是字典，转换为字典
-                current[part] = {}
-            current = current[part]
+        返回的函数可以直接作为expressions中的值使用。字段访问器在创建时构建，
+        计算时通过map和operator在C层完成循环，比等价的生成器表达式lambda更快。
         
-        # 设置值
-        current[parts[-1]] = value
+        Args:
+            array_path (str): 数组字段路径，例如"orders"或"order.items"
+            agg (str): 聚合方式，支持：
+                "sum": 对fields[0]求和
+                "sum_product": 对fields[0] * fields[1]求和
+                "avg": 对fields[0]求平均值，空数组返回0
+            fields (tuple): 参与计算的字段名
+            
+        Returns:
+            callable: 接收json_data并返回聚合结果的函数，数组不存在时返回0
+            
+        Raises:
+            ValueError: 如果聚合方式不支持或字段数量不足
+            
+        示例:
+            JsonExpressionOperator({
+                "total_amount": JsonExpressionOperator.aggregate("orders", "sum_product", ("price", "quantity"))
+            })
+        """
+        required_fields = {"sum": 1, "avg": 1, "sum_product": 2}
+        if agg not in required_fields:
+            raise ValueError(f"Unsupported aggregation: {agg}")
+        if len(fields) < required_fields[agg]:
+            raise ValueError(f"Aggregation {agg} requires {required_fields[agg]} fields")
+        
+        tokens = _parse_path(array_path)
+        first = op.itemgetter(fields[0])
+        second = op.itemgetter(fields[1]) if agg == "sum_product" else None
+        
+        def aggregator(data):
+            items = _get_by_tokens(data, tokens)
+            if not isinstance(items, list) or not items:
+                return 0
+            if agg == "sum_product":
+                return sum(map(op.mul, map(first, items), map(second, items)))
+            total = sum(map(first, items))
+            return total / len(items) if agg == "avg" else total
+        
+        return aggregator
 
 
 class JsonFieldMapper(JsonExpressionOperator):
@@ -253,18 +392,23 @@ class JsonFieldMapper(JsonExpressionOperator):
                     if field.startswith('.'):
                         field = field[1:]
                     
-                    def array_mapper(data, path=array_path, field_name=field):
-                        array = self._get_by_path(data, path)
+                    # 在初始化时解析路径，处理数据时直接按令牌访问
+                    def array_mapper(data, array_tokens=_parse_path(array_path) if array_path else (),
+                                     field_tokens=_parse_path(field) if field else ()):
+                        array = _get_by_tokens(data, array_tokens)
                         if not isinstance(array, list):
                             return []
-                        if not field_name:
+                        if not field_tokens:
                             return array
-                        return [self._get_by_path(item, field_name) for item in array]
+                        return [_get_by_tokens(item, field_tokens) for item in array]
                     
                     expressions[target] = array_mapper
                 else:
-                    # 简单字段引用
-                    expressions[target] = f"$.{source}"
+                    # 简单字段引用，直接按解析后的路径取值，无需构造和求值表达式
+                    def field_getter(data, tokens=_parse_path(source)):
+                        return _get_by_tokens(data, tokens)
+                    
+                    expressions[target] = field_getter
         
         super().__init__(
             expressions,
@@ -286,16 +430,7 @@ class JsonFieldMapper(JsonExpressionOperator):
         if not path:
             return data
         
-        parts = path.split('.')
-        value = data
-        
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                return None
-        
-        return value
+        return _get_by_tokens(data, _parse_path(path))
 
 
 class JsonTemplateOperator(JsonOperator):
@@ -330,6 +465,10 @@ class JsonTemplateOperator(JsonOperator):
             description or "Applies string templates to JSON data"
         )
         self.templates = templates
+        # 在初始化时将模板编译为渲染函数
+        self._renderers = {
+            target: self._compile_template(template) for target, template in templates.items()
+        }
     
     def process(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -346,16 +485,16 @@ class JsonTemplateOperator(JsonOperator):
         
         result = json_data.copy()
         
-        for target_field, template in self.templates.items():
+        for target_field, render in self._renderers.items():
             try:
-                # 解析模板并替换字段引用
-                value = self._render_template(template, json_data)
+                # 使用预先编译的渲染函数替换字段引用
+                value = render(json_data)
                 
                 # 设置目标字段
                 self._set_nested_value(result, target_field, value)
             except Exception as e:
                 # 模板渲染失败时忽略
-                print(f"模板渲染错误(字段: {target_field}): {str(e)}")
+                _logger.warning("模板渲染错误(字段: %s): %s", target_field, e)
                 continue
         
         return result
@@ -371,23 +510,44 @@ class JsonTemplateOperator(JsonOperator):
         Returns:
             str: 渲染后的字符串
         """
-        # 查找所有字段引用
-        pattern = r'\{([^{}|]+)(?:\|([^{}]+))?\}'
+        return self._compile_template(template)(json_data)
+    
+    def _compile_template(self, template: str) -> Callable[[Dict[str, Any]], str]:
+        """
+        将模板编译为渲染函数
         
-        def replace_field(match):
-            field_path = match.group(1).strip()
-            modifiers = match.group(2).strip() if match.group(2) else None
+        模板被解析为字符串片段和字段引用后，生成形如
+        lambda d: "Hello, " + _s(_get(d, _t1)) + "!" 的表达式并编译，
+        渲染时不再需要解析模板或遍历片段。
+        
+        Args:
+            template (str): 模板字符串
             
-            # 获取字段值
-            value = self._get_by_path(json_data, field_path)
+        Returns:
+            callable: 接收JSON数据并返回渲染结果的函数
+        """
+        namespace = {
+            "_get": _get_by_tokens,
+            "_s": lambda value: "" if value is None else str(value),
+            "_mod": self._apply_modifiers,
+        }
+        parts = []
+        for i, segment in enumerate(_parse_template(template)):
+            if type(segment) is str:
+                # 字符串片段使用repr生成字面量，不会被当作代码执行
+                parts.append(repr(segment))
+                continue
             
-            # 应用修饰符
+            tokens, modifiers = segment
+            namespace[f"_t{i}"] = tokens
+            value_expr = f"_get(d, _t{i})"
             if modifiers:
-                value = self._apply_modifiers(value, modifiers)
-            
-            return str(value) if value is not None else ""
+                namespace[f"_m{i}"] = modifiers
+                value_expr = f"_mod({value_expr}, _m{i})"
+            parts.append(f"_s({value_expr})")
         
-        return re.sub(pattern, replace_field, template)
+        source = "lambda d: " + (" + ".join(parts) if parts else "''")
+        return eval(compile(source, "<template>", "eval"), namespace)
     
     def _get_by_path(self, data: Dict[str, Any], path: str) -> Any:
         """
@@ -400,29 +560,7 @@ class JsonTemplateOperator(JsonOperator):
         Returns:
             any: 字段值
         """
-        parts = path.split('.')
-        value = data
-        
-        for part in parts:
-            if '[' in part and ']' in part:
-                # 处理数组索引
-                name, idx_str = part.split('[', 1)
-                idx = int(idx_str.rstrip(']'))
-                
-                if isinstance(value, dict) and name in value:
-                    array = value[name]
-                    if isinstance(array, list) and 0 <= idx < len(array):
-                        value = array[idx]
-                    else:
-                        return None
-                else:
-                    return None
-            elif isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                return None
-        
-        return value
+        return _get_by_tokens(data, _parse_path(path))
     
     def _apply_modifiers(self, value: Any, modifiers: str) -> Any:
         """
@@ -489,17 +627,4 @@ class JsonTemplateOperator(JsonOperator):
             data[path] = value
             return
         
-        parts = path.split('.')
-        current = data
-        
-        # 创建嵌套结构
-        for part in parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            elif not isinstance(current[part], dict):
-                # 如果不是字典，转换为字典
-                current[part] = {}
-            current = current[part]
-        
-        # 设置值
-        current[parts[-1]] = value 
\ No newline at end of file
+        _set_by_parts(data, _split_target(path), value) 
\ No newline at end of file
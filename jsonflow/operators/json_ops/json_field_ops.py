@@ -8,6 +8,46 @@ from typing import Dict, Any, List, Optional, Union, Callable, Tuple, Set
 
 from jsonflow.core import JsonOperator
 
+# 结构提取时的节点类别
+_OBJECT, _ARRAY, _LEAF = 0, 1, 2
+
+# 常见JSON值类型到节点类别的映射，通过type()查表代替逐个isinstance判断
+_NODE_KINDS = {
+    dict: _OBJECT,
+    list: _ARRAY,
+    str: _LEAF,
+    int: _LEAF,
+    float: _LEAF,
+    bool: _LEAF,
+    type(None): _LEAF,
+}
+
+# 扁平化路径中常见叶子类型的类型后缀，避免每个叶子节点都格式化类型名
+_LEAF_TYPE_SUFFIXES = {
+    leaf_type: f" ({leaf_type.__name__})"
+    for leaf_type in (str, int, float, bool, type(None))
+}
+
+def _node_kind(node: Any) -> int:
+    """
+    获取数据节点的类别，dict和list的子类分别视为对象和数组
+    
+    Args:
+        node (any): 数据节点
+        
+    Returns:
+        int: 节点类别
+    """
+    kind = _NODE_KINDS.get(type(node))
+    if kind is None:
+        if isinstance(node, dict):
+            kind = _OBJECT
+        elif isinstance(node, list):
+            kind = _ARRAY
+        else:
+            kind = _LEAF
+    return kind
+
 class JsonFieldSelector(JsonOperator):
     """
     JSON字段选择操作符
@@ -670,6 +710,7 @@ class JsonStructureExtractor(JsonOperator):
                  include_arrays: bool = True,
                  target_field: str = "structure",
                  flatten: bool = False,
+                 inplace: bool = False,
                  name: Optional[str] = None,
                  description: Optional[str] = None):
         """
@@ -681,6 +722,8 @@ class JsonStructureExtractor(JsonOperator):
             include_arrays (bool): 是否包含数组索引，默认为True
             target_field (str): 存储结构信息的目标字段，默认为"structure"
             flatten (bool): 是否返回扁平化的路径列表而非嵌套结构，默认为False
+            inplace (bool): 是否直接在输入的dict上写入结构信息而不复制，默认为False。
+                仅在调用方不再需要原始输入时使用；只读映射等非dict输入仍会被复制
             name (str, optional): 操作符名称
             description (str, optional): 操作符描述
         """
@@ -693,6 +736,7 @@ class JsonStructureExtractor(JsonOperator):
         self.include_arrays = include_arrays
         self.target_field = target_field
         self.flatten = flatten
+        self.inplace = inplace
     
     def process(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -702,24 +746,31 @@ class JsonStructureExtractor(JsonOperator):
             json_data (dict): 输入的JSON数据
             
         Returns:
-            dict: 添加了结构信息的JSON数据
+            dict: 添加了结构信息的JSON数据，inplace为True时即输入对象本身
         """
-        if not json_data:
+        if self.inplace and isinstance(json_data, dict):
+            # 直接修改输入，避免每条数据复制一次顶层dict
+            result = json_data
+        elif not json_data:
             result = {}
+        else:
+            # 浅拷贝为普通dict，同时支持MappingProxyType等只读映射作为输入，
+            # 嵌套的值与输入共享，不会被修改
+            result = dict(json_data)
+        
+        if not result:
             result[self.target_field] = {} if not self.flatten else []
             return result
         
-        result = json_data.copy()
-        
         # 提取结构
         if self.flatten:
             # 扁平化路径列表
             paths = []
-            self._extract_flat_paths(json_data, "", paths)
+            self._extract_flat_paths(result, "", paths)
             result[self.target_field] = paths
         else:
             # 嵌套结构
-            structure = self._extract_structure(json_data)
+            structure = self._extract_structure(result)
             result[self.target_field] = structure
         
         return result
@@ -728,86 +779,142 @@ class JsonStructureExtractor(JsonOperator):
         """
         提取扁平化的路径列表
         
+        使用显式栈代替递归遍历，路径顺序与深度优先遍历一致。
+        
         Args:
             data (any): 当前数据节点
             current_path (str): 当前路径
             paths (list): 路径列表，用于存储结果
             current_depth (int): 当前深度
         """
-        # 检查深度限制
-        if self.max_depth is not None and current_depth > self.max_depth:
-            return
-        
-        # 处理不同类型的数据
-        if isinstance(data, dict):
-            # 如果是空字典且当前路径不为空，添加当前路径
-            if not data and current_path:
-                path_info = current_path
-                if self.include_types:
-                    path_info = f"{path_info} (object)"
-                paths.append(path_info)
-                return
+        # 循环中频繁使用的属性和方法绑定为局部变量
+        max_depth = self.max_depth
+        include_types = self.include_types
+        include_arrays = self.include_arrays
+        node_kinds_get = _NODE_KINDS.get
+        add_path = paths.append
+        stack = [(data, current_path, current_depth)]
+        push = stack.append
+        pop = stack.pop
+        
+        while stack:
+            node, path, depth = pop()
             
-            # 遍历字典
-            for key, value in data.items():
-                new_path = f"{current_path}.{key}" if current_path else key
-                self._extract_flat_paths(value, new_path, paths, current_depth + 1)
-        
-        elif isinstance(data, list):
-            # 如果是空列表且当前路径不为空，添加当前路径
-            if not data and current_path:
-                path_info = current_path
-                if self.include_types:
-                    path_info = f"{path_info} (array)"
-                paths.append(path_info)
-                return
+            # 检查深度限制
+            if max_depth is not None and depth > max_depth:
+                continue
             
-            # 处理数组
-            if self.include_arrays:
-                for i, item in enumerate(data):
-                    new_path = f"{current_path}[{i}]"
-                    self._extract_flat_paths(item, new_path, paths, current_depth + 1)
-            else:
-                # 只处理第一个元素作为示例
-                if data:
-                    new_path = f"{current_path}[]"
-                    self._extract_flat_paths(data[0], new_path, paths, current_depth + 1)
-        
-        else:
-            # 叶子节点
-            if current_path:
-                path_info = current_path
-                if self.include_types:
-                    type_name = type(data).__name__
-                    path_info = f"{path_info} ({type_name})"
-                paths.append(path_info)
+            # 处理不同类型的数据
+            kind = node_kinds_get(type(node))
+            if kind is None:
+                kind = _node_kind(node)
+            
+            if kind == _OBJECT:
+                # 如果是空字典且当前路径不为空，添加当前路径
+                if not node:
+                    if path:
+                        add_path(path + " (object)" if include_types else path)
+                    continue
+                
+                # 子节点逆序入栈，使出栈顺序与字典顺序一致
+                prefix = path + "." if path else ""
+                child_depth = depth + 1
+                for key, value in reversed(list(node.items())):
+                    push((value, f"{prefix}{key}", child_depth))
+            
+            elif kind == _ARRAY:
+                # 如果是空列表且当前路径不为空，添加当前路径
+                if not node:
+                    if path:
+                        add_path(path + " (array)" if include_types else path)
+                    continue
+                
+                # 处理数组
+                child_depth = depth + 1
+                if include_arrays:
+                    for i in range(len(node) - 1, -1, -1):
+                        push((node[i], f"{path}[{i}]", child_depth))
+                else:
+                    # 只处理第一个元素作为示例
+                    push((node[0], path + "[]", child_depth))
+            
+            elif path:
+                # 叶子节点
+                if include_types:
+                    suffix = _LEAF_TYPE_SUFFIXES.get(type(node))
+                    if suffix is None:
+                        suffix = f" ({type(node).__name__})"
+                    add_path(path + suffix)
+                else:
+                    add_path(path)
     
     def _extract_structure(self, data: Any, current_depth: int = 0) -> Dict[str, Any]:
         """
         提取嵌套结构
         
+        使用显式栈代替递归遍历：先为容器节点创建结果dict，出栈时再填充其子节点。
+        
         Args:
             data (any): 当前数据节点
             current_depth (int): 当前深度
             
+        Returns:
+            dict: 结构信息
+        """
+        # 循环中频繁使用的属性和方法绑定为局部变量
+        new_node = self._new_structure_node
+        include_types = self.include_types
+        stack = []
+        pop = stack.pop
+        root = new_node(data, current_depth, stack)
+        
+        while stack:
+            node, result, depth = pop()
+            child_depth = depth + 1
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    result[key] = new_node(value, child_depth, stack)
+                
+                if include_types:
+                    result["__type__"] = "object"
+            else:
+                for i, item in enumerate(node):
+                    result[f"[{i}]"] = new_node(item, child_depth, stack)
+                
+                if include_types:
+                    result["__type__"] = "array"
+        
+        return root
+    
+    def _new_structure_node(self, data: Any, depth: int, stack: List[Tuple[Any, Dict[str, Any], int]]) -> Dict[str, Any]:
+        """
+        创建单个数据节点的结构信息
+        
+        需要展开子节点的字典和数组会返回空的结果dict，并连同数据一起压入栈中等待填充。
+        
+        Args:
+            data (any): 数据节点
+            depth (int): 节点深度
+            stack (list): 待填充节点栈
+            
         Returns:
             dict: 结构信息
         """
         # 检查深度限制
-        if self.max_depth is not None and current_depth > self.max_depth:
+        if self.max_depth is not None and depth > self.max_depth:
             return {"type": "max_depth_reached"}
         
         # 处理不同类型的数据
-        if isinstance(data, dict):
+        kind = _NODE_KINDS.get(type(data))
+        if kind is None:
+            kind = _node_kind(data)
+        
+        if kind == _OBJECT:
             result = {}
-            for key, value in data.items():
-                result[key] = self._extract_structure(value, current_depth + 1)
-            
-            if self.include_types:
-                result["__type__"] = "object"
+            stack.append((data, result, depth))
             return result
         
-        elif isinstance(data, list):
+        elif kind == _ARRAY:
             if not data:
                 result = {}
                 if self.include_types:
@@ -817,15 +924,11 @@ class JsonStructureExtractor(JsonOperator):
             
             if self.include_arrays:
                 result = {}
-                for i, item in enumerate(data):
-                    result[f"[{i}]"] = self._extract_structure(item, current_depth + 1)
-                
-                if self.include_types:
-                    result["__type__"] = "array"
+                stack.append((data, result, depth))
                 return result
             else:
                 # 只处理第一个元素作为示例
-                result = {"items": self._extract_structure(data[0], current_depth + 1)}
+                result = {"items": self._new_structure_node(data[0], depth + 1, stack)}
                 if self.include_types:
                     result["__type__"] = "array"
                 return result
@@ -835,4 +938,4 @@ class JsonStructureExtractor(JsonOperator):
             if self.include_types:
                 return {"__type__": type(data).__name__, "__value__": str(data)}
             else:
-                return {"__value__": str(data)} 
\ No newline at end of file
+                return {"__value__": str(data)}
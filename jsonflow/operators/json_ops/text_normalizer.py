@@ -9,6 +9,11 @@ from typing import Dict, Any, List, Optional, Union, Callable
 
 from jsonflow.core import JsonOperator
 
+# 匹配连续空白字符，用于合并多余空格
+_WHITESPACE_RE = re.compile(r'\s+')
+# 匹配需要合并的空白：连续空白或非空格的空白字符（如制表符、换行符）
+_NEEDS_COLLAPSE_RE = re.compile(r'\s\s|[^\S ]')
+
 class TextNormalizer(JsonOperator):
     """
     文本规范化操作符
@@ -93,6 +98,18 @@ class TextNormalizer(JsonOperator):
                 elif isinstance(item, (dict, list)):
                     self._normalize_fields(item, path)
     
+    def normalize_text(self, text: str) -> str:
+        """
+        规范化单个文本，供其他操作符直接复用本操作符的规范化规则
+        
+        Args:
+            text (str): 要规范化的文本
+            
+        Returns:
+            str: 规范化后的文本
+        """
+        return self._normalize_text(text)
+    
     def _normalize_text(self, text: str) -> str:
         """
         执行文本规范化
@@ -118,7 +135,8 @@ class TextNormalizer(JsonOperator):
         if self.upper_case:
             result = result.upper()
         
-        if self.remove_extra_spaces:
-            result = re.sub(r'\s+', ' ', result)
+        # 已经规范化的文本（常见情况）只做一次不分配内存的扫描，跳过替换
+        if self.remove_extra_spaces and _NEEDS_COLLAPSE_RE.search(result):
+            result = _WHITESPACE_RE.sub(' ', result)
         
         return result 
\ No newline at end of file
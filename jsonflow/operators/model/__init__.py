@@ -4,4 +4,5 @@ JSONFlow模型操作模块
 包含各种模型调用操作符，用于调用大语言模型。
 """
 
-from jsonflow.operators.model.model_invoker import ModelInvoker 
\ No newline at end of file
+from jsonflow.operators.model.model_invoker import ModelInvoker
+from jsonflow.operators.model.normalized_model_invoker import NormalizedModelInvoker 
\ No newline at end of file
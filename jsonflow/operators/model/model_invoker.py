@@ -6,10 +6,41 @@
 
 import os
 import json
+import logging
+import concurrent.futures
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Optional, Union, Callable
 
 from jsonflow.core import ModelOperator
+from jsonflow.utils.logger import get_logger
+from jsonflow.utils.llm_cache import LLMCache
+
+_logger = get_logger("model_invoker")
+
+# 默认的提示版本，作为响应缓存键的前缀。修改提示的构建方式后更新版本，旧的缓存随之失效
+PROMPT_VERSION = "v1"
+
+# 限流和服务端临时错误时重试，重试前遵守Retry-After响应头
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+def _retry_policy() -> Retry:
+    """
+    创建模型API请求的重试策略
+
+    urllib3默认不重试POST请求，而模型API的调用都是POST，因此显式允许POST重试。
+    重试次数用完后返回最后一次的响应，由调用方的raise_for_status报告错误。
+
+    Returns:
+        Retry: 重试策略
+    """
+    options = dict(total=3, backoff_factor=0.2, status_forcelist=RETRY_STATUS_CODES, raise_on_status=False)
+    try:
+        return Retry(allowed_methods=frozenset({'POST'}), **options)
+    except TypeError:
+        # urllib3 1.26之前的版本使用method_whitelist参数
+        return Retry(method_whitelist=frozenset({'POST'}), **options)
 
 class ModelInvoker(ModelOperator):
     """
@@ -18,6 +49,10 @@ class ModelInvoker(ModelOperator):
     该操作符用于调用大语言模型，处理JSON数据中的文本，并将结果存储在JSON中。
     """
     
+    # 批处理时是否并发调用process逐条处理，而不是按prompt_field批量调用call_llm_batch。
+    # 重写了process实现自定义逻辑（而不只是在调用父类前后做额外处理）的子类应设为True
+    per_record_batch = False
+    
     def __init__(self, 
                  model: str,
                  prompt_field: str = "prompt",
@@ -27,6 +62,9 @@ class ModelInvoker(ModelOperator):
                  base_url: Optional[str] = None,
                  max_tokens: Optional[int] = None,
                  temperature: float = 0.7,
+                 max_workers: Optional[int] = None,
+                 cache: Optional[LLMCache] = None,
+                 prompt_version: str = PROMPT_VERSION,
                  name: Optional[str] = None, 
                  description: Optional[str] = None,
                  **model_params):
@@ -42,6 +80,9 @@ class ModelInvoker(ModelOperator):
             base_url (str, optional): 模型API的基础URL，用于自定义端点
             max_tokens (int, optional): 生成的最大令牌数
             temperature (float): 采样温度，值越高结果越多样，值越低结果越确定
+            max_workers (int, optional): 批量调用时的最大并发请求数，默认为None（由线程池决定）
+            cache (LLMCache, optional): 响应缓存，temperature为0时相同的请求直接返回缓存的响应
+            prompt_version (str): 提示版本，作为缓存键的前缀，修改提示模板后更新以使旧的缓存失效
             name (str, optional): 操作符名称
             description (str, optional): 操作符描述
             **model_params: 其他模型参数
@@ -49,6 +90,7 @@ class ModelInvoker(ModelOperator):
         super().__init__(
             name,
             description or f"Invokes {model} model",
+            supports_batch=True,
             **model_params
         )
         self.model = model
@@ -59,35 +101,171 @@ class ModelInvoker(ModelOperator):
         self.base_url = base_url or "https://api.openai.com/v1/chat/completions"
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.max_workers = max_workers
+        self.cache = cache
+        self.prompt_version = prompt_version
+        
+        # 系统消息对所有请求相同，只构建一次；未设置系统提示时不发送系统消息
+        self._base_messages = (
+            [{"role": "system", "content": self.system_prompt}] if self.system_prompt else []
+        )
+        
+        # 请求头和请求体中不随调用变化的部分只构建一次
+        self._headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.api_key}'
+        }
+        self._base_payload = {
+            'model': self.model,
+            'temperature': self.temperature
+        }
+        if self.max_tokens:
+            self._base_payload['max_tokens'] = self.max_tokens
+        # 添加其他模型参数
+        self._base_payload.update(self.model_params)
+        
+        # 复用同一个会话，使多次调用共享连接池，避免每次请求都重新建立TCP/TLS连接
+        pool_size = max(max_workers or 0, 32)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=_retry_policy()
+        )
+        self._session = requests.Session()
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+    
+    def close(self) -> None:
+        """
+        关闭HTTP会话，释放连接池中的连接
+        """
+        self._session.close()
     
-    def process(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
+    def __enter__(self) -> 'ModelInvoker':
+        """
+        上下文管理器入口
+        
+        Returns:
+            ModelInvoker: self
+        """
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        上下文管理器出口
+        
+        关闭HTTP会话。
+        """
+        self.close()
+    
+    def process(self, json_data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         处理JSON数据，调用模型
         
         Args:
-            json_data (dict): 输入的JSON数据
+            json_data (dict or list): 输入的JSON数据，可以是单个对象或列表
             
         Returns:
-            dict: 处理后的JSON数据
+            dict or list: 处理后的JSON数据
         """
+        if isinstance(json_data, list):
+            return self.process_batch(json_data)
+        
         if not json_data or self.prompt_field not in json_data:
             return json_data
         
-        result = json_data.copy()
+        result = self._prepare_result(json_data)
         prompt = result[self.prompt_field]
         
         # 调用模型
-        messages = []
-        if self.system_prompt:
-            messages.append({"role": "system", "content": self.system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        response = self.call_llm(messages)
+        response = self.call_llm(self._build_messages(prompt))
         
         # 将结果存储在JSON中
         result[self.response_field] = response
         return result
     
+    def process_batch(self, json_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        批量处理JSON数据，并发调用模型
+        
+        不包含提示字段的数据原样返回，结果顺序与输入一致。per_record_batch为True时，
+        改为并发调用process处理每条数据。
+        
+        Args:
+            json_data_list (list): 输入的JSON数据列表
+            
+        Returns:
+            list: 处理后的JSON数据列表
+        """
+        if self.per_record_batch:
+            # 子类自定义了单条数据的处理逻辑，在线程池中并发调用process
+            if len(json_data_list) <= 1:
+                return [self.process(item) for item in json_data_list]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return list(executor.map(self.process, json_data_list))
+        
+        results = list(json_data_list)
+        indices = []
+        for i, item in enumerate(json_data_list):
+            if item and self.prompt_field in item:
+                results[i] = self._prepare_result(item)
+                indices.append(i)
+        
+        responses = self.call_llm_batch([
+            self._build_messages(results[i][self.prompt_field]) for i in indices
+        ])
+        for i, response in zip(indices, responses):
+            results[i][self.response_field] = response
+        return results
+    
+    def _prepare_result(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        创建用于存放模型响应的结果对象，子类可以重写此方法在调用模型前预处理数据
+        
+        Args:
+            json_data (dict): 输入的JSON数据
+            
+        Returns:
+            dict: 结果对象（输入数据的浅拷贝）
+        """
+        return json_data.copy()
+    
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """
+        根据提示构建消息列表
+        
+        Args:
+            prompt (str): 用户提示
+            
+        Returns:
+            List[Dict[str, str]]: 消息列表
+        """
+        return self._base_messages + [{"role": "user", "content": prompt}]
+    
+    def call_llm_batch(self, messages_list: List[List[Dict[str, str]]]) -> List[str]:
+        """
+        并发调用大模型API处理多组消息
+        
+        Chat Completions接口每次请求只接受一组消息，这里使用线程池并发发送请求，
+        总耗时接近单次请求的延迟而不是所有请求延迟之和。
+        
+        Args:
+            messages_list (List[List[Dict[str, str]]]): 消息列表的列表，每个元素是一次调用的消息
+            
+        Returns:
+            List[str]: 模型的响应文本列表，与输入顺序一致
+            
+        Raises:
+            Exception: 如果任何一次API调用失败
+        """
+        if not messages_list:
+            return []
+        if len(messages_list) == 1:
+            return [self.call_llm(messages_list[0])]
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.call_llm, messages_list))
+    
     def call_llm(self, messages: List[Dict[str, str]]) -> str:
         """
         使用requests库调用大模型API
@@ -104,32 +282,29 @@ class ModelInvoker(ModelOperator):
         Raises:
             Exception: 如果API调用失败
         """
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.api_key}'
-        }
-
-        data = {
-            'model': self.model,
-            'messages': messages,
-            'temperature': self.temperature
-        }
+        cache_key = None
+        if self.cache is not None:
+            cache_key, cached = self.cache.lookup(
+                self.model, messages, self.temperature, self.max_tokens, self.prompt_version, **self.model_params
+            )
+            if cached is not None:
+                return cached
         
-        if self.max_tokens:
-            data['max_tokens'] = self.max_tokens
-            
-        # 添加其他模型参数
-        if hasattr(self, 'model_params') and self.model_params:
-            data.update(self.model_params)
+        data = dict(self._base_payload)
+        data['messages'] = messages
             
         try:
-            print(f"Calling LLM API at: {self.base_url}")
-            response = requests.post(self.base_url, headers=headers, json=data)
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("Calling LLM API at %s with model %s", self.base_url, self.model)
+            response = self._session.post(self.base_url, headers=self._headers, json=data)
             response.raise_for_status()  # 检查响应状态码
             
             result = response.json()
             if 'choices' in result and len(result['choices']) > 0:
-                return result['choices'][0]['message']['content']
+                content = result['choices'][0]['message']['content']
+                if cache_key is not None:
+                    self.cache.set(cache_key, content)
+                return content
             else:
                 raise Exception(f"Unexpected API response format: {result}")
                 
@@ -137,5 +312,5 @@ class ModelInvoker(ModelOperator):
             error_msg = f"API call failed: {str(e)}"
             if self.base_url != "https://api.openai.com/v1/chat/completions":
                 error_msg = f"Custom API endpoint call failed: {str(e)}"
-            print(error_msg)
+            _logger.error(error_msg)
             raise Exception(error_msg)
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+规范化模型调用操作符模块
+
+该模块定义了NormalizedModelInvoker操作符，在调用大语言模型前对提示文本进行规范化。
+"""
+
+from typing import Dict, Any, Optional
+
+from jsonflow.operators.json_ops.text_normalizer import TextNormalizer
+from jsonflow.operators.model.model_invoker import ModelInvoker
+
+class NormalizedModelInvoker(ModelInvoker):
+    """
+    规范化提示文本并调用大语言模型的操作符
+
+    该操作符等价于Pipeline([TextNormalizer(text_fields=[prompt_field]), ModelInvoker(...)])，
+    但在一个操作符内完成，每条数据只复制一次。
+    """
+
+    def __init__(self,
+                 model: str,
+                 strip: bool = True,
+                 lower_case: bool = False,
+                 upper_case: bool = False,
+                 remove_extra_spaces: bool = True,
+                 **kwargs):
+        """
+        初始化NormalizedModelInvoker
+
+        Args:
+            model (str): 模型名称
+            strip (bool): 是否去除提示文本两端的空白字符，默认为True
+            lower_case (bool): 是否将提示文本转换为小写，默认为False
+            upper_case (bool): 是否将提示文本转换为大写，默认为False
+            remove_extra_spaces (bool): 是否移除提示文本中多余的空格，默认为True
+            **kwargs: 其他传递给ModelInvoker的参数
+        """
+        super().__init__(model=model, **kwargs)
+        self.normalizer = TextNormalizer(
+            text_fields=[self.prompt_field],
+            strip=strip,
+            lower_case=lower_case,
+            upper_case=upper_case,
+            remove_extra_spaces=remove_extra_spaces
+        )
+
+    def _prepare_result(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        创建结果对象并规范化其中的提示文本
+
+        Args:
+            json_data (dict): 输入的JSON数据
+
+        Returns:
+            dict: 提示文本已规范化的结果对象
+        """
+        result = json_data.copy()
+        prompt = result[self.prompt_field]
+        if isinstance(prompt, str):
+            result[self.prompt_field] = self.normalizer.normalize_text(prompt)
+        return result
@@ -6,6 +6,8 @@ import unittest
 import os
 from unittest.mock import patch, MagicMock
 from jsonflow.operators.model import ModelInvoker
+from jsonflow.utils import LLMCache
+from jsonflow.core import Pipeline
 
 class TestModelInvoker(unittest.TestCase):
     """测试 ModelInvoker 类"""
@@ -147,5 +149,113 @@ class TestModelInvoker(unittest.TestCase):
             
         self.assertIn("OpenAI API call failed", str(context.exception))
 
+    @patch.object(ModelInvoker, 'call_llm')
+    def test_process_list(self, mock_call_llm):
+        """测试批量处理JSON列表"""
+        mock_call_llm.side_effect = lambda messages: f"回复: {messages[-1]['content']}"
+        
+        test_list = [
+            {"id": "test-1", "prompt": "问题1"},
+            {"id": "test-2", "other_field": "value"},
+            {"id": "test-3", "prompt": "问题3"}
+        ]
+        results = self.invoker.process(test_list)
+        
+        # 结果顺序与输入一致，缺少提示字段的数据原样返回
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["response"], "回复: 问题1")
+        self.assertEqual(results[1], {"id": "test-2", "other_field": "value"})
+        self.assertEqual(results[2]["response"], "回复: 问题3")
+        self.assertEqual(mock_call_llm.call_count, 2)
+        
+        # 不修改输入数据
+        self.assertNotIn("response", test_list[0])
+
+    def test_build_messages(self):
+        """测试构建消息列表"""
+        messages = self.invoker._build_messages("问题")
+        self.assertEqual(messages, [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": "问题"}
+        ])
+        
+        # 多次构建不会修改共享的系统消息列表
+        self.invoker._build_messages("问题2")
+        self.assertEqual(len(self.invoker._build_messages("问题3")), 2)
+        
+        # 未设置系统提示时只发送用户消息
+        invoker = ModelInvoker(model="gpt-3.5-turbo")
+        self.assertEqual(invoker._build_messages("问题"), [{"role": "user", "content": "问题"}])
+
+    def test_session_reused(self):
+        """测试多次调用复用同一个HTTP会话"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"choices": [{"message": {"content": "回复"}}]}
+        
+        with ModelInvoker(model="gpt-3.5-turbo", api_key="test-key") as invoker:
+            with patch.object(invoker._session, 'post', return_value=mock_response) as mock_post:
+                invoker.call_llm([{"role": "user", "content": "问题1"}])
+                invoker.call_llm([{"role": "user", "content": "问题2"}])
+        
+        # 检查结果
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(mock_post.call_args[0][0], invoker.base_url)
+        self.assertEqual(mock_post.call_args[1]["headers"]["Authorization"], "Bearer test-key")
+
+    def test_cache(self):
+        """测试相同的确定性请求使用缓存的响应"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"choices": [{"message": {"content": "回复"}}]}
+        
+        invoker = ModelInvoker(model="gpt-3.5-turbo", api_key="test-key", temperature=0, cache=LLMCache())
+        with patch.object(invoker._session, 'post', return_value=mock_response) as mock_post:
+            results = [invoker.call_llm([{"role": "user", "content": "问题"}]) for _ in range(3)]
+            invoker.call_llm([{"role": "user", "content": "另一个问题"}])
+        
+        # 检查结果
+        self.assertEqual(results, ["回复"] * 3)
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_process_batch_subclass(self):
+        """测试声明per_record_batch的子类在批处理时使用子类的process"""
+        class EchoInvoker(ModelInvoker):
+            per_record_batch = True
+            
+            def process(self, json_data):
+                result = json_data.copy()
+                result["echo"] = json_data["text"]
+                return result
+        
+        invoker = EchoInvoker(model="gpt-3.5-turbo", max_workers=2)
+        results = Pipeline([invoker]).process([{"text": str(i)} for i in range(5)])
+        
+        # 检查结果
+        self.assertEqual([r["echo"] for r in results], [str(i) for i in range(5)])
+
+    def test_retry_policy(self):
+        """测试会话对POST请求的限流和服务端错误进行重试"""
+        invoker = ModelInvoker(model="gpt-3.5-turbo", api_key="test-key")
+        retry = invoker._session.get_adapter(invoker.base_url).max_retries
+        
+        # 检查结果
+        self.assertTrue(retry.is_retry("POST", 429))
+        self.assertTrue(retry.is_retry("POST", 503))
+        self.assertFalse(retry.is_retry("POST", 400))
+        self.assertFalse(retry.raise_on_status)
+
+    def test_process_batch_super(self):
+        """测试只在调用父类process前后做额外处理的子类仍然批量调用模型"""
+        class LoggingInvoker(ModelInvoker):
+            def process(self, json_data):
+                return super().process(json_data)
+        
+        invoker = LoggingInvoker(model="gpt-3.5-turbo", api_key="test-key")
+        with patch.object(invoker, 'call_llm_batch', return_value=["回复0", "回复1"]) as mock_batch:
+            results = invoker.process([{"prompt": "问题0"}, {"text": "无提示"}, {"prompt": "问题1"}])
+        
+        # 检查结果
+        mock_batch.assert_called_once()
+        self.assertEqual([r.get("response") for r in results], ["回复0", None, "回复1"])
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+NormalizedModelInvoker 测试模块
+"""
+
+import unittest
+import os
+from unittest.mock import patch
+from jsonflow.operators.model import NormalizedModelInvoker
+
+class TestNormalizedModelInvoker(unittest.TestCase):
+    """测试 NormalizedModelInvoker 类"""
+
+    def setUp(self):
+        """设置测试环境"""
+        # 模拟环境变量
+        os.environ["OPENAI_API_KEY"] = "fake-api-key"
+
+        self.invoker = NormalizedModelInvoker(
+            model="gpt-3.5-turbo",
+            system_prompt="You are a helpful assistant."
+        )
+
+    @patch.object(NormalizedModelInvoker, 'call_llm')
+    def test_process_normalizes_prompt(self, mock_call_llm):
+        """测试调用模型前规范化提示文本"""
+        mock_call_llm.return_value = "这是一个测试回复"
+
+        test_json = {"id": "test-1", "prompt": "  什么是   JSON？\n", "title": "  不处理  "}
+        result = self.invoker.process(test_json)
+
+        # 只规范化提示字段，并添加模型响应
+        self.assertEqual(result["prompt"], "什么是 JSON？")
+        self.assertEqual(result["title"], "  不处理  ")
+        self.assertEqual(result["response"], "这是一个测试回复")
+
+        # 模型收到的是规范化后的提示
+        messages = mock_call_llm.call_args[0][0]
+        self.assertEqual(messages[0], {"role": "system", "content": "You are a helpful assistant."})
+        self.assertEqual(messages[1], {"role": "user", "content": "什么是 JSON？"})
+
+        # 不修改输入数据
+        self.assertEqual(test_json["prompt"], "  什么是   JSON？\n")
+
+    def test_missing_prompt_field(self):
+        """测试缺少提示字段的JSON数据"""
+        test_json = {"id": "test-1", "other_field": "value"}
+        result = self.invoker.process(test_json)
+
+        # 应该原样返回，不做修改
+        self.assertEqual(result, test_json)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -90,6 +90,25 @@ class JsonSplitterTest(unittest.TestCase):
         self.assertEqual(results[0]["metadata"]["source"], "test")
         self.assertEqual(results[1]["items"], "item2")
         
+    def test_split_results_are_independent(self):
+        """Test split objects keep field order and do not share state"""
+        # 创建测试数据
+        data = {"id": "test-1", "items": ["item1", "item2"], "category": "test"}
+        
+        # 映射到同一字段时，按映射顺序后写入的值生效
+        splitter = JsonSplitter(split_field='items', output_key_map={"items": "content", "id": "content", "category": "type"})
+        self.assertEqual(splitter.process(data), [{"content": "test-1", "type": "test"}] * 2)
+        
+        # 保留原始字段时，映射字段追加在原始字段之后
+        splitter = JsonSplitter(split_field='items', output_key_map={"items": "content"}, keep_original=True)
+        results = splitter.process(data)
+        self.assertEqual([list(item) for item in results], [["id", "category", "content"]] * 2)
+        
+        # 修改一个拆分结果不影响其他结果和原对象
+        results[0]["id"] = "changed"
+        self.assertEqual(results[1]["id"], "test-1")
+        self.assertEqual(data["id"], "test-1")
+    
     def test_split_with_nonexistent_field(self):
         """Test splitting with nonexistent field"""
         # 创建测试数据
@@ -2,8 +2,13 @@
 JSONFlow工具模块
 
 包含各种实用工具，如日志、配置、存储等。
+
+大模型响应缓存相关的类在第一次被访问时才导入（PEP 562），导入jsonflow时不加载缓存模块。
 """
 
+import importlib
+import sys
+
 from jsonflow.utils.logger import get_logger
 from jsonflow.utils.config import Config
 from jsonflow.utils.operator_utils import (
@@ -13,6 +18,23 @@ from jsonflow.utils.operator_utils import (
     set_io_log_truncate_length
 )
 
+# 按需导入的名称到所在模块的映射
+_EXPORTS = {
+    'LLMCache': 'jsonflow.utils.llm_cache',
+    'MemoryBackend': 'jsonflow.utils.llm_cache',
+    'FileBackend': 'jsonflow.utils.llm_cache',
+    'RedisBackend': 'jsonflow.utils.llm_cache',
+}
+
+__all__ = [
+    'get_logger',
+    'Config',
+    'log_io',
+    'enable_operator_io_logging',
+    'set_io_log_indent',
+    'set_io_log_truncate_length',
+] + list(_EXPORTS)
+
 # BOS工具功能
 try:
     from jsonflow.utils.bos import (
@@ -22,6 +44,42 @@ try:
         upload_directory,
         download_directory
     )
+    __all__ += ['BosHelper', 'upload_file', 'download_file', 'upload_directory', 'download_directory']
 except ImportError:
     # BOS SDK可能未安装，在导入时不强制要求
-    pass 
\ No newline at end of file
+    pass
+
+def __getattr__(name):
+    """
+    按需导入缓存相关的类
+
+    Args:
+        name (str): 属性名称
+
+    Returns:
+        type: 导出的类
+
+    Raises:
+        AttributeError: 如果不是本模块导出的名称
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # 缓存到模块命名空间，之后的访问不再经过__getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """
+    列出模块属性，包括尚未导入的类
+
+    Returns:
+        list: 属性名称列表
+    """
+    return sorted(set(globals()) | set(_EXPORTS))
+
+if sys.version_info < (3, 7):
+    # Python 3.7之前不支持模块级__getattr__，直接导入全部类
+    for _name in _EXPORTS:
+        __getattr__(_name)
@@ -0,0 +1,161 @@
+"""
+JSON编解码工具模块
+
+该模块优先使用orjson解析和序列化JSON数据，未安装orjson时回退到标准库json。
+"""
+
+import re
+import json
+import math
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    # orjson为可选依赖，未安装时使用标准库json
+    orjson = None
+
+# orjson会把超过64位的整数解析为浮点数而不报错。只有包含19位以上连续数字的数据才可能出现这种情况，
+# 字节数据把数字映射为b'0'、其他字符映射为空格后查找连续的b'0'，比正则表达式快数倍
+_LONG_DIGITS = re.compile(r'\d{19}')
+_DIGITS_TABLE = bytes(0x30 if 0x30 <= i <= 0x39 else 0x20 for i in range(256))
+_DIGIT_RUN = b'0' * 19
+_INT64_LIMIT = 2 ** 63
+
+def _has_non_finite(obj: Any) -> bool:
+    """
+    判断数据中是否包含NaN或Infinity浮点数
+
+    Args:
+        obj (any): 要检查的数据
+
+    Returns:
+        bool: 包含非有限浮点数时返回True
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(item) for item in obj)
+    return False
+
+def _has_big_float(obj: Any) -> bool:
+    """
+    判断数据中是否包含超出64位整数范围的浮点数（可能由orjson从大整数转换而来）
+
+    Args:
+        obj (any): 要检查的数据
+
+    Returns:
+        bool: 包含绝对值不小于2**63的浮点数时返回True
+    """
+    if isinstance(obj, float):
+        return abs(obj) >= _INT64_LIMIT
+    if isinstance(obj, dict):
+        return any(_has_big_float(value) for value in obj.values())
+    if isinstance(obj, list):
+        return any(_has_big_float(item) for item in obj)
+    return False
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    解析JSON数据
+
+    优先使用orjson解析。数据包含19位以上连续数字时检查解析结果，只有其中出现超出64位整数范围的
+    浮点数（可能是orjson转换的大整数）时才使用标准库重新解析，大整数保持精确。字符串值中的长数字
+    （如ID、卡号、哈希值）不会导致使用标准库解析。
+
+    Args:
+        data (str or bytes): JSON文本，可以是字符串或UTF-8编码的字节
+
+    Returns:
+        any: 解析后的JSON数据
+
+    Raises:
+        json.JSONDecodeError: 如果JSON解析失败
+    """
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    if orjson is not None:
+        try:
+            result = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson不接受NaN、Infinity等标准库可以解析的内容，交给标准库处理以保持兼容
+            pass
+        else:
+            if isinstance(data, str):
+                long_digits = _LONG_DIGITS.search(data) is not None
+            else:
+                long_digits = _DIGIT_RUN in data.translate(_DIGITS_TABLE)
+            if not long_digits or not _has_big_float(result):
+                return result
+    return json.loads(data)
+
+def coerce_json(data: Any) -> Any:
+    """
+    将JSON文本解析为数据，已经解析过的dict或list直接返回
+
+    Args:
+        data (any): JSON文本（字符串或字节），或已解析的dict/list
+
+    Returns:
+        any: 解析后的JSON数据
+
+    Raises:
+        json.JSONDecodeError: 如果JSON解析失败
+    """
+    if isinstance(data, (dict, list)):
+        return data
+    return loads(data)
+
+def dumps(obj: Any, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    将数据序列化为紧凑的JSON字符串
+
+    安装和未安装orjson时的输出不保证逐字节相同，例如浮点数1e16分别写为1e16和1e+16，
+    datetime、dataclass等类型由orjson直接序列化而标准库交给default处理，
+    因此不要用于需要跨环境稳定的结果（如持久化的缓存键）。
+
+    Args:
+        obj (any): 要序列化的数据
+        sort_keys (bool): 是否按键排序，默认为False
+        default (callable, optional): 无法直接序列化的对象的转换函数
+
+    Returns:
+        str: JSON字符串，非ASCII字符不转义，NaN和Infinity与标准库一样写为NaN和Infinity
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_SORT_KEYS if sort_keys else 0
+            result = orjson.dumps(obj, default=default, option=option)
+            # orjson把NaN和Infinity写为null，只在输出包含null时检查数据
+            if b'null' not in result or not _has_non_finite(obj):
+                return result.decode('utf-8')
+        except TypeError:
+            # orjson不支持非字符串键等情况，交给标准库处理
+            pass
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys, default=default, separators=(',', ':'))
+
+def dumps_line(obj: Any) -> bytes:
+    """
+    将数据序列化为以换行符结尾的UTF-8编码JSON行
+
+    无论是否安装orjson，输出都是相同格式的紧凑JSON。
+
+    Args:
+        obj (any): 要序列化的数据
+
+    Returns:
+        bytes: UTF-8编码的JSON行，非ASCII字符不转义，NaN和Infinity与标准库一样写为NaN和Infinity
+    """
+    if orjson is not None:
+        try:
+            result = orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+            # orjson把NaN和Infinity写为null，只在输出包含null时检查数据
+            if b'null' not in result or not _has_non_finite(obj):
+                return result
+        except TypeError:
+            # orjson不支持非字符串键等情况，交给标准库处理
+            pass
+    return (json.dumps(obj, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
@@ -0,0 +1,62 @@
+"""
+HTTP客户端工具模块
+
+该模块提供了进程内共享的httpx.Client，多个OpenAI客户端使用同一个连接池，
+连接建立后在各个操作符之间复用。
+"""
+
+import threading
+from typing import Any
+
+# 共享连接池的大小
+MAX_KEEPALIVE_CONNECTIONS = 100
+MAX_CONNECTIONS = 200
+
+_shared_client = None
+_lock = threading.Lock()
+
+def _http2_available() -> bool:
+    """
+    判断是否可以启用HTTP/2（httpx需要安装h2包才支持HTTP/2）
+
+    Returns:
+        bool: 已安装h2时返回True
+    """
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def get_http_client() -> Any:
+    """
+    获取进程内共享的httpx.Client，首次调用时创建，已关闭时重新创建
+
+    可作为openai.OpenAI(http_client=...)传入，使多个客户端共享同一个连接池。
+    共享客户端由本模块管理，使用方不应关闭它。异步客户端的连接绑定在事件循环上，不在此共享。
+
+    Returns:
+        httpx.Client: 共享的HTTP客户端
+
+    Raises:
+        ImportError: 如果未安装httpx
+    """
+    global _shared_client
+    client = _shared_client
+    if client is None or client.is_closed:
+        with _lock:
+            if _shared_client is None or _shared_client.is_closed:
+                try:
+                    import httpx
+                except ImportError:
+                    raise ImportError("get_http_client requires the httpx package. Please install it with: pip install httpx")
+                _shared_client = httpx.Client(
+                    http2=_http2_available(),
+                    limits=httpx.Limits(
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        max_connections=MAX_CONNECTIONS
+                    ),
+                    timeout=60.0
+                )
+            client = _shared_client
+    return client
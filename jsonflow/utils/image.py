@@ -0,0 +1,117 @@
+"""
+图像工具模块
+
+该模块提供了读取图像并编码为base64的工具函数，用于构建多模态模型的请求消息。
+"""
+
+import os
+import mmap
+import functools
+from typing import Tuple
+
+try:
+    # pybase64使用SIMD指令编码，大图像的编码速度明显快于标准库
+    from pybase64 import b64encode
+except ImportError:
+    # pybase64为可选依赖，未安装时使用标准库base64
+    from base64 import b64encode
+
+# 常见图像格式的文件头签名，用于识别MIME类型
+_IMAGE_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+]
+
+# 可以直接作为image_url传给模型、无需读取和编码的图像地址前缀
+_URL_PREFIXES = ("http://", "https://", "data:")
+
+def guess_image_mime(header: bytes, default: str = "image/jpeg") -> str:
+    """
+    根据文件头字节识别图像的MIME类型
+
+    Args:
+        header (bytes): 图像文件的前12个字节
+        default (str): 无法识别时返回的默认类型
+
+    Returns:
+        str: 图像的MIME类型
+    """
+    for signature, mime in _IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return mime
+    # WebP: "RIFF" + 4字节长度 + "WEBP"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return default
+
+def is_image_url(image_path: str) -> bool:
+    """
+    判断图像字段是否已经是可直接传给模型的URL（http、https或data URL）
+
+    Args:
+        image_path (str): 图像文件路径或URL
+
+    Returns:
+        bool: 是URL时返回True
+    """
+    return isinstance(image_path, str) and image_path.startswith(_URL_PREFIXES)
+
+@functools.lru_cache(maxsize=128)
+def _encode_image_cached(image_path: str, mtime_ns: int, size: int) -> Tuple[str, str]:
+    """
+    读取并编码图像，结果按(路径, 修改时间, 大小)缓存
+
+    修改时间和大小作为缓存键的一部分，文件在磁盘上变化后缓存自动失效。
+
+    Args:
+        image_path (str): 图像文件路径
+        mtime_ns (int): 文件修改时间（纳秒）
+        size (int): 文件大小（字节）
+
+    Returns:
+        tuple: (MIME类型, base64编码的图像数据)
+    """
+    with open(image_path, "rb") as image_file:
+        if size == 0:
+            return guess_image_mime(b""), ""
+        # 直接对内存映射编码，不需要先把整个文件读入一个bytes对象
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return guess_image_mime(mapped[:12]), b64encode(mapped).decode("ascii")
+
+def encode_image(image_path: str) -> Tuple[str, str]:
+    """
+    读取图像并编码为base64，同一图像在多条数据中重复出现时只读取和编码一次
+
+    Args:
+        image_path (str): 图像文件路径
+
+    Returns:
+        tuple: (MIME类型, base64编码的图像数据)
+
+    Raises:
+        OSError: 如果图像文件不存在或无法读取
+    """
+    stat = os.stat(image_path)
+    return _encode_image_cached(image_path, stat.st_mtime_ns, stat.st_size)
+
+def image_data_url(image_path: str) -> str:
+    """
+    读取图像并构建data URL，可直接用作image_url消息的url
+
+    image_path已经是http、https或data URL时原样返回，不读取文件也不进行base64编码。
+
+    Args:
+        image_path (str): 图像文件路径或URL
+
+    Returns:
+        str: 形如"data:image/png;base64,..."的data URL，或原样返回的URL
+
+    Raises:
+        OSError: 如果图像文件不存在或无法读取
+    """
+    if is_image_url(image_path):
+        return image_path
+    mime_type, image_data = encode_image(image_path)
+    return f"data:{mime_type};base64,{image_data}"
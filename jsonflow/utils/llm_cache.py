@@ -0,0 +1,641 @@
+"""
+大模型响应缓存模块
+
+该模块提供了LLMCache类，按请求内容的哈希缓存大模型的响应，
+避免对相同输入重复调用API。支持内存、文件和Redis三种存储后端。
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+import math
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+
+class MemoryBackend:
+    """
+    内存缓存后端
+
+    使用OrderedDict实现LRU淘汰，超过最大条目数时删除最久未使用的条目。
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        初始化MemoryBackend
+
+        Args:
+            max_size (int): 最大缓存条目数，默认为1024
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        获取缓存值
+
+        Args:
+            key (str): 缓存键
+
+        Returns:
+            str: 缓存值，不存在或已过期时返回None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        设置缓存值
+
+        Args:
+            key (str): 缓存键
+            value (str): 缓存值
+            ttl (float, optional): 过期时间（秒），为None时永不过期
+        """
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        删除键以指定前缀开头的全部缓存
+
+        Args:
+            prefix (str): 键前缀
+
+        Returns:
+            int: 删除的条目数
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+
+class FileBackend:
+    """
+    文件缓存后端
+
+    缓存以JSON Lines日志保存，可在多次运行之间复用：每次写入只在文件末尾追加一行，
+    删除时追加删除标记，加载时按顺序回放日志，后写入的条目覆盖先写入的条目。
+    每行以一次O_APPEND写入，多个线程或进程可以同时向同一个文件追加。
+    """
+
+    # 日志行数超过有效条目数的该倍数时，加载后重写文件以去掉被覆盖、删除和过期的条目
+    COMPACT_RATIO = 2
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        初始化FileBackend
+
+        Args:
+            path (str, optional): 缓存文件路径，默认为~/.jsonflow/llm_cache.jsonl
+        """
+        self.path = os.path.expanduser(path or os.path.join("~", ".jsonflow", "llm_cache.jsonl"))
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._load()
+
+    def _load(self) -> None:
+        """
+        回放日志加载缓存，无法解析的行（如写入中断留下的不完整行）被跳过，需要时压缩日志
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            return
+
+        now = time.time()
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, list) or not record:
+                continue
+            if len(record) == 1:
+                # 删除标记
+                self._entries.pop(record[0], None)
+            elif len(record) == 3:
+                key, value, expires_at = record
+                self._entries[key] = [value, expires_at]
+
+        self._entries = {
+            key: entry for key, entry in self._entries.items()
+            if entry[1] is None or entry[1] > now
+        }
+        if len(lines) > self.COMPACT_RATIO * max(len(self._entries), 1):
+            self._compact()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        获取缓存值
+
+        Args:
+            key (str): 缓存键
+
+        Returns:
+            str: 缓存值，不存在或已过期时返回None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        设置缓存值并追加到文件
+
+        Args:
+            key (str): 缓存键
+            value (str): 缓存值
+            ttl (float, optional): 过期时间（秒），为None时永不过期
+        """
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = [value, expires_at]
+        self._append([[key, value, expires_at]])
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        删除键以指定前缀开头的全部缓存，并向文件追加删除标记
+
+        Args:
+            prefix (str): 键前缀
+
+        Returns:
+            int: 删除的条目数
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+        if keys:
+            self._append([[key] for key in keys])
+        return len(keys)
+
+    def _append(self, records: List[list]) -> None:
+        """
+        以一次O_APPEND写入向日志末尾追加记录
+
+        Args:
+            records (list): 要追加的记录，每条记录写为一行
+        """
+        data = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records).encode('utf-8')
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def _compact(self) -> None:
+        """
+        只保留有效条目重写日志
+
+        写入同一目录下唯一的临时文件后替换原文件，写入中断不会损坏缓存文件。
+        其他进程在重写期间追加的条目可能丢失，只会导致之后重新请求。
+        """
+        directory = os.path.dirname(self.path) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for key, (value, expires_at) in self._entries.items():
+                    f.write(json.dumps([key, value, expires_at], ensure_ascii=False) + '\n')
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # 压缩失败时保留原日志，不影响缓存使用
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+class RedisBackend:
+    """
+    Redis缓存后端
+
+    需要安装redis包，过期时间由Redis负责处理。
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "jsonflow:llm:", client: Any = None):
+        """
+        初始化RedisBackend
+
+        Args:
+            url (str): Redis连接URL，提供client时忽略
+            prefix (str): 缓存键前缀
+            client (redis.Redis, optional): 已创建的Redis客户端
+
+        Raises:
+            ImportError: 如果未提供client且未安装redis包
+        """
+        if client is None:
+            # redis为可选依赖，仅在创建RedisBackend时导入
+            try:
+                import redis
+            except ImportError:
+                raise ImportError("RedisBackend requires the redis package. Please install it with: pip install redis")
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        获取缓存值
+
+        Args:
+            key (str): 缓存键
+
+        Returns:
+            str: 缓存值，不存在时返回None
+        """
+        value = self.client.get(self.prefix + key)
+        if isinstance(value, bytes):
+            return value.decode('utf-8')
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        设置缓存值
+
+        Args:
+            key (str): 缓存键
+            value (str): 缓存值
+            ttl (float, optional): 过期时间（秒），为None时永不过期
+        """
+        if ttl is not None:
+            self.client.set(self.prefix + key, value, ex=max(int(ttl), 1))
+        else:
+            self.client.set(self.prefix + key, value)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        删除键以指定前缀开头的全部缓存，使用SCAN遍历键，不会阻塞Redis
+
+        Args:
+            prefix (str): 键前缀
+
+        Returns:
+            int: 删除的条目数
+        """
+        count = 0
+        for key in self.client.scan_iter(match=self.prefix + prefix + "*"):
+            count += self.client.delete(key)
+        return count
+
+
+def _prompt_text(messages: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    提取消息列表中的文本，用于计算语义缓存的嵌入向量
+
+    Args:
+        messages (list): 消息列表
+
+    Returns:
+        str: 按角色拼接的消息文本，消息中包含图像等非文本内容时返回None
+    """
+    parts = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):
+            # 多模态消息：只有全部是文本片段时才能按文本比较
+            texts = []
+            for part in content:
+                if not isinstance(part, dict) or part.get("type") != "text":
+                    return None
+                texts.append(part.get("text", ""))
+            content = "\n".join(texts)
+        elif not isinstance(content, str):
+            return None
+        parts.append(f"{message.get('role', '')}: {content}")
+    return "\n".join(parts)
+
+def _hash_images(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    把消息中内嵌的data URL图像替换为其SHA-256摘要，用于计算缓存键
+
+    Args:
+        messages (list): 消息列表
+
+    Returns:
+        list: 消息列表，不包含内嵌图像时返回原列表，否则返回替换后的副本
+    """
+    result = None
+    for i, message in enumerate(messages):
+        content = message.get("content") if isinstance(message, dict) else None
+        if not isinstance(content, list):
+            continue
+        for j, part in enumerate(content):
+            image = part.get("image_url") if isinstance(part, dict) else None
+            url = image.get("url") if isinstance(image, dict) else None
+            if not isinstance(url, str) or not url.startswith("data:"):
+                continue
+            if result is None:
+                result = list(messages)
+            if result[i] is message:
+                result[i] = dict(message, content=list(content))
+            digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+            result[i]["content"][j] = dict(part, image_url=dict(image, url="sha256:" + digest))
+    return messages if result is None else result
+
+def _normalize(vector: List[float]) -> List[float]:
+    """
+    将向量归一化为单位长度，归一化后的内积即余弦相似度
+
+    Args:
+        vector (list): 嵌入向量
+
+    Returns:
+        list: 单位向量，零向量原样返回
+    """
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return list(vector)
+    return [x / norm for x in vector]
+
+
+class SemanticIndex:
+    """
+    语义缓存的内存向量索引
+
+    按作用域（模型和参数）分别保存归一化的嵌入向量和对应的响应，
+    查询时返回余弦相似度最高且不低于阈值的响应。超过最大条目数时淘汰最早加入的条目。
+    安装numpy时使用矩阵运算计算相似度。
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        初始化SemanticIndex
+
+        Args:
+            max_size (int): 每个作用域的最大条目数，默认为1024
+        """
+        self.max_size = max_size
+        self._entries = {}
+        self._matrices = {}
+        self._lock = threading.Lock()
+        # numpy为可选依赖，创建索引时才导入，未安装时使用纯Python计算相似度
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        self._numpy = numpy
+
+    def add(self, scope: str, vector: List[float], value: str) -> None:
+        """
+        加入一个条目
+
+        Args:
+            scope (str): 作用域，只有相同作用域的条目之间才会比较
+            vector (list): 归一化的嵌入向量
+            value (str): 响应文本
+        """
+        with self._lock:
+            entries = self._entries.setdefault(scope, [])
+            entries.append((vector, value))
+            if len(entries) > self.max_size:
+                del entries[0]
+            # 条目变化后下次查询时重新构建矩阵
+            self._matrices.pop(scope, None)
+
+    def discard_prefix(self, prefix: str) -> None:
+        """
+        删除作用域以指定前缀开头的全部条目
+
+        Args:
+            prefix (str): 作用域前缀
+        """
+        with self._lock:
+            for scope in [scope for scope in self._entries if scope.startswith(prefix)]:
+                del self._entries[scope]
+                self._matrices.pop(scope, None)
+
+    def search(self, scope: str, vector: List[float], threshold: float) -> Optional[str]:
+        """
+        查找最相似的条目
+
+        Args:
+            scope (str): 作用域
+            vector (list): 归一化的查询向量
+            threshold (float): 最低余弦相似度
+
+        Returns:
+            str: 相似度最高且不低于阈值的响应，没有时返回None
+        """
+        with self._lock:
+            entries = self._entries.get(scope)
+            if not entries:
+                return None
+            numpy = self._numpy
+            if numpy is not None:
+                matrix = self._matrices.get(scope)
+                if matrix is None:
+                    matrix = self._matrices[scope] = numpy.asarray([v for v, _ in entries], dtype=numpy.float32)
+                scores = matrix @ numpy.asarray(vector, dtype=numpy.float32)
+                best = int(scores.argmax())
+                best_score = float(scores[best])
+            else:
+                best, best_score = -1, -1.0
+                for i, (entry_vector, _) in enumerate(entries):
+                    score = sum(a * b for a, b in zip(entry_vector, vector))
+                    if score > best_score:
+                        best, best_score = i, score
+            if best_score >= threshold:
+                return entries[best][1]
+            return None
+
+
+class LLMCache:
+    """
+    大模型响应缓存
+
+    缓存键为(模型, 消息, 温度, 最大令牌数, 其他模型参数)的SHA-256哈希，指定提示版本时以"版本:"为前缀。
+    只有确定性的调用（temperature为0）才会被缓存，采样结果不同的调用总是请求API。
+    修改提示模板后更新提示版本即可让旧的缓存全部失效，不需要逐条删除；
+    旧版本的条目可以用invalidate_by_version清理。
+
+    提供embedder时启用语义缓存：精确匹配未命中的纯文本请求，如果与之前缓存过的请求
+    （模型和参数相同）的嵌入向量余弦相似度不低于threshold，直接返回该请求的响应。
+    语义索引只保存在内存中。
+
+    示例:
+        cache = LLMCache(FileBackend())
+        invoker = ModelInvoker(model="gpt-3.5-turbo", temperature=0, cache=cache)
+    """
+
+    def __init__(self,
+                 backend: Any = None,
+                 ttl: Optional[float] = None,
+                 embedder: Optional[Callable[[str], List[float]]] = None,
+                 threshold: float = 0.92,
+                 semantic_max_size: int = 1024):
+        """
+        初始化LLMCache
+
+        Args:
+            backend (optional): 存储后端，需要实现get(key)和set(key, value, ttl)，默认为MemoryBackend
+            ttl (float, optional): 默认过期时间（秒），为None时永不过期
+            embedder (callable, optional): 将文本转换为嵌入向量的函数，提供时启用语义缓存
+            threshold (float): 语义缓存命中所需的最低余弦相似度，默认为0.92
+            semantic_max_size (int): 语义索引中每个模型和参数组合的最大条目数，默认为1024
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self.embedder = embedder
+        self.threshold = threshold
+        self._semantic_index = SemanticIndex(semantic_max_size) if embedder is not None else None
+        # lookup未命中时计算的(作用域, 向量)，在set时加入语义索引，避免重复计算嵌入向量
+        self._pending_vectors = MemoryBackend(max_size=semantic_max_size) if embedder is not None else None
+
+    @staticmethod
+    def cache_key(model: str,
+                  messages: List[Dict[str, Any]],
+                  temperature: Optional[float],
+                  max_tokens: Optional[int],
+                  prompt_version: Optional[str] = None,
+                  **params) -> Optional[str]:
+        """
+        计算请求的缓存键
+
+        Args:
+            model (str): 模型名称
+            messages (list): 消息列表
+            temperature (float): 采样温度
+            max_tokens (int): 最大令牌数
+            prompt_version (str, optional): 提示版本，作为缓存键的前缀
+            **params: 其他影响输出的模型参数
+
+        Returns:
+            str: 缓存键，temperature不为0（结果不确定）时返回None
+        """
+        if temperature is None or temperature > 0:
+            return None
+        # 缓存会持久化并在进程和机器之间共享，键必须与是否安装orjson等环境无关，
+        # 因此使用标准库json规范序列化；数MB的base64图像单独计算摘要，不参与序列化
+        payload = json.dumps({
+            "model": model,
+            "messages": _hash_images(messages),
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "params": params
+        }, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str)
+        digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        if prompt_version is not None:
+            return f"{prompt_version}:{digest}"
+        return digest
+
+    def lookup(self,
+               model: str,
+               messages: List[Dict[str, Any]],
+               temperature: Optional[float],
+               max_tokens: Optional[int],
+               prompt_version: Optional[str] = None,
+               **params) -> Tuple[Optional[str], Optional[str]]:
+        """
+        计算缓存键并查找缓存的响应，启用语义缓存时在精确匹配未命中后查找相似的请求
+
+        Args:
+            model (str): 模型名称
+            messages (list): 消息列表
+            temperature (float): 采样温度
+            max_tokens (int): 最大令牌数
+            prompt_version (str, optional): 提示版本
+            **params: 其他影响输出的模型参数
+
+        Returns:
+            tuple: (缓存键, 缓存的响应)，未命中时响应为None，请求结果不确定时两者均为None
+        """
+        key = self.cache_key(model, messages, temperature, max_tokens, prompt_version, **params)
+        if key is None:
+            return None, None
+        cached = self.get(key)
+        if cached is not None or self._semantic_index is None:
+            return key, cached
+
+        text = _prompt_text(messages)
+        if text is None:
+            # 包含图像等非文本内容的请求只做精确匹配
+            return key, None
+        # 作用域由消息以外的参数决定，模型或参数变化后不会命中之前的响应
+        scope = self.cache_key(model, [], temperature, max_tokens, prompt_version, **params)
+        vector = _normalize(self.embedder(text))
+        cached = self._semantic_index.search(scope, vector, self.threshold)
+        if cached is None:
+            self._pending_vectors.set(key, (scope, vector))
+        return key, cached
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """
+        获取缓存的响应
+
+        Args:
+            key (str): cache_key返回的缓存键
+
+        Returns:
+            str: 缓存的响应，未命中或key为None时返回None
+        """
+        if key is None:
+            return None
+        return self.backend.get(key)
+
+    def set(self, key: Optional[str], value: str, ttl: Optional[float] = None) -> None:
+        """
+        缓存响应
+
+        Args:
+            key (str): cache_key返回的缓存键，为None时不缓存
+            value (str): 模型的响应文本
+            ttl (float, optional): 过期时间（秒），默认使用初始化时的ttl
+        """
+        if key is None:
+            return
+        self.backend.set(key, value, ttl if ttl is not None else self.ttl)
+        if self._semantic_index is not None:
+            pending = self._pending_vectors.get(key)
+            if pending is not None:
+                self._semantic_index.add(pending[0], pending[1], value)
+
+    def invalidate_by_version(self, prompt_version: str) -> int:
+        """
+        删除指定提示版本的全部缓存
+
+        Args:
+            prompt_version (str): 提示版本
+
+        Returns:
+            int: 从存储后端删除的条目数
+
+        Raises:
+            NotImplementedError: 如果存储后端不支持按前缀删除
+        """
+        delete_prefix = getattr(self.backend, "delete_prefix", None)
+        if delete_prefix is None:
+            raise NotImplementedError(f"{type(self.backend).__name__} does not support delete_prefix")
+        if self._semantic_index is not None:
+            self._semantic_index.discard_prefix(f"{prompt_version}:")
+        return delete_prefix(f"{prompt_version}:")
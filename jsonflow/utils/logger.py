@@ -4,10 +4,19 @@
 该模块提供了用于记录日志的工具函数。
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional, Union, Dict, Any
 
+# configure_logging(use_queue=True)时在后台线程中输出日志的监听器
+_queue_listener = None
+
+# get_logger添加的控制台处理器，logger名称到处理器的映射
+_default_handlers = {}
+
 def get_logger(name: str, level: Optional[Union[int, str]] = None) -> logging.Logger:
     """
     获取配置好的logger实例
@@ -31,18 +40,21 @@ def get_logger(name: str, level: Optional[Union[int, str]] = None) -> logging.Lo
     
     logger.setLevel(level)
     
-    # 如果logger没有处理器，添加一个控制台处理器
-    if not logger.handlers:
+    # 如果logger没有处理器，添加一个控制台处理器。使用队列输出日志时不添加，
+    # 日志传递给根logger的队列处理器，避免在当前线程同步写入控制台
+    if _queue_listener is None and not logger.handlers:
         handler = logging.StreamHandler(sys.stderr)
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
         logger.addHandler(handler)
+        _default_handlers[name] = handler
     
     return logger
 
 def configure_logging(level: Optional[Union[int, str]] = None, 
                      format_str: Optional[str] = None,
-                     log_file: Optional[str] = None) -> None:
+                     log_file: Optional[str] = None,
+                     use_queue: bool = False) -> None:
     """
     配置全局的日志设置
     
@@ -51,7 +63,15 @@ def configure_logging(level: Optional[Union[int, str]] = None,
                                    或者字符串（如'INFO'），默认为INFO
         format_str (str, optional): 日志格式字符串，默认为'%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         log_file (str, optional): 日志文件路径，如果提供则同时输出到文件
+        use_queue (bool): 是否通过队列在后台线程中输出日志，默认为False。
+            多线程或异步批量处理时大量记录错误日志不会阻塞处理数据的线程。
+            get_logger返回的logger不再使用自己的控制台处理器，日志全部经由队列输出
     """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    
     # 设置日志级别
     if level is None:
         level = logging.INFO
@@ -75,10 +95,34 @@ def configure_logging(level: Optional[Union[int, str]] = None,
     # 添加控制台处理器
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # 如果指定了日志文件，添加文件处理器
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler) 
\ No newline at end of file
+        handlers.append(file_handler)
+    
+    if use_queue:
+        # 移除get_logger已添加的控制台处理器，日志只经由根logger的队列输出
+        for name, handler in list(_default_handlers.items()):
+            logging.getLogger(name).removeHandler(handler)
+        _default_handlers.clear()
+        
+        # 记录日志的线程只把日志放入队列，由监听器线程写入控制台和文件
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+
+def _stop_queue_listener() -> None:
+    """
+    程序退出前输出队列中剩余的日志
+    """
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+atexit.register(_stop_queue_listener) 
@@ -5,19 +5,112 @@
 JSONFlow测试运行脚本
 
 运行此脚本以执行JSONFlow的所有单元测试。
+
+发现的测试名称缓存在.test_cache.json中，tests目录下的.py文件没有新增、删除或修改时，
+直接按名称加载测试，跳过discover的目录遍历。设置环境变量JSONFLOW_NO_TESTCACHE=1可以禁用缓存。
 """
 
-import unittest
+import os
 import sys
+import json
+import unittest
 
-if __name__ == "__main__":
-    # 发现并运行所有测试
+TEST_DIR = 'tests'
+TEST_PATTERN = 'test_*.py'
+CACHE_FILE = '.test_cache.json'
+
+
+def _iter_tests(suite):
+    """
+    递归展开测试套件
+
+    Args:
+        suite (unittest.TestSuite): 测试套件
+
+    Yields:
+        unittest.TestCase: 测试用例
+    """
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def _source_mtimes():
+    """
+    获取tests目录下全部.py文件的修改时间，新增的测试文件或__init__.py都会改变结果
+
+    Returns:
+        dict: 文件路径到修改时间（纳秒）的映射
+    """
+    mtimes = {}
+    for root, _, files in os.walk(TEST_DIR):
+        for name in files:
+            if name.endswith('.py'):
+                path = os.path.join(root, name)
+                mtimes[path] = os.stat(path).st_mtime_ns
+    return mtimes
+
+
+def _load_cached(mtimes):
+    """
+    从缓存加载测试
+
+    Args:
+        mtimes (dict): 当前的文件修改时间
+
+    Returns:
+        unittest.TestSuite or None: 缓存有效时返回测试套件，否则返回None
+    """
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get('mtimes') != mtimes:
+        return None
+
+    # discover会把顶层目录加入sys.path，测试名称相对于该目录
+    sys.path.insert(0, os.path.abspath(TEST_DIR))
+    return unittest.TestLoader().loadTestsFromNames(cache['names'])
+
+
+def _discover(mtimes):
+    """
+    发现全部测试，没有导入错误时写入缓存
+
+    Args:
+        mtimes (dict): 当前的文件修改时间
+
+    Returns:
+        unittest.TestSuite: 测试套件
+    """
     test_loader = unittest.TestLoader()
-    test_suite = test_loader.discover('tests', pattern='test_*.py')
-    
+    test_suite = test_loader.discover(TEST_DIR, pattern=TEST_PATTERN)
+    if not test_loader.errors:
+        names = [test.id() for test in _iter_tests(test_suite)]
+        try:
+            with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'mtimes': mtimes, 'names': names}, f)
+        except OSError:
+            pass
+    return test_suite
+
+
+if __name__ == "__main__":
+    # 加载所有测试，缓存有效时跳过发现过程
+    if os.environ.get('JSONFLOW_NO_TESTCACHE') == '1':
+        test_suite = unittest.TestLoader().discover(TEST_DIR, pattern=TEST_PATTERN)
+    else:
+        mtimes = _source_mtimes()
+        test_suite = _load_cached(mtimes)
+        if test_suite is None:
+            test_suite = _discover(mtimes)
+
     # 运行测试
     test_runner = unittest.TextTestRunner(verbosity=2)
     result = test_runner.run(test_suite)
-    
+
     # 根据测试结果设置退出代码
-    sys.exit(not result.wasSuccessful()) 
\ No newline at end of file
+    sys.exit(not result.wasSuccessful())
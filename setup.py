@@ -5,11 +5,21 @@
 JSONFlow安装脚本
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# 安装前已安装Cython时编译jsonflow analyze使用的键结构遍历C扩展，否则使用纯Python实现
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension("jsonflow._cwalk", ["jsonflow/_cwalk.pyx"])],
+        compiler_directives={"language_level": 3},
+    )
+except ImportError:
+    ext_modules = []
+
 setup(
     name="guru4elephant-jsonflow",
     version="0.1.1",
@@ -20,6 +30,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/guru4elephant/jsonflow",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -39,8 +50,14 @@ setup(
         "bos": [
             "bce-python-sdk>=0.8.0",  # 百度对象存储SDK
         ],
+        "fast": [
+            "orjson>=3.0",  # 更快的JSON解析
+            "pybase64>=1.0",  # 更快的图像base64编码
+        ],
         "all": [
             "bce-python-sdk>=0.8.0",
+            "orjson>=3.0",
+            "pybase64>=1.0",
             "pytest>=6.0",
             "black",
             "flake8",
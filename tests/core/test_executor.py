@@ -0,0 +1,68 @@
+"""
+执行器测试模块
+
+该模块包含对执行器类的单元测试。
+"""
+
+import time
+import unittest
+from jsonflow.core import Pipeline, Operator, MultiThreadExecutor
+
+class TestMultiThreadExecutor(unittest.TestCase):
+    """MultiThreadExecutor类的测试类"""
+
+    def test_execute_all(self):
+        """测试批量执行"""
+        executor = MultiThreadExecutor(Pipeline([SlowDoubleOperator()]), max_workers=4)
+        results = executor.execute_all([{"value": i} for i in range(10)])
+
+        # 检查结果顺序与输入一致
+        self.assertEqual([r["value"] for r in results], [i * 2 for i in range(10)])
+
+    def test_execute_iter(self):
+        """测试流式执行"""
+        executor = MultiThreadExecutor(Pipeline([SlowDoubleOperator()]), max_workers=4)
+        results = list(executor.execute_iter({"value": i} for i in range(20)))
+
+        # 检查结果顺序与输入一致
+        self.assertEqual([r["value"] for r in results], [i * 2 for i in range(20)])
+
+    def test_execute_iter_bounded(self):
+        """测试流式执行不会一次性读取全部输入"""
+        consumed = []
+
+        def source():
+            for i in range(100):
+                consumed.append(i)
+                yield {"value": i}
+
+        executor = MultiThreadExecutor(Pipeline([SlowDoubleOperator()]), max_workers=2)
+        results = executor.execute_iter(source())
+        self.assertEqual(next(results), {"value": 0})
+        self.assertLessEqual(len(consumed), 4)
+        results.close()
+
+    def test_execute_iter_error(self):
+        """测试流式执行中的错误处理"""
+        executor = MultiThreadExecutor(Pipeline([SlowDoubleOperator()]), max_workers=2)
+        results = list(executor.execute_iter([{"value": 1}, {"value": "x"}, {}]))
+
+        # 检查结果
+        self.assertEqual(results[0], {"value": 2})
+        self.assertEqual(results[1], {"value": "xx"})
+        self.assertIn("error", results[2])
+
+
+class SlowDoubleOperator(Operator):
+    """用于测试的操作符，延迟后将value字段翻倍"""
+
+    def process_item(self, json_data):
+        """将value字段翻倍，value越小延迟越长"""
+        value = json_data["value"]
+        if isinstance(value, int):
+            time.sleep(0.001 * (20 - value % 20))
+        return {"value": value * 2}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,6 +55,66 @@ class TestPipeline(unittest.TestCase):
         expected = {"original": "data", "field1": "value1", "field2": "value2"}
         self.assertEqual(result, expected)
     
+    def test_process_many(self):
+        """测试process_many方法"""
+        pipeline = Pipeline([AddFieldOperator("field1", "value1"), SplitOperator()])
+        json_list = [{"id": 1, "text": "a"}, {"id": 2, "text": "b,c"}]
+        
+        # 逐条处理生成器中的数据
+        results = pipeline.process_many(iter(json_list))
+        
+        # 检查结果：与展平模式下的process(list)一致
+        self.assertEqual(list(results), pipeline.process(json_list))
+        
+        # 有透传字段时结果也与process一致
+        pipeline.set_passthrough_fields("id")
+        self.assertEqual(list(pipeline.process_many(json_list)), pipeline.process(json_list))
+    
+    def test_process_batch(self):
+        """测试process_batch方法"""
+        batch_op = BatchUpperOperator()
+        pipeline = Pipeline(
+            [AddFieldOperator("field1", "value1"), batch_op, SplitOperator()],
+            passthrough_fields=["id"]
+        )
+        
+        # 处理JSON数据列表
+        json_list = [{"id": 1, "text": "a"}, {"id": 2, "text": "b,c"}]
+        result = pipeline.process_batch(json_list)
+        
+        # 检查结果与逐条处理一致，且批处理操作符只被调用一次
+        expected = [r for item in json_list for r in pipeline._process_single_item(item)]
+        self.assertEqual(result, expected)
+        self.assertEqual([item["text"] for item in result], ["A", "B", "C"])
+        self.assertEqual([item["id"] for item in result], [1, 2, 2])
+        self.assertEqual(batch_op.batch_calls, 1)
+        self.assertEqual(pipeline.process_batch([]), [])
+        
+        # 展平模式下process处理列表时同样按批执行
+        self.assertEqual(pipeline.process(json_list), expected)
+        self.assertEqual(batch_op.batch_calls, 2)
+    
+    def test_process_batch_unaligned(self):
+        """测试批处理结果与输入不对应的操作符仍逐条处理"""
+        batch_op = BatchUpperOperator()
+        batch_op.batch_aligned = False
+        pipeline = Pipeline([batch_op])
+        
+        # 检查结果
+        json_list = [{"text": "a"}, {"text": "b"}]
+        self.assertEqual(pipeline.process_batch(json_list), [{"text": "A"}, {"text": "B"}])
+        self.assertEqual(pipeline.process(json_list), [{"text": "A"}, {"text": "B"}])
+        self.assertEqual(batch_op.batch_calls, 0)
+    
+    def test_nested_split_batch_aggregate(self):
+        """测试嵌套模式下拆分后的数据整批交给批处理操作符"""
+        batch_op = BatchUpperOperator()
+        pipeline = Pipeline([SplitOperator(), batch_op, JoinOperator()], collection_mode=Pipeline.NESTED)
+        
+        # 检查结果，批处理操作符只被调用一次
+        self.assertEqual(pipeline.process({"text": "a,b,c"}), {"text": "A,B,C"})
+        self.assertEqual(batch_op.batch_calls, 1)
+    
     def test_iter(self):
         """测试__iter__方法"""
         op1 = MockOperator(name="Op1")
@@ -100,5 +160,45 @@ class AddFieldOperator(Operator):
         return result
 
 
+class BatchUpperOperator(Operator):
+    """用于测试的支持批处理的操作符，将text字段转换为大写"""
+    
+    batch_aligned = True
+    
+    def __init__(self):
+        super().__init__(supports_batch=True)
+        self.batch_calls = 0
+    
+    def process_item(self, json_data):
+        """转换单个数据"""
+        result = json_data.copy()
+        result["text"] = result["text"].upper()
+        return result
+    
+    def process_batch(self, json_data_list):
+        """批量转换数据并记录调用次数"""
+        self.batch_calls += 1
+        return [self.process_item(item) for item in json_data_list]
+
+
+class SplitOperator(Operator):
+    """用于测试的拆分操作符，按逗号将text字段拆分为多条数据"""
+    
+    def process_item(self, json_data):
+        """拆分单个数据"""
+        return [{"text": part} for part in json_data["text"].split(",")]
+
+
+
+class JoinOperator(Operator):
+    """用于测试的合并操作符，将多条数据的text字段用逗号连接"""
+    
+    def __init__(self):
+        super().__init__(supports_batch=True)
+    
+    def process_batch(self, json_data_list):
+        """合并整批数据"""
+        return {"text": ",".join(item["text"] for item in json_data_list)}
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
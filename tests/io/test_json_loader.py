@@ -0,0 +1,86 @@
+"""
+JSON加载器测试模块
+
+该模块包含对JsonLoader类的单元测试。
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from jsonflow.io import JsonLoader
+
+class TestJsonLoader(unittest.TestCase):
+    """JsonLoader类的测试类"""
+
+    def setUp(self):
+        """创建测试文件"""
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write('{"id": 1, "text": "你好"}\n')
+            f.write('\n')
+            f.write('  \r\n')
+            f.write('{"id": 2, "value": NaN}\r\n')
+            f.write('{"id": 3, "tags": ["a", "b"]}')
+
+    def tearDown(self):
+        """删除测试文件"""
+        os.remove(self.path)
+
+    def test_iter(self):
+        """测试逐行加载，跳过空行"""
+        items = list(JsonLoader(self.path))
+
+        # 检查结果
+        self.assertEqual(len(items), 3)
+        self.assertEqual(items[0], {"id": 1, "text": "你好"})
+        self.assertEqual(items[1]["id"], 2)
+        self.assertNotEqual(items[1]["value"], items[1]["value"])  # NaN
+        self.assertEqual(items[2], {"id": 3, "tags": ["a", "b"]})
+
+    def test_iter_without_mmap(self):
+        """测试不使用内存映射时结果一致"""
+        self.assertEqual(
+            repr(list(JsonLoader(self.path, use_mmap=False))),
+            repr(list(JsonLoader(self.path)))
+        )
+
+    def test_empty_file(self):
+        """测试空文件"""
+        with open(self.path, "w", encoding="utf-8"):
+            pass
+        self.assertEqual(JsonLoader(self.path).load(), [])
+
+    def test_big_int(self):
+        """测试超过64位的整数加载后保持精确"""
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"id": 12345678901234567890123}\n')
+        for use_mmap in (True, False):
+            self.assertEqual(JsonLoader(self.path, use_mmap=use_mmap).load(), [{"id": 12345678901234567890123}])
+
+    def test_load_batch(self):
+        """测试批量加载"""
+        batches = list(JsonLoader(self.path).load_batch(batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+
+    def test_invalid_json(self):
+        """测试无效JSON"""
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"id": 1\n')
+        with self.assertRaises(json.JSONDecodeError):
+            JsonLoader(self.path).load()
+
+    def test_from_json_strings(self):
+        """测试从JSON字符串列表解析"""
+        items = JsonLoader.from_json_strings(['{"a": 1}', '   ', '[1, 2]'])
+        self.assertEqual(items, [{"a": 1}, [1, 2]])
+        self.assertEqual(JsonLoader.from_json_string('{"a": "b"}'), {"a": "b"})
+
+    def test_from_json_bytes_list(self):
+        """测试从JSON字节串列表解析"""
+        items = JsonLoader.from_json_bytes_list([b'{"a": 1}', b'', b' \n', '{"b": "中"}'.encode("utf-8")])
+        self.assertEqual(items, [{"a": 1}, {"b": "中"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
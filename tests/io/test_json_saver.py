@@ -0,0 +1,72 @@
+"""
+JSON保存器测试模块
+
+该模块包含对JsonSaver类的单元测试。
+"""
+
+import os
+import io
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+from jsonflow.io import JsonSaver
+
+class TestJsonSaver(unittest.TestCase):
+    """JsonSaver类的测试类"""
+
+    def setUp(self):
+        """创建临时输出文件路径"""
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+
+    def tearDown(self):
+        """删除临时输出文件"""
+        os.remove(self.path)
+
+    def read_lines(self):
+        """读取输出文件的每一行"""
+        with open(self.path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_write_many(self):
+        """测试在上下文管理器中批量写入"""
+        items = [{"id": 1, "text": "你好"}, {"id": 2, "text": "world"}]
+        with JsonSaver(self.path) as saver:
+            saver.write_many(items)
+            saver.write({"id": 3})
+            saver.write_many([])
+
+        # 检查结果
+        self.assertEqual(self.read_lines(), items + [{"id": 3}])
+        with open(self.path, encoding="utf-8") as f:
+            self.assertIn("你好", f.read())
+
+    def test_write_without_context(self):
+        """测试不使用上下文管理器时追加写入"""
+        JsonSaver.to_file(self.path, {"id": 1})
+        JsonSaver.to_file(self.path, [{"id": 2}, {"id": 3}])
+
+        # 检查结果
+        self.assertEqual(self.read_lines(), [{"id": 1}, {"id": 2}, {"id": 3}])
+
+    def test_non_string_keys(self):
+        """测试非字符串键与标准库行为一致"""
+        with JsonSaver(self.path) as saver:
+            saver.write({1: "a"})
+
+        # 检查结果
+        self.assertEqual(self.read_lines(), [{"1": "a"}])
+
+    def test_to_stdout(self):
+        """测试输出到标准输出"""
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            JsonSaver.to_stdout([{"a": 1}, {"b": "中"}])
+
+        # 检查结果
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], [{"a": 1}, {"b": "中"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+JSON表达式操作符测试模块
+
+该模块包含对JsonFieldMapper和JsonTemplateOperator操作符的单元测试。
+"""
+
+import unittest
+from jsonflow.operators.json_ops import JsonExpressionOperator, JsonFieldMapper, JsonTemplateOperator
+
+class TestJsonExpressionOperator(unittest.TestCase):
+    """JsonExpressionOperator类的测试类"""
+
+    def test_string_expressions(self):
+        """测试字符串表达式"""
+        expr_op = JsonExpressionOperator({
+            "full_name": "$.user.first + ' ' + $.user.last",
+            "first_item": "upper($.items[0])",
+            "count": "len($.items)",
+            "long_items": "[i for i in $.items if len(i) > $.min_len]",
+            "quoted": "$[\"quote\"] + '!'",
+            "missing": "$.user.email"
+        })
+        result = expr_op.process({
+            "user": {"first": "Ann", "last": "O'Neil"},
+            "items": ["ab", "abcd"],
+            "min_len": 2,
+            "quote": "it's"
+        })
+
+        # 检查结果
+        self.assertEqual(result["full_name"], "Ann O'Neil")
+        self.assertEqual(result["first_item"], "AB")
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(result["long_items"], ["abcd"])
+        self.assertEqual(result["quoted"], "it's!")
+        self.assertIsNone(result["missing"])
+
+    def test_sequential(self):
+        """测试顺序求值时引用前面表达式的结果"""
+        expr_op = JsonExpressionOperator({
+            "total": lambda d: d["price"] * d["quantity"],
+            "summary": "'total: ' + str($.total)",
+            "double": lambda d: d["total"] * 2
+        }, sequential=True)
+        result = expr_op.process({"price": 2, "quantity": 3})
+
+        # 检查结果
+        self.assertEqual(result["summary"], "total: 6")
+        self.assertEqual(result["double"], 12)
+
+    def test_aggregate(self):
+        """测试数组字段聚合"""
+        expr_op = JsonExpressionOperator({
+            "total": JsonExpressionOperator.aggregate("orders", "sum_product", ("price", "quantity")),
+            "stats.count": JsonExpressionOperator.aggregate("orders", "sum", ("quantity",)),
+            "stats.avg_price": JsonExpressionOperator.aggregate("orders", "avg", ("price",)),
+            "none": JsonExpressionOperator.aggregate("missing", "sum", ("price",))
+        })
+        result = expr_op.process({
+            "orders": [
+                {"price": 10.0, "quantity": 1},
+                {"price": 20.0, "quantity": 3}
+            ]
+        })
+
+        # 检查结果
+        self.assertEqual(result["total"], 70.0)
+        self.assertEqual(result["stats"], {"count": 4, "avg_price": 15.0})
+        self.assertEqual(result["none"], 0)
+
+    def test_aggregate_invalid(self):
+        """测试不支持的聚合方式"""
+        with self.assertRaises(ValueError):
+            JsonExpressionOperator.aggregate("orders", "median")
+        with self.assertRaises(ValueError):
+            JsonExpressionOperator.aggregate("orders", "sum_product", ("price",))
+
+
+class TestJsonFieldMapper(unittest.TestCase):
+    """JsonFieldMapper类的测试类"""
+
+    def setUp(self):
+        """设置测试数据"""
+        self.json_data = {
+            "user": {"name": "O'Brien", "tags": ["a", "b"]},
+            "orders": [
+                {"id": "A001", "price": 10},
+                {"id": "A002", "price": 20}
+            ]
+        }
+
+    def test_field_mapping(self):
+        """测试简单字段和数组映射"""
+        mapper = JsonFieldMapper({
+            "customer": "user.name",
+            "first_tag": "user.tags[0]",
+            "order_ids": "orders[*].id",
+            "orders_copy": "orders[*]",
+            "missing": "user.email",
+            "total": lambda d: sum(o["price"] for o in d["orders"])
+        })
+        result = mapper.process(self.json_data)
+
+        # 检查结果
+        self.assertEqual(result["customer"], "O'Brien")
+        self.assertEqual(result["first_tag"], "a")
+        self.assertEqual(result["order_ids"], ["A001", "A002"])
+        self.assertEqual(result["orders_copy"], self.json_data["orders"])
+        self.assertIsNone(result["missing"])
+        self.assertEqual(result["total"], 30)
+
+    def test_nested_target(self):
+        """测试映射到嵌套目标字段"""
+        mapper = JsonFieldMapper({"profile.name": "user.name", "ids": "items[*].id"})
+        result = mapper.process(self.json_data)
+
+        # 检查结果
+        self.assertEqual(result["profile"], {"name": "O'Brien"})
+        self.assertEqual(result["ids"], [])
+
+    def test_shared_target_prefix(self):
+        """测试多个目标字段共享前缀以及覆盖非字典的中间字段"""
+        mapper = JsonFieldMapper({"meta.name": "user.name", "meta.first_tag": "user.tags[0]", "customer.name.full": "user.name"})
+        self.json_data["customer"] = "legacy"
+        result = mapper.process(self.json_data)
+
+        # 检查结果
+        self.assertEqual(result["meta"], {"name": "O'Brien", "first_tag": "a"})
+        self.assertEqual(result["customer"], {"name": {"full": "O'Brien"}})
+
+
+class TestJsonTemplateOperator(unittest.TestCase):
+    """JsonTemplateOperator类的测试类"""
+
+    def test_render(self):
+        """测试模板渲染和修饰符"""
+        template_op = JsonTemplateOperator({
+            "greeting": "Hello, {user.name|upper}!",
+            "summary": "{orders|length} orders, first: {orders[0].id}",
+            "tags": "{user.tags|join:-}",
+            "fallback": "{user.email|default:none} {missing}",
+            "meta.plain": "no fields"
+        })
+        result = template_op.process({
+            "user": {"name": "Ann", "tags": ["x", "y"]},
+            "orders": [{"id": "A001"}, {"id": "A002"}]
+        })
+
+        # 检查结果
+        self.assertEqual(result["greeting"], "Hello, ANN!")
+        self.assertEqual(result["summary"], "2 orders, first: A001")
+        self.assertEqual(result["tags"], "x-y")
+        self.assertEqual(result["fallback"], "none ")
+        self.assertEqual(result["meta"], {"plain": "no fields"})
+
+    def test_render_template(self):
+        """测试直接渲染模板字符串"""
+        template_op = JsonTemplateOperator({})
+        self.assertEqual(template_op._render_template("{a}-{b[1]}", {"a": 1, "b": [2, 3]}), "1-3")
+        self.assertEqual(template_op._render_template("", {"a": 1}), "")
+
+    def test_literal_quotes(self):
+        """测试模板字面量中的引号、反斜杠和换行"""
+        template = 'it\'s "{name}"\\\n\'\'\' + str(1) + \''
+        template_op = JsonTemplateOperator({"text": template})
+        result = template_op.process({"name": "x"})
+
+        # 检查结果
+        self.assertEqual(result["text"], template.replace("{name}", "x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+JSON结构提取操作符测试模块
+
+该模块包含对JsonStructureExtractor操作符的单元测试。
+"""
+
+import unittest
+from types import MappingProxyType
+from jsonflow.operators.json_ops import JsonStructureExtractor
+
+class TestJsonStructureExtractor(unittest.TestCase):
+    """JsonStructureExtractor类的测试类"""
+
+    def setUp(self):
+        """设置测试数据"""
+        self.json_data = {
+            "id": 1,
+            "user": {"name": "John", "active": True},
+            "tags": ["a", "b"],
+            "notes": None
+        }
+
+    def test_flat_paths(self):
+        """测试扁平化路径提取"""
+        extractor = JsonStructureExtractor(flatten=True)
+        result = extractor.process(self.json_data)
+
+        # 检查结果
+        expected = [
+            "id (int)",
+            "user.name (str)",
+            "user.active (bool)",
+            "tags[0] (str)",
+            "tags[1] (str)",
+            "notes (NoneType)"
+        ]
+        self.assertEqual(result["structure"], expected)
+        self.assertEqual(result["id"], 1)
+        self.assertNotIn("structure", self.json_data)
+
+    def test_flat_paths_without_arrays(self):
+        """测试不展开数组索引的扁平化路径提取"""
+        extractor = JsonStructureExtractor(include_types=False, include_arrays=False, flatten=True)
+        result = extractor.process(self.json_data)
+
+        # 检查结果
+        expected = ["id", "user.name", "user.active", "tags[]", "notes"]
+        self.assertEqual(result["structure"], expected)
+
+    def test_nested_structure(self):
+        """测试嵌套结构提取"""
+        extractor = JsonStructureExtractor(target_field="schema")
+        result = extractor.process({"user": {"name": "John"}, "tags": []})
+
+        # 检查结果
+        expected = {
+            "user": {
+                "name": {"__type__": "str", "__value__": "John"},
+                "__type__": "object"
+            },
+            "tags": {"__type__": "array", "__items__": "unknown"},
+            "__type__": "object"
+        }
+        self.assertEqual(result["schema"], expected)
+
+    def test_max_depth(self):
+        """测试深度限制"""
+        extractor = JsonStructureExtractor(max_depth=1, flatten=True)
+        result = extractor.process({"a": {"b": {"c": 1}}, "d": 2})
+
+        # 检查结果
+        self.assertEqual(result["structure"], ["d (int)"])
+
+    def test_deep_nesting(self):
+        """测试嵌套深度超过递归限制的数据"""
+        data = {"leaf": 1}
+        for _ in range(5000):
+            data = {"a": data}
+
+        # 检查结果
+        result = JsonStructureExtractor(flatten=True, include_types=False).process(data)
+        self.assertEqual(result["structure"], [".".join(["a"] * 5000 + ["leaf"])])
+        structure = JsonStructureExtractor().process(data)["structure"]
+        for _ in range(5000):
+            structure = structure["a"]
+        self.assertEqual(structure["leaf"], {"__type__": "int", "__value__": "1"})
+
+    def test_read_only_input(self):
+        """测试只读映射作为输入"""
+        extractor = JsonStructureExtractor(flatten=True)
+        read_only_data = MappingProxyType(self.json_data)
+        result = extractor.process(read_only_data)
+
+        # 检查结果与普通dict输入一致
+        self.assertIsInstance(result, dict)
+        self.assertEqual(result, extractor.process(self.json_data))
+
+    def test_inplace(self):
+        """测试直接修改输入数据"""
+        extractor = JsonStructureExtractor(flatten=True, inplace=True)
+        expected = JsonStructureExtractor(flatten=True).process(self.json_data)
+        result = extractor.process(self.json_data)
+
+        # 检查结果写入了输入对象本身
+        self.assertIs(result, self.json_data)
+        self.assertEqual(result, expected)
+
+        # 只读映射仍然被复制
+        read_only_result = extractor.process(MappingProxyType({"id": 1}))
+        self.assertEqual(read_only_result, {"id": 1, "structure": ["id (int)"]})
+
+    def test_process_empty(self):
+        """测试处理空数据"""
+        self.assertEqual(JsonStructureExtractor().process({}), {"structure": {}})
+        self.assertEqual(JsonStructureExtractor(flatten=True).process({}), {"structure": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
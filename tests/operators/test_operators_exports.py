@@ -0,0 +1,38 @@
+"""
+操作符包导出测试模块
+
+该模块测试jsonflow.operators的按需导入与星号导入。
+"""
+
+import sys
+import subprocess
+import unittest
+
+import jsonflow.operators as operators
+
+
+class TestOperatorsExports(unittest.TestCase):
+    """jsonflow.operators导出测试类"""
+
+    def test_star_import(self):
+        """测试星号导入绑定全部内置操作符"""
+        namespace = {}
+        exec("from jsonflow.operators import *", namespace)
+        for name in ("TextNormalizer", "JsonFilter", "JsonTransformer", "ModelInvoker"):
+            self.assertIs(namespace[name], getattr(operators, name))
+
+    def test_dir(self):
+        """测试dir列出尚未导入的操作符"""
+        self.assertTrue({"TextNormalizer", "ModelInvoker"} <= set(dir(operators)))
+
+    def test_lazy_import(self):
+        """测试导入包时不加载模型操作符"""
+        code = (
+            "import sys, jsonflow.operators\n"
+            "assert 'jsonflow.operators.model' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -161,6 +161,32 @@ class TestTextNormalizer(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_already_normalized_text(self):
+        """测试已规范化文本和单个非空格空白字符"""
+        normalizer = TextNormalizer()
+        json_data = {
+            "clean": "Hello World",
+            "tab": "Hello\tWorld",
+            "newline": "Hello\nWorld"
+        }
+        result = normalizer.process(json_data)
+        
+        # 检查结果
+        expected = {
+            "clean": "Hello World",
+            "tab": "Hello World",
+            "newline": "Hello World"
+        }
+        self.assertEqual(result, expected)
+
+    def test_normalize_text(self):
+        """测试直接规范化单个文本"""
+        normalizer = TextNormalizer(lower_case=True)
+        self.assertEqual(normalizer.normalize_text("  Hello \t  World  "), "hello world")
+        
+        custom = TextNormalizer(normalize_func=lambda text: text[::-1])
+        self.assertEqual(custom.normalize_text("abc"), "cba")
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
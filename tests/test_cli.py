@@ -0,0 +1,154 @@
+"""
+命令行工具测试模块
+
+该模块包含对jsonflow.cli中键结构分析函数和命令入口的单元测试。
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from collections import defaultdict
+from unittest.mock import patch
+from jsonflow import cli
+from jsonflow.cli import (
+    extract_key_structure, analyze_jsonl_keys, analyze_jsonl_with_pipeline, type_names, TYPE_BITS, main
+)
+
+def decode(all_keys):
+    """把键路径到类型位掩码的映射还原为键路径到类型名称集合的映射"""
+    return {key: set(type_names(mask)) for key, mask in all_keys.items()}
+
+LINES = [
+    '{"id": 1, "user": {"name": "a", "tags": ["x", 1]}, "items": [{"sku": "s1", "price": 1.5}]}',
+    '',
+    '{"id": "2", "user": null, "items": [], "ok": true}',
+    '[1, 2]',
+]
+
+class TestCli(unittest.TestCase):
+    """命令行工具的测试类"""
+
+    def setUp(self):
+        """创建测试文件"""
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(LINES))
+
+    def tearDown(self):
+        """删除测试文件"""
+        os.remove(self.path)
+
+    def test_extract_key_structure(self):
+        """测试提取单个对象的键路径和类型"""
+        result = extract_key_structure({"a": {"b": [1, {"c": None}]}, "d": False})
+
+        # 检查结果
+        self.assertEqual(result["a.b[*]"], TYPE_BITS["integer"] | TYPE_BITS["object"])
+        self.assertEqual(decode(result), {
+            "a": {"object"},
+            "a.b": {"array"},
+            "a.b[*]": {"integer", "object"},
+            "a.b[*].c": {"null"},
+            "d": {"boolean"},
+        })
+
+    def test_extract_key_structure_independent(self):
+        """测试每次调用返回独立的结果，嵌套类型不同的对象结果不同"""
+        first = extract_key_structure({"a": {"b": 1}})
+        first["a"] |= TYPE_BITS["string"]
+        second = extract_key_structure({"a": {"b": 2}})
+        third = extract_key_structure({"a": {"b": "x"}})
+
+        # 检查结果
+        self.assertEqual(decode(second), {"a": {"object"}, "a.b": {"integer"}})
+        self.assertEqual(decode(third), {"a": {"object"}, "a.b": {"string"}})
+
+    @unittest.skipIf(cli._cwalk is None, "jsonflow._cwalk extension is not built")
+    def test_cwalk(self):
+        """测试C扩展与纯Python实现的遍历结果一致"""
+        data = {"a": {"b": [1, True, None, {"c": [[], {}]}]}, "d": [{"e": i} for i in range(20)], "f": 1.5}
+        for prefix in ("", "p"):
+            expected = defaultdict(int)
+            cli._walk(data, prefix, expected)
+            result = defaultdict(int)
+            cli._cwalk(data, prefix, result, cli.ARRAY_SAMPLE_SIZE, cli._path_cache, cli._item_path_cache)
+
+            # 检查结果
+            self.assertEqual(result, expected)
+
+    def test_analyze_jsonl_keys(self):
+        """测试统计整个文件的键路径，忽略空行和不是对象的行"""
+        all_keys = decode(analyze_jsonl_keys(self.path))
+
+        # 检查结果
+        self.assertEqual(all_keys["id"], {"integer", "string"})
+        self.assertEqual(all_keys["user"], {"object", "null"})
+        self.assertEqual(all_keys["user.tags[*]"], {"string", "integer"})
+        self.assertEqual(all_keys["items[*].price"], {"number"})
+        self.assertEqual(all_keys["ok"], {"boolean"})
+
+    def test_analyze_jsonl_with_pipeline(self):
+        """测试使用JsonStructureExtractor统计键路径"""
+        all_keys = decode(analyze_jsonl_with_pipeline(self.path))
+
+        # 检查结果
+        self.assertEqual(all_keys["id"], {"int", "str"})
+        self.assertEqual(all_keys["user.name"], {"str"})
+        self.assertEqual(all_keys["items[].price"], {"float"})
+        self.assertEqual(all_keys["items"], {"array"})
+
+    def test_sample_limit(self):
+        """测试键路径达到检查次数后不再统计新的类型"""
+        all_keys = decode(analyze_jsonl_keys(self.path, sample_limit=1))
+
+        # 检查结果：id只检查了第一行
+        self.assertEqual(all_keys["id"], {"integer"})
+        self.assertEqual(all_keys["user.name"], {"string"})
+        self.assertEqual(all_keys["ok"], {"boolean"})
+
+        with patch("sys.stderr", new_callable=io.StringIO):
+            with self.assertRaises(SystemExit):
+                main(["analyze", self.path, "--pipeline", "--sample-limit", "1"])
+
+    def test_parallel(self):
+        """测试多进程分片统计与单进程的结果一致"""
+        with patch.object(cli, "_MIN_SHARD_SIZE", 1):
+            # 分片边界落在行中间时应对齐到下一行
+            self.assertGreater(len(cli._shard_ranges(self.path, 4)), 1)
+            self.assertEqual(dict(analyze_jsonl_keys(self.path, jobs=4)), dict(analyze_jsonl_keys(self.path)))
+            self.assertEqual(
+                dict(analyze_jsonl_with_pipeline(self.path, jobs=3)),
+                dict(analyze_jsonl_with_pipeline(self.path))
+            )
+
+    def test_parallel_small_file(self):
+        """测试空文件和只有一个分片的文件不启动进程池"""
+        with patch.object(cli.concurrent.futures, "ProcessPoolExecutor") as executor:
+            self.assertEqual(dict(analyze_jsonl_keys(self.path, jobs=4)), dict(analyze_jsonl_keys(self.path)))
+            with open(self.path, "w", encoding="utf-8"):
+                pass
+            self.assertEqual(dict(analyze_jsonl_keys(self.path, jobs=4)), {})
+            self.assertEqual(dict(analyze_jsonl_with_pipeline(self.path, jobs=4)), {})
+        executor.assert_not_called()
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            self.assertEqual(main(["analyze", self.path, "--jobs", "4"]), 0)
+        self.assertEqual(len(stdout.getvalue().splitlines()), 2)
+
+    def test_main(self):
+        """测试analyze命令的输出和退出码"""
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            self.assertEqual(main(["analyze", self.path]), 0)
+
+        # 检查结果
+        lines = stdout.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith("Key"))
+        self.assertIn(f"{'id':<50} | {'integer, string':<30}", lines)
+
+        with patch("sys.stderr", new_callable=io.StringIO):
+            self.assertEqual(main(["analyze", self.path + ".missing"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+JSON编解码工具测试模块
+
+该模块包含对fast_json模块中函数的单元测试。
+"""
+
+import json
+import unittest
+from unittest import mock
+from jsonflow.utils import fast_json
+from jsonflow.utils.fast_json import loads, dumps, coerce_json, dumps_line
+
+class TestFastJson(unittest.TestCase):
+    """fast_json模块的测试类"""
+
+    def test_loads(self):
+        """测试解析字符串、字节和标准库扩展的常量"""
+        self.assertEqual(loads('{"a": "中"}'), {"a": "中"})
+        self.assertEqual(loads('{"a": 1}'.encode("utf-8")), {"a": 1})
+        self.assertEqual(loads(memoryview(b'[1, 2]')), [1, 2])
+        self.assertEqual(loads('{"a": Infinity}')["a"], float("inf"))
+        with self.assertRaises(json.JSONDecodeError):
+            loads('{"a": ')
+
+    def test_loads_big_int(self):
+        """测试超过64位的整数保持精确"""
+        big = 12345678901234567890123
+        self.assertEqual(loads('{"id": %d}' % big)["id"], big)
+        self.assertEqual(loads(b'{"id": %d}' % big)["id"], big)
+        self.assertEqual(loads(memoryview(b'[-%d]' % big)), [-big])
+
+    @unittest.skipIf(fast_json.orjson is None, "orjson is not installed")
+    def test_loads_long_digit_string(self):
+        """测试字符串值中的长数字保持字符串类型，且不回退到标准库解析"""
+        data = b'{"card": "12345678901234567890123", "price": 1.2345678901234567890123}'
+        with mock.patch.object(fast_json.json, "loads", wraps=json.loads) as json_loads:
+            result = loads(data)
+            self.assertEqual(loads(data.decode("utf-8")), result)
+        self.assertEqual(result["card"], "12345678901234567890123")
+        self.assertIsInstance(result["price"], float)
+        json_loads.assert_not_called()
+
+    def test_coerce_json(self):
+        """测试已解析的数据直接返回"""
+        data = {"a": [1, 2]}
+        self.assertIs(coerce_json(data), data)
+        self.assertIs(coerce_json(data["a"]), data["a"])
+        self.assertEqual(coerce_json('{"a": [1, 2]}'), data)
+
+    def test_dumps(self):
+        """测试序列化为紧凑的JSON字符串"""
+        self.assertEqual(dumps({"b": 1, "a": "中"}, sort_keys=True), '{"a":"中","b":1}')
+        self.assertEqual(dumps({1: "a"}), '{"1":"a"}')
+        self.assertEqual(dumps({"a": {1, 2} - {1, 2}}, default=list), '{"a":[]}')
+
+    def test_dumps_line(self):
+        """测试序列化为JSON行"""
+        line = dumps_line({"a": "中"})
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertIn("中".encode("utf-8"), line)
+        self.assertEqual(json.loads(line), {"a": "中"})
+        self.assertEqual(json.loads(dumps_line({1: "a"})), {"1": "a"})
+
+    def test_dumps_format(self):
+        """测试是否安装orjson、是否回退到标准库时输出格式一致"""
+        data = {"a": "中", "b": [1, 2.5, None], "c": {"d": True}}
+        expected = '{"a":"中","b":[1,2.5,null],"c":{"d":true}}'
+        with mock.patch.object(fast_json, "orjson", None):
+            self.assertEqual(dumps_line(data), (expected + "\n").encode("utf-8"))
+            self.assertEqual(dumps(data), expected)
+        self.assertEqual(dumps_line(data), (expected + "\n").encode("utf-8"))
+        self.assertEqual(dumps(data), expected)
+        # 非字符串键逐条回退到标准库时也是紧凑格式
+        self.assertEqual(dumps_line({1: "a", "b": [1]}), b'{"1":"a","b":[1]}\n')
+
+    def test_dumps_non_finite(self):
+        """测试NaN和Infinity与标准库一样写出，不会变为null"""
+        self.assertEqual(dumps_line({"n": float("nan"), "m": None}), b'{"n":NaN,"m":null}\n')
+        self.assertEqual(dumps({"n": [float("-inf")]}), '{"n":[-Infinity]}')
+        self.assertEqual(dumps_line({"n": None}), b'{"n":null}\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+HTTP客户端工具测试模块
+
+该模块包含对http模块中函数的单元测试。
+"""
+
+import sys
+import unittest
+from unittest import mock
+from jsonflow.utils import http
+
+class FakeClient:
+    """记录创建参数的httpx.Client替身"""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.is_closed = False
+
+class TestHttp(unittest.TestCase):
+    """http模块的测试类"""
+
+    def setUp(self):
+        """清除共享客户端"""
+        http._shared_client = None
+        self.httpx = mock.MagicMock(Client=FakeClient)
+
+    def tearDown(self):
+        """清除共享客户端"""
+        http._shared_client = None
+
+    def test_get_http_client(self):
+        """测试共享客户端只创建一次，关闭后重新创建"""
+        with mock.patch.dict(sys.modules, {"httpx": self.httpx}):
+            client = http.get_http_client()
+            self.assertIs(http.get_http_client(), client)
+            self.httpx.Limits.assert_called_once_with(
+                max_keepalive_connections=http.MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=http.MAX_CONNECTIONS
+            )
+
+            client.is_closed = True
+            self.assertIsNot(http.get_http_client(), client)
+
+    def test_http2(self):
+        """测试只有安装了h2时才启用HTTP/2"""
+        with mock.patch.dict(sys.modules, {"httpx": self.httpx, "h2": None}):
+            self.assertFalse(http.get_http_client().kwargs["http2"])
+        http._shared_client = None
+        with mock.patch.dict(sys.modules, {"httpx": self.httpx, "h2": mock.MagicMock()}):
+            self.assertTrue(http.get_http_client().kwargs["http2"])
+
+    def test_missing_httpx(self):
+        """测试未安装httpx时抛出ImportError"""
+        with mock.patch.dict(sys.modules, {"httpx": None}):
+            with self.assertRaises(ImportError):
+                http.get_http_client()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+图像工具测试模块
+
+该模块包含对image模块中函数的单元测试。
+"""
+
+import os
+import base64
+import tempfile
+import unittest
+from unittest import mock
+from jsonflow.utils import image
+from jsonflow.utils.image import guess_image_mime, encode_image, image_data_url, is_image_url
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+
+class TestImage(unittest.TestCase):
+    """image模块的测试类"""
+
+    def setUp(self):
+        """创建临时图像文件"""
+        fd, self.path = tempfile.mkstemp(suffix=".png")
+        with os.fdopen(fd, "wb") as f:
+            f.write(PNG_BYTES)
+
+    def tearDown(self):
+        """删除临时图像文件"""
+        os.remove(self.path)
+
+    def test_guess_image_mime(self):
+        """测试根据文件头识别MIME类型"""
+        self.assertEqual(guess_image_mime(PNG_BYTES[:12]), "image/png")
+        self.assertEqual(guess_image_mime(b"RIFF\x00\x00\x00\x00WEBP"), "image/webp")
+        self.assertEqual(guess_image_mime(b"unknown"), "image/jpeg")
+
+    def test_encode_image(self):
+        """测试编码结果和data URL"""
+        expected = base64.b64encode(PNG_BYTES).decode("ascii")
+        self.assertEqual(encode_image(self.path), ("image/png", expected))
+        self.assertEqual(image_data_url(self.path), f"data:image/png;base64,{expected}")
+
+    def test_encode_image_cached(self):
+        """测试同一图像只编码一次，文件变化后重新编码"""
+        expected = base64.b64encode(PNG_BYTES + b"\x01").decode("ascii")
+        with mock.patch.object(image, "b64encode", wraps=image.b64encode) as b64encode:
+            encode_image(self.path)
+            encode_image(self.path)
+            self.assertEqual(b64encode.call_count, 1)
+
+            with open(self.path, "ab") as f:
+                f.write(b"\x01")
+            self.assertEqual(encode_image(self.path)[1], expected)
+            self.assertEqual(b64encode.call_count, 2)
+
+    def test_image_url_passthrough(self):
+        """测试已经是URL的图像原样返回，不读取文件"""
+        for url in ("https://example.com/a.png", "http://example.com/a.png", "data:image/png;base64,AAAA"):
+            self.assertTrue(is_image_url(url))
+            with mock.patch.object(image, "encode_image") as encode:
+                self.assertEqual(image_data_url(url), url)
+                encode.assert_not_called()
+        self.assertFalse(is_image_url(self.path))
+        self.assertFalse(is_image_url(None))
+
+    def test_empty_and_missing(self):
+        """测试空文件和不存在的文件"""
+        with open(self.path, "wb"):
+            pass
+        self.assertEqual(encode_image(self.path), ("image/jpeg", ""))
+        with self.assertRaises(OSError):
+            encode_image(self.path + ".missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
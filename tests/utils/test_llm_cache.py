@@ -0,0 +1,214 @@
+"""
+大模型响应缓存测试模块
+
+该模块包含对LLMCache及其存储后端的单元测试。
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import datetime
+import subprocess
+from unittest import mock
+from jsonflow.utils import fast_json
+from jsonflow.utils import LLMCache, MemoryBackend, FileBackend, RedisBackend
+
+MESSAGES = [{"role": "user", "content": "问题"}]
+
+class TestLLMCache(unittest.TestCase):
+    """LLMCache类的测试类"""
+
+    def test_lazy_import(self):
+        """测试导入jsonflow时不加载缓存模块，访问时才导入"""
+        code = (
+            "import sys, jsonflow, jsonflow.utils\n"
+            "assert 'jsonflow.utils.llm_cache' not in sys.modules\n"
+            "from jsonflow.utils import *\n"
+            "assert LLMCache.__module__ == 'jsonflow.utils.llm_cache'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_cache_key(self):
+        """测试缓存键的计算"""
+        key = LLMCache.cache_key("model", MESSAGES, 0, 100)
+
+        # 相同请求的缓存键相同，任一参数不同时缓存键不同
+        self.assertEqual(key, LLMCache.cache_key("model", list(MESSAGES), 0, 100))
+        self.assertNotEqual(key, LLMCache.cache_key("model", MESSAGES, 0, 200))
+        self.assertNotEqual(key, LLMCache.cache_key("model", MESSAGES, 0, 100, top_p=0.5))
+
+        # 结果不确定的调用不缓存
+        self.assertIsNone(LLMCache.cache_key("model", MESSAGES, 0.7, 100))
+        self.assertIsNone(LLMCache.cache_key("model", MESSAGES, None, 100))
+
+    def test_cache_key_golden(self):
+        """测试缓存键格式固定，修改序列化方式会使持久化的缓存全部失效"""
+        messages = [
+            {"role": "system", "content": "你是助手"},
+            {"role": "user", "content": [
+                {"type": "text", "text": "描述图像"},
+                {"type": "image_url", "image_url": {"url": "data:image/png;base64,iVBORw0KGgo="}}
+            ]}
+        ]
+        self.assertEqual(
+            LLMCache.cache_key("gpt-4o", messages, 0, 256, top_p=1.0),
+            "69b98ce0bd25a93020483dbf4a201f396a355eb2df5906a019c932d281f6fc2b"
+        )
+        self.assertEqual(
+            LLMCache.cache_key("gpt-4o", MESSAGES, 0, 100, prompt_version="v1"),
+            "v1:768fdfddda2899ac77ceea959d4ed2202bdd8658b3fdc34135fabe3e5ff76eab"
+        )
+
+    def test_cache_key_environment(self):
+        """测试缓存键与是否安装orjson无关"""
+        image = "data:image/png;base64," + "A" * 1000
+        messages = [{"role": "user", "content": [
+            {"type": "text", "text": "描述图像"},
+            {"type": "image_url", "image_url": {"url": image}}
+        ]}]
+        params = {"top_p": 1e16, "seed": datetime.date(2024, 1, 1)}
+        key = LLMCache.cache_key("model", messages, 0, 100, **params)
+        with mock.patch.object(fast_json, "orjson", None):
+            self.assertEqual(key, LLMCache.cache_key("model", messages, 0, 100, **params))
+
+        # 图像按内容计算摘要，消息本身不被修改
+        other = [{"role": "user", "content": [
+            {"type": "text", "text": "描述图像"},
+            {"type": "image_url", "image_url": {"url": image + "B"}}
+        ]}]
+        self.assertNotEqual(key, LLMCache.cache_key("model", other, 0, 100, **params))
+        self.assertEqual(messages[0]["content"][1]["image_url"]["url"], image)
+
+    def test_prompt_version(self):
+        """测试提示版本作为缓存键前缀，按版本清理缓存"""
+        key = LLMCache.cache_key("model", MESSAGES, 0, 100, prompt_version="v1")
+        self.assertTrue(key.startswith("v1:"))
+        self.assertNotEqual(key, LLMCache.cache_key("model", MESSAGES, 0, 100, prompt_version="v2"))
+
+        cache = LLMCache()
+        cache.set(key, "旧回复")
+        cache.set(LLMCache.cache_key("model", MESSAGES, 0, 100, prompt_version="v2"), "新回复")
+        self.assertEqual(cache.invalidate_by_version("v1"), 1)
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.lookup("model", MESSAGES, 0, 100, "v2")[1], "新回复")
+
+        # 不支持按前缀删除的后端
+        with self.assertRaises(NotImplementedError):
+            LLMCache(mock.Mock(spec=["get", "set"])).invalidate_by_version("v1")
+
+    def test_lookup(self):
+        """测试lookup返回缓存键和缓存的响应"""
+        cache = LLMCache()
+        key, cached = cache.lookup("model", MESSAGES, 0, 100)
+        self.assertEqual(key, LLMCache.cache_key("model", MESSAGES, 0, 100))
+        self.assertIsNone(cached)
+        cache.set(key, "回复")
+        self.assertEqual(cache.lookup("model", MESSAGES, 0, 100), (key, "回复"))
+        self.assertEqual(cache.lookup("model", MESSAGES, 0.7, 100), (None, None))
+
+    def test_semantic_cache(self):
+        """测试语义缓存命中相似的纯文本请求"""
+        vocabulary = ["天气", "今天", "明天", "怎么样", "如何", "图片"]
+        embedder = mock.Mock(side_effect=lambda text: [float(word in text) for word in vocabulary])
+        cache = LLMCache(embedder=embedder, threshold=0.6)
+        key, _ = cache.lookup("model", [{"role": "user", "content": "今天天气怎么样"}], 0, 100)
+        cache.set(key, "晴")
+
+        # 相似的请求命中，不相似的请求、不同的模型不命中
+        similar = [{"role": "user", "content": "今天天气如何"}]
+        self.assertEqual(cache.lookup("model", similar, 0, 100)[1], "晴")
+        self.assertIsNone(cache.lookup("model", [{"role": "user", "content": "明天如何"}], 0, 100)[1])
+        self.assertIsNone(cache.lookup("other", similar, 0, 100)[1])
+
+        # 包含图像的请求只做精确匹配，不计算嵌入向量
+        embedder.reset_mock()
+        image_messages = [{"role": "user", "content": [
+            {"type": "text", "text": "今天天气怎么样"},
+            {"type": "image_url", "image_url": {"url": "data:image/png;base64,AAAA"}}
+        ]}]
+        self.assertIsNone(cache.lookup("model", image_messages, 0, 100)[1])
+        embedder.assert_not_called()
+
+    def test_memory_backend(self):
+        """测试内存后端的LRU淘汰"""
+        cache = LLMCache(MemoryBackend(max_size=2))
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        # 检查结果
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "3")
+        self.assertIsNone(cache.get(None))
+
+    def test_ttl(self):
+        """测试缓存过期"""
+        cache = LLMCache(ttl=10)
+        with mock.patch("time.time", return_value=1000.0):
+            cache.set("a", "1")
+            cache.set("b", "2", ttl=100)
+        with mock.patch("time.time", return_value=1050.0):
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("b"), "2")
+
+    def test_file_backend(self):
+        """测试文件后端在多个实例之间共享缓存"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cache", "llm_cache.jsonl")
+            LLMCache(FileBackend(path)).set("a", "回复")
+
+            # 检查结果
+            self.assertEqual(LLMCache(FileBackend(path)).get("a"), "回复")
+            self.assertIsNone(LLMCache(FileBackend(path)).get("b"))
+
+            # 按前缀删除后保存到文件
+            self.assertEqual(FileBackend(path).delete_prefix("a"), 1)
+            self.assertIsNone(LLMCache(FileBackend(path)).get("a"))
+
+    def test_file_backend_log(self):
+        """测试文件后端追加写入、跳过不完整的行并在加载时压缩日志"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "llm_cache.jsonl")
+            backend = FileBackend(path)
+            for i in range(5):
+                backend.set("a", f"回复{i}")
+            backend.set("b", "回复")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write('["c", "不完整')
+
+            # 检查结果：每次写入只追加一行，不完整的行被跳过
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 7)
+            backend = FileBackend(path)
+            self.assertEqual(backend.get("a"), "回复4")
+            self.assertEqual(backend.get("b"), "回复")
+            self.assertIsNone(backend.get("c"))
+
+            # 加载时日志已压缩为有效条目，不留下临时文件
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 2)
+            self.assertEqual(os.listdir(tmp_dir), ["llm_cache.jsonl"])
+
+    def test_redis_backend(self):
+        """测试Redis后端"""
+        client = mock.MagicMock()
+        client.get.return_value = "回复".encode("utf-8")
+        cache = LLMCache(RedisBackend(client=client, prefix="p:"), ttl=60)
+        cache.set("a", "回复")
+
+        # 检查结果
+        client.set.assert_called_once_with("p:a", "回复", ex=60)
+        self.assertEqual(cache.get("a"), "回复")
+        client.get.assert_called_once_with("p:a")
+
+        client.scan_iter.return_value = [b"p:v1:a", b"p:v1:b"]
+        client.delete.return_value = 1
+        self.assertEqual(cache.invalidate_by_version("v1"), 2)
+        client.scan_iter.assert_called_once_with(match="p:v1:*")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+日志工具测试模块
+
+该模块包含对logger模块中函数的单元测试。
+"""
+
+import os
+import logging
+import tempfile
+import unittest
+from jsonflow.utils import logger as logger_module
+from jsonflow.utils.logger import configure_logging, get_logger
+
+class TestConfigureLogging(unittest.TestCase):
+    """configure_logging函数的测试类"""
+
+    def setUp(self):
+        """保存根logger的配置"""
+        root_logger = logging.getLogger()
+        self.handlers = root_logger.handlers[:]
+        self.level = root_logger.level
+
+    def tearDown(self):
+        """恢复根logger的配置"""
+        if logger_module._queue_listener is not None:
+            logger_module._queue_listener.stop()
+            logger_module._queue_listener = None
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            if isinstance(handler, logging.FileHandler):
+                handler.close()
+        for handler in self.handlers:
+            root_logger.addHandler(handler)
+        root_logger.setLevel(self.level)
+
+    def test_use_queue(self):
+        """测试通过队列在后台线程中输出日志"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = os.path.join(tmp_dir, "test.log")
+            configure_logging(level="WARNING", format_str="%(message)s", log_file=log_file, use_queue=True)
+
+            # 根logger只有一个队列处理器
+            handlers = logging.getLogger().handlers
+            self.assertEqual(len(handlers), 1)
+            self.assertIsInstance(handlers[0], logging.handlers.QueueHandler)
+
+            logging.getLogger("test_logger").warning("错误: %s", "超时")
+            logging.getLogger("test_logger").info("忽略")
+            logger_module._queue_listener.stop()
+            logger_module._queue_listener = None
+
+            # 检查结果
+            with open(log_file, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "错误: 超时\n")
+
+
+    def test_use_queue_with_get_logger(self):
+        """测试使用队列时get_logger返回的logger只经由队列输出一次"""
+        before = get_logger("test_queue_before")
+        self.assertEqual(len(before.handlers), 1)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = os.path.join(tmp_dir, "test.log")
+            configure_logging(level="WARNING", format_str="%(message)s", log_file=log_file, use_queue=True)
+            after = get_logger("test_queue_after")
+
+            # 不再有同步写入控制台的处理器
+            self.assertEqual(before.handlers, [])
+            self.assertEqual(after.handlers, [])
+
+            before.warning("错误: %s", "超时")
+            after.error("失败")
+            logger_module._queue_listener.stop()
+            logger_module._queue_listener = None
+
+            # 每条日志只输出一次
+            with open(log_file, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "错误: 超时\n失败\n")
+
+
+if __name__ == "__main__":
+    unittest.main()